@@ -0,0 +1,22 @@
+"""
+gunicorn 설정 (운영용 다중 워커, Linux/macOS)
+- preload_app: 싱글톤(분석기/수집기 등)을 마스터에서 한 번만 로드한 뒤 fork -> 워커 간 메모리 공유(COW)
+  (백그라운드 스레드 풀은 LazyThreadPool로 워커에서 최초 사용 시 생성, 스크리너 프로세스 풀도 지연 생성)
+- UvicornWorker: uvicorn[standard] 설치 시 uvloop + httptools 자동 사용
+실행: gunicorn -c scripts/gunicorn_conf.py src.api.server:app
+"""
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))  # /analyze(AI 리포트 포함)는 수십 초 걸릴 수 있음
+keepalive = 5
+
+
+def post_fork(server, worker):
+    # 마스터에서 연 SQLite 커넥션을 워커가 물려받아 공유하지 않도록 풀만 비움 (워커별로 새로 연결)
+    from src.data.storage import get_storage
+    get_storage().engine.dispose(close=False)
@@ -0,0 +1,10 @@
+#!/usr/bin/env bash
+set -e
+
+# 운영용 API 서버 실행 (코어 수만큼 워커, 싱글톤 preload 후 fork)
+# 필요 패키지: pip install gunicorn "uvicorn[standard]"
+# 워커 간 캐시/레이트 리밋 공유가 필요하면 REDIS_URL 설정
+cd "$(dirname "$0")/.."
+
+export WEB_CONCURRENCY="${WEB_CONCURRENCY:-$(nproc)}"
+exec gunicorn -c scripts/gunicorn_conf.py src.api.server:app
@@ -5,6 +5,7 @@ AI 분석 모듈 - Hugging Face 연동
 import os
 import logging
 from typing import Dict, Any, Optional
+import yfinance as yf
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -325,8 +326,6 @@ def get_stock_events(ticker: str) -> Dict[str, Any]:
     """
     yfinance를 통해 주요 이벤트 일정 수집
     """
-    import yfinance as yf
-    
     events = {}
     
     try:
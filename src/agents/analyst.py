@@ -21,40 +21,19 @@ class TechnicalAnalyzer:
 
         delta = data['Close'].diff()
         
-        # 상승/하락분 분리
-        gain = delta.copy()
-        loss = delta.copy()
-        gain[gain < 0] = 0
-        loss[loss > 0] = 0
-        loss = abs(loss)
-        
-        # Wilder's Smoothing (alpha = 1/window)
+        # Wilder's Smoothing (alpha = 1/window), 상승/하락분은 clip으로 분리
         # adjust=False는 재귀적 정의를 따르기 위함
-        avg_gain = gain.ewm(alpha=1/window, min_periods=window, adjust=False).mean()
-        avg_loss = loss.ewm(alpha=1/window, min_periods=window, adjust=False).mean()
+        avg_gain = delta.clip(lower=0).ewm(alpha=1/window, min_periods=window, adjust=False).mean().to_numpy()
+        avg_loss = (-delta).clip(lower=0).ewm(alpha=1/window, min_periods=window, adjust=False).mean().to_numpy()
         
-        # 결과 계산
-        rsi = pd.Series(np.nan, index=data.index)
+        # 마스크별 대입 대신 배열 연산 한 번으로 계산
+        # 손실 없이 상승만 -> RS=inf -> 100.0 / 수익 없이 하락만 -> RS=0 -> 0.0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
         
-        # 1. 변동이 없는 구간 (Gain/Loss 모두 0) -> 50.0
-        no_move = (avg_gain == 0) & (avg_loss == 0)
-        rsi[no_move] = 50.0
-        
-        # 2. 손실 없이 상승만 한 구간 -> 100.0
-        always_up = (avg_gain > 0) & (avg_loss == 0)
-        rsi[always_up] = 100.0
-        
-        # 3. 수익 없이 하락만 한 구간 -> 0.0
-        always_down = (avg_gain == 0) & (avg_loss > 0)
-        rsi[always_down] = 0.0
-        
-        # 4. 일반적인 경우 (RS 계산)
-        normal = (avg_gain > 0) & (avg_loss > 0)
-        rs = avg_gain[normal] / avg_loss[normal]
-        rsi[normal] = 100.0 - (100.0 / (1.0 + rs))
-        
-        # 앞부분의 NaN을 50.0으로 채워 분석 품질 유지
-        return rsi.fillna(50.0)
+        # 변동이 없는 구간(0/0) 및 앞부분 NaN은 50.0으로 채워 분석 품질 유지
+        rsi[np.isnan(rsi)] = 50.0
+        return pd.Series(rsi, index=data.index)
 
     def calculate_macd(self, data: pd.DataFrame) -> pd.DataFrame:
         """MACD 계산"""
@@ -85,12 +64,15 @@ class TechnicalAnalyzer:
         recent = data.tail(120)
         levels = []
         
-        # 로컬 고점/저점 추출 (Window 5)
-        for i in range(5, len(recent)-5):
-            if recent['High'].iloc[i] == recent['High'].iloc[i-5:i+5].max():
-                levels.append(recent['High'].iloc[i])
-            if recent['Low'].iloc[i] == recent['Low'].iloc[i-5:i+5].min():
-                levels.append(recent['Low'].iloc[i])
+        # 로컬 고점/저점 추출 (Window 5): 행마다 iloc 슬라이스 대신 슬라이딩 윈도우로 한 번에 계산
+        # i번째 봉이 [i-5, i+5) 구간의 최고가/최저가와 같으면 레벨로 채택 (fmax/fmin은 NaN 무시)
+        high = recent['High'].to_numpy(dtype=np.float64)
+        low = recent['Low'].to_numpy(dtype=np.float64)
+        n = len(recent)  # 위에서 30 이상 보장
+        win_max = np.fmax.reduce(np.lib.stride_tricks.sliding_window_view(high, 10), axis=1)[:n - 10]
+        win_min = np.fmin.reduce(np.lib.stride_tricks.sliding_window_view(low, 10), axis=1)[:n - 10]
+        levels.extend(high[5:n - 5][high[5:n - 5] == win_max])
+        levels.extend(low[5:n - 5][low[5:n - 5] == win_min])
         
         # 레벨 클러스터링 (비슷한 가격대는 하나로 통합)
         levels.sort()
@@ -7,13 +7,15 @@
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import yfinance as yf
 
 from src.agents.analyst import StockAnalyst
 from src.agents.pattern_detector import AdvancedPatternDetector
-from src.data.collector import MarketDataCollector
+from src.data.collector import MarketDataCollector, to_datetime_index
+from src.utils.executors import LazyThreadPool
 
 logger = logging.getLogger(__name__)
 
@@ -52,10 +54,15 @@ class MultiTimeframeAnalyzer:
         }
     }
     
-    def __init__(self):
-        self.analyst = StockAnalyst()
+    def __init__(self, analyst: StockAnalyst = None, collector: MarketDataCollector = None,
+                 fetch_ohlcv: Optional[Callable[..., Optional[pd.DataFrame]]] = None):
+        self.analyst = analyst or StockAnalyst()
         self.pattern_detector = AdvancedPatternDetector()
-        self.collector = MarketDataCollector()
+        self.collector = collector or MarketDataCollector()
+        # OHLCV 수집 함수 (서버에서는 캐시 래퍼 주입, 기본은 collector.get_ohlcv)
+        self.fetch_ohlcv = fetch_ohlcv or self.collector.get_ohlcv
+        # 종목/지수 데이터 동시 수집용 스레드 풀 (시간 프레임 병렬 풀과 분리해 중첩 대기 교착 방지)
+        self._fetch_pool = LazyThreadPool(max_workers=8, thread_name_prefix="mtf-fetch")
     
     def analyze_all_timeframes(self, 
                                ticker: str,
@@ -86,9 +93,14 @@ class MultiTimeframeAnalyzer:
             "all_patterns": []
         }
         
-        # 각 시간 프레임별 분석
-        for tf_key in ["short", "medium", "long"]:
-            tf_result = self._analyze_timeframe(ticker, tf_key, index_ticker)
+        # 각 시간 프레임별 분석 (데이터 수집이 독립적이므로 병렬 실행)
+        tf_keys = ["short", "medium", "long"]
+        with ThreadPoolExecutor(max_workers=len(tf_keys)) as executor:
+            tf_results = list(executor.map(
+                lambda tf_key: self._analyze_timeframe(ticker, tf_key, index_ticker), tf_keys
+            ))
+        
+        for tf_key, tf_result in zip(tf_keys, tf_results):
             results[f"{tf_key}_term"] = tf_result
             
             # 패턴 수집
@@ -110,8 +122,9 @@ class MultiTimeframeAnalyzer:
         try:
             tf_config = self.TIMEFRAMES[timeframe]
             
-            # 데이터 수집
-            stock_data = self._fetch_data(
+            # 데이터 수집 (종목은 별도 스레드, 지수는 현재 스레드에서 동시에 수집)
+            stock_future = self._fetch_pool.submit(
+                self._fetch_data,
                 ticker, 
                 period=tf_config["data_period"],
                 interval=tf_config["data_interval"]
@@ -122,6 +135,7 @@ class MultiTimeframeAnalyzer:
                 period=tf_config["data_period"],
                 interval=tf_config["data_interval"]
             )
+            stock_data = stock_future.result()
             
             if stock_data is None or stock_data.empty:
                 return self._empty_result(timeframe, "데이터 수집 실패")
@@ -699,12 +713,12 @@ class MultiTimeframeAnalyzer:
             # interval 정규화 (yf와 collector 간 차이 조정)
             if interval == "1h": interval = "60m"
             
-            df = self.collector.get_ohlcv(ticker, period=period, interval=interval)
+            df = self.fetch_ohlcv(ticker, period=period, interval=interval)
             
             # 인덱스를 Datetime으로 설정 (패턴 감정 등에서 필요)
             if df is not None and not df.empty:
                 if 'Date' in df.columns:
-                    df.set_index(pd.to_datetime(df['Date']), inplace=True)
+                    df.set_index(to_datetime_index(df['Date']), inplace=True)
                 return df
             return None
         except Exception as e:
@@ -7,6 +7,7 @@ import numpy as np
 import logging
 from typing import List, Dict, Any, Optional
 from collections import Counter
+import yfinance as yf
 
 from src.agents.analyst import StockAnalyst
 from src.agents.profiler import InvestorProfiler
@@ -27,7 +28,6 @@ class PortfolioAnalyzer:
     def _get_exchange_rate(self) -> float:
         """실시간 USD/KRW 환율 가져오기 (yfinance)"""
         try:
-            import yfinance as yf
             ticker = yf.Ticker("USDKRW=X")
             data = ticker.history(period="1d")
             if not data.empty:
@@ -133,8 +133,6 @@ class PortfolioAnalyzer:
     def _analyze_holding(self, ticker: str, index_ticker: str) -> Optional[Dict[str, Any]]:
         """개별 종목 분석"""
         try:
-            import yfinance as yf
-            
             # 데이터 수집
             stock = yf.Ticker(ticker)
             daily_df = stock.history(period="1y")
@@ -170,7 +168,6 @@ class PortfolioAnalyzer:
             return {"matrix": {}, "avg_correlation": 0, "beta": 1.0, "sharpe": 0}
             
         try:
-            import yfinance as yf
             # 시장 지수(^GSPC)를 포함하여 최근 1년 데이터 수집
             all_tickers = list(set(tickers + ["^GSPC"]))
             data = yf.download(all_tickers, period="1y")['Close']
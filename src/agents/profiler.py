@@ -2,11 +2,20 @@
 투자자 프로파일링 시스템
 사용자의 투자 성향을 분석하여 맞춤형 투자 스타일 분류
 """
+import copy
 import json
 import os
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+
+@lru_cache(maxsize=8)
+def _load_profile_cached(path: str, mtime: float) -> Dict[str, Any]:
+    """프로파일 JSON 파싱 결과 캐시 (mtime이 키에 포함되어 파일 수정 시 자동 무효화)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 class InvestorProfiler:
     """
     투자자 성향 분석 및 프로파일 관리
@@ -134,13 +143,14 @@ class InvestorProfiler:
         # 최고 점수 스타일 선택
         style = max(score, key=score.get)
         
-        # 프로파일 저장
+        # 프로파일 저장 (생성/수정 시각은 동일한 시각 1회 조회)
+        now_iso = datetime.now().isoformat()
         self.profile = {
             "style": style,
             "style_name": self.STYLES[style]["name"],
             "survey_answers": answers,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
         self._save_profile()
         
@@ -167,8 +177,9 @@ class InvestorProfiler:
         """저장된 프로파일 로드"""
         if os.path.exists(self.profile_path):
             try:
-                with open(self.profile_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                mtime = os.path.getmtime(self.profile_path)
+                # 캐시된 객체가 인스턴스 간에 공유되지 않도록 복사본 반환
+                return copy.deepcopy(_load_profile_cached(self.profile_path, mtime))
             except Exception as e:
                 print(f"프로파일 로드 실패: {e}")
         return None
@@ -4,38 +4,146 @@ AI 추천 종목 스크리너 - 인베스팅닷컴 스타일
 """
 import pandas as pd
 import numpy as np
+import heapq
 import logging
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+import os
+import threading
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Callable
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 import yfinance as yf
 
 from src.agents.analyst import StockAnalyst
+from src.utils.cache import TTLCache
+from src.utils.http_session import get_session
 
 logger = logging.getLogger(__name__)
 
+# 시장별 주요 종목 (모듈 로드 시 한 번만 생성되는 불변 상수)
+_US_TICKERS = (
+    "AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "TSLA", "BRK-B", "JPM", "V",
+    "JNJ", "WMT", "PG", "MA", "HD", "DIS", "PYPL", "NFLX", "ADBE", "CRM",
+    "INTC", "CSCO", "PFE", "KO", "PEP", "ABT", "MRK", "TMO", "ABBV", "COST",
+    "AVGO", "ACN", "NKE", "TXN", "LIN", "DHR", "UNP", "NEE", "ORCL", "PM",
+    "HON", "UPS", "RTX", "QCOM", "BMY", "LMT", "LOW", "AMD", "BA", "IBM"
+)
+
+_KR_TICKERS = (
+    "005930.KS", "000660.KS", "035420.KS", "035720.KS", "051910.KS",
+    "006400.KS", "005380.KS", "068270.KS", "207940.KS", "005490.KS",
+    "000270.KS", "105560.KS", "055550.KS", "096770.KS", "012330.KS",
+    "028260.KS", "066570.KS", "003550.KS", "017670.KS", "034730.KS",
+    "009150.KS", "032830.KS", "018260.KS", "003670.KS", "015760.KS",
+    "086520.KQ", "247540.KQ", "373220.KS", "000100.KS", "011170.KS",
+    "000810.KS", "033780.KS", "010950.KS", "086790.KS", "005935.KS",
+    "036570.KS", "066970.KS", "034220.KS", "010130.KS", "001500.KS",
+    "004020.KS", "030200.KS", "267250.KS", "011070.KS", "090430.KS"
+)
+
+SP500_URL = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
+
+
+@lru_cache(maxsize=1)
+def _fetch_sp500_symbols() -> Tuple[str, ...]:
+    """위키백과 구성종목 표에서 심볼 컬럼만 XPath로 추출 (프로세스당 1회)"""
+    import lxml.html
+    
+    res = get_session().get(SP500_URL, timeout=10)
+    res.raise_for_status()
+    tree = lxml.html.fromstring(res.content)
+    symbols = tree.xpath('//table[@id="constituents"]/tbody/tr/td[1]/a/text()')
+    if not symbols:
+        raise ValueError("S&P 500 구성종목 표를 찾을 수 없습니다")
+    # yfinance 표기법으로 변환 (BRK.B -> BRK-B)
+    return tuple(sym.strip().replace('.', '-') for sym in symbols)
+
+
+# 분석에 필요한 최소 일봉 수 및 부족 종목 재시도 억제 시간
+MIN_HISTORY_BARS = 50
+SKIP_TTL_SECONDS = 3600
+_skip_cache = TTLCache(maxsize=4096, ttl=SKIP_TTL_SECONDS)
+
+# 프로세스 풀 워커 전역 상태 (initializer에서 워커당 한 번만 구성)
+_worker_screener: Optional["StockScreener"] = None
+
+# 프로세스 풀은 분석기 클래스별로 최초 사용 시 한 번만 생성해 재사용 (서버/CLI/UI 공통)
+# spawn 컨텍스트: 스레드 풀/DB 기록 스레드가 돌고 있는 서버 프로세스를 fork하지 않음 (락 상태 복제로 인한 교착 방지)
+SCREENER_MAX_WORKERS = max(1, int(os.getenv("SCREENER_MAX_WORKERS", os.cpu_count() or 1)))
+_process_pools: Dict[type, ProcessPoolExecutor] = {}
+_process_pool_lock = threading.Lock()
+
+
+def _init_worker(analyst_cls: type):
+    """워커 프로세스 초기화: 주입된 분석기와 같은 클래스로 워커당 한 번만 생성"""
+    global _worker_screener
+    _worker_screener = StockScreener(analyst_cls())
+
+
+def _analyze_ticker_worker(ticker: str, daily_df: Optional[pd.DataFrame],
+                           index_df: Optional[pd.DataFrame], investor_style: str) -> Optional[Dict[str, Any]]:
+    """프로세스 풀에서 실행되는 단일 종목 분석 (picklable 모듈 함수)"""
+    return _worker_screener._analyze_single_stock(ticker, daily_df, index_df, investor_style)
+
+
+def _get_process_pool(analyst_cls: type = StockAnalyst) -> ProcessPoolExecutor:
+    """분석기 클래스별 공유 프로세스 풀 반환 (없거나 워커 비정상 종료로 깨졌으면 새로 생성)"""
+    with _process_pool_lock:
+        pool = _process_pools.get(analyst_cls)
+        if pool is None:
+            pool = _process_pools[analyst_cls] = ProcessPoolExecutor(
+                max_workers=SCREENER_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(analyst_cls,)
+            )
+        return pool
+
+
+def _reset_process_pool(analyst_cls: Optional[type] = None):
+    """프로세스 풀 폐기 (analyst_cls가 없으면 전체, 다음 사용 시 재생성)"""
+    with _process_pool_lock:
+        keys = list(_process_pools) if analyst_cls is None else [analyst_cls]
+        for key in keys:
+            pool = _process_pools.pop(key, None)
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_process_pools():
+    """공유 프로세스 풀 전체 종료 (서버/앱 종료 시 호출)"""
+    _reset_process_pool()
+
+
 class StockScreener:
     """
     종합 종목 스크리너 - 투자 스타일 기반 추천
     """
     
+    # 투자 스타일별 가중치 함수 (평탄화된 관점별 점수 입력)
+    STYLE_FILTERS: Dict[str, Callable[[Dict[str, float]], float]] = {
+        # 공격적 성장: 기술적 지표 + 수급/에너지
+        "aggressive_growth": lambda s: s['tech'] * 0.6 + s['vol'] * 0.4,
+        # 배당: 펀더멘털 + 심리 안정성
+        "dividend": lambda s: s['fund'] * 0.7 + s['psych'] * 0.3,
+        # 가치투자: 펀더멘털 최우선
+        "value": lambda s: s['fund'] * 0.8 + s['macro'] * 0.2,
+        # 모멘텀: 기술적 지세 + 수급
+        "momentum": lambda s: s['tech'] * 0.7 + s['vol'] * 0.3,
+        "balanced": lambda s: 100,
+    }
+    
     def __init__(self, analyst: StockAnalyst = None):
         self.analyst = analyst or StockAnalyst()
     
-    def _fetch_data(self, ticker: str, period: str = "1y", interval: str = "1d") -> Optional[pd.DataFrame]:
-        """yfinance를 통한 주가 데이터 수집"""
-        try:
-            stock = yf.Ticker(ticker)
-            df = stock.history(period=period, interval=interval)
-            return df if not df.empty else None
-        except Exception as e:
-            logger.warning(f"{ticker} 데이터 수집 실패: {e}")
-            return None
-        
     def screen_stocks(self, 
                      tickers: List[str], 
                      investor_style: str = "balanced",
                      top_n: int = 10,
-                     index_ticker: str = "^GSPC") -> List[Dict[str, Any]]:
+                     index_ticker: str = "^GSPC",
+                     use_processes: bool = True) -> List[Dict[str, Any]]:
         """
         종목 풀에서 투자 스타일에 맞는 상위 N개 종목 추천
         
@@ -44,49 +152,116 @@ class StockScreener:
             investor_style: 투자 스타일 ("aggressive_growth", "dividend", "value", "momentum", "balanced")
             top_n: 추천할 종목 개수
             index_ticker: 비교 지수 (기본값: S&P 500)
+            use_processes: True면 프로세스 풀로 지표 계산을 병렬화 (GIL 회피).
+                워커는 주입된 analyst의 클래스를 인자 없이 생성해 사용하므로
+                인스턴스에만 적용한 상태는 전달되지 않음 (필요하면 False로 스레드 경로 사용)
             
         Returns:
             추천 종목 리스트 (점수 높은 순)
         """
         logger.info(f"스크리닝 시작: {len(tickers)}개 종목, 스타일={investor_style}")
         
-        # 지수 데이터 미리 로드
-        index_df = self._fetch_data(index_ticker, period="1y")
+        # 최근 데이터 부족으로 판정된 종목은 재요청하지 않음 (네거티브 캐시)
+        candidates = [t for t in tickers if t not in _skip_cache]
+        if not candidates:
+            logger.info("스크리닝 완료: 분석 가능한 종목 없음")
+            return []
+        
+        # 종목 + 지수 데이터를 한 번의 배치 요청으로 미리 로드
+        frames, index_df = self._prefetch_daily(candidates, index_ticker)
         
-        # 병렬 처리로 각 종목 분석
-        results = []
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {
-                executor.submit(self._analyze_single_stock, ticker, index_df, investor_style): ticker 
-                for ticker in tickers
-            }
-            
-            for future in as_completed(futures):
-                ticker = futures[future]
-                try:
-                    result = future.result()
-                    if result:
-                        results.append(result)
-                        logger.info(f"✓ {ticker}: 점수 {result['score']}")
-                except Exception as e:
-                    logger.warning(f"✗ {ticker} 분석 실패: {e}")
+        # 응답은 왔지만 일봉이 부족한 종목만 기록 (누락 종목은 일시 오류일 수 있으므로 다음 호출에서 재시도)
+        for t in candidates:
+            if t in frames and len(frames[t]) < MIN_HISTORY_BARS:
+                _skip_cache.set(t, True)
+        tickers = [t for t in candidates if t in frames and len(frames[t]) >= MIN_HISTORY_BARS]
+        if not tickers:
+            logger.info("스크리닝 완료: 분석 가능한 종목 없음")
+            return []
+        
+        # 병렬 처리로 각 종목 분석 (네트워크 I/O가 없으므로 CPU 바운드)
+        results: List[Dict[str, Any]] = []
+        done: set = set()
+        if use_processes:
+            analyst_cls = type(self.analyst)
+            try:
+                pool = _get_process_pool(analyst_cls)
+                futures = {
+                    pool.submit(_analyze_ticker_worker, ticker, frames.get(ticker), index_df, investor_style): ticker
+                    for ticker in tickers
+                }
+                self._collect_results(futures, results, done)
+            except BrokenProcessPool as e:
+                logger.warning(f"프로세스 풀 오류, 남은 {len(tickers) - len(done)}개 종목은 스레드로 분석: {e}")
+                _reset_process_pool(analyst_cls)
         
-        # 점수 기준 정렬 및 상위 N개 선택
-        results.sort(key=lambda x: x['score'], reverse=True)
-        top_picks = results[:top_n]
+        # 스레드 경로 (use_processes=False 또는 프로세스 풀이 깨진 뒤 남은 종목)
+        remaining = [t for t in tickers if t not in done]
+        if remaining:
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                futures = {
+                    executor.submit(self._analyze_single_stock, ticker, frames.get(ticker), index_df, investor_style): ticker 
+                    for ticker in remaining
+                }
+                self._collect_results(futures, results, done)
+        
+        # 점수 기준 상위 N개 선택 (전체 정렬 대신 제한된 힙 스캔)
+        top_picks = heapq.nlargest(top_n, results, key=lambda x: x['score'])
         
         logger.info(f"스크리닝 완료: 상위 {len(top_picks)}개 종목 선정")
         return top_picks
     
+    @staticmethod
+    def _collect_results(futures: Dict[Any, str], results: List[Dict[str, Any]], done: set):
+        """완료 순서대로 종목 분석 결과 수집 (종목별 실패는 로그만 남기고, 처리된 종목은 done에 기록)"""
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                result = future.result()
+                if result:
+                    results.append(result)
+                    logger.info(f"✓ {ticker}: 점수 {result['score']}")
+            except BrokenProcessPool:
+                raise
+            except Exception as e:
+                logger.warning(f"✗ {ticker} 분석 실패: {e}")
+            done.add(ticker)
+    
+    def _prefetch_daily(self, 
+                        tickers: List[str], 
+                        index_ticker: str,
+                        period: str = "1y") -> Tuple[Dict[str, pd.DataFrame], Optional[pd.DataFrame]]:
+        """yf.download 한 번으로 종목별 일봉 + 지수 데이터를 일괄 수집"""
+        symbols = list(dict.fromkeys(list(tickers) + [index_ticker]))
+        try:
+            panel = yf.download(symbols, period=period, group_by="ticker",
+                                threads=True, progress=False)
+        except Exception as e:
+            logger.warning(f"배치 데이터 수집 실패: {e}")
+            return {}, None
+        
+        if panel is None or panel.empty:
+            return {}, None
+        
+        available = set(panel.columns.get_level_values(0))
+        frames = {}
+        for symbol in symbols:
+            if symbol not in available:
+                continue
+            df = panel[symbol].dropna(how="all")
+            if not df.empty:
+                frames[symbol] = df
+        
+        return frames, frames.get(index_ticker)
+    
     def _analyze_single_stock(self, 
                              ticker: str, 
-                             index_df: pd.DataFrame,
+                             daily_df: Optional[pd.DataFrame],
+                             index_df: Optional[pd.DataFrame],
                              investor_style: str) -> Optional[Dict[str, Any]]:
-        """단일 종목 분석 및 스타일 적합도 평가"""
+        """단일 종목 분석 및 스타일 적합도 평가 (데이터는 호출자가 미리 수집)"""
         try:
-            # 데이터 수집
-            daily_df = self._fetch_data(ticker, period="1y")
-            if daily_df is None or len(daily_df) < 50:
+            if daily_df is None or len(daily_df) < MIN_HISTORY_BARS:
                 return None
             
             # 종합 분석 수행
@@ -99,8 +274,11 @@ class StockScreener:
                 sentiment_data=None
             )
             
+            # 관점별 점수를 한 번만 추출해 평탄화
+            scores = self._extract_scores(analysis)
+            
             # 투자 스타일 필터링 적용
-            style_score = self._apply_style_filter(ticker, daily_df, analysis, investor_style)
+            style_score = self._apply_style_filter(ticker, scores, investor_style)
             
             # 최종 점수 = 기본 점수 * 스타일 적합도
             final_score = analysis['final_score'] * (style_score / 100)
@@ -109,7 +287,7 @@ class StockScreener:
                 "ticker": ticker,
                 "score": round(final_score, 1),
                 "signal": analysis['signal'],
-                "reason": self._generate_reason(analysis, investor_style),
+                "reason": self._generate_reason(scores, investor_style),
                 "current_price": daily_df['Close'].iloc[-1],
                 "change_1d": ((daily_df['Close'].iloc[-1] - daily_df['Close'].iloc[-2]) / daily_df['Close'].iloc[-2] * 100) if len(daily_df) >= 2 else 0
             }
@@ -117,136 +295,123 @@ class StockScreener:
             logger.error(f"{ticker} 분석 중 오류: {e}")
             return None
     
-    def _apply_style_filter(self, ticker: str, df: pd.DataFrame, analysis: Dict, style: str) -> float:
-        """투자 스타일별 가중치 적용 (분석 결과 구조에 맞춰 수정)"""
-        if style == "aggressive_growth":
-            # 공격적 성장: 기술적 지표 + 수급/에너지
-            tech = analysis.get('daily_analysis', {}).get('score', 50)
-            vol = analysis.get('volume_price', {}).get('score', 50)
-            return (tech * 0.6 + vol * 0.4)
-        
-        elif style == "dividend":
-            # 배당: 펀더멘털 + 심리 안정성
-            fund = analysis.get('fundamental', {}).get('score', 50)
-            psych = analysis.get('psychology', {}).get('score', 50)
-            return (fund * 0.7 + psych * 0.3)
-        
-        elif style == "value":
-            # 가치투자: 펀더멘털 최우선
-            fund = analysis.get('fundamental', {}).get('score', 50)
-            macro = analysis.get('macro', {}).get('score', 50)
-            return (fund * 0.8 + macro * 0.2)
-        
-        elif style == "momentum":
-            # 모멘텀: 기술적 지세 + 수급
-            tech = analysis.get('daily_analysis', {}).get('score', 50)
-            vol = analysis.get('volume_price', {}).get('score', 50)
-            return (tech * 0.7 + vol * 0.3)
+    @staticmethod
+    def _extract_scores(analysis: Dict) -> Dict[str, float]:
+        """분석 결과의 중첩 구조에서 관점별 점수를 평탄한 dict로 추출"""
+        def score_of(key: str) -> float:
+            return (analysis.get(key) or {}).get('score', 50)
         
-        else:  # balanced
-            return 100
+        return {
+            'tech': score_of('daily_analysis'),
+            'fund': score_of('fundamental'),
+            'vol': score_of('volume_price'),
+            'psych': score_of('psychology'),
+            'macro': score_of('macro'),
+            'final': analysis.get('final_score', 0)
+        }
     
-    def _generate_reason(self, analysis: Dict, style: str) -> str:
+    def _apply_style_filter(self, ticker: str, scores: Dict[str, float], style: str) -> float:
+        """투자 스타일별 가중치 적용 (평탄화된 관점별 점수 기준)"""
+        return self.STYLE_FILTERS.get(style, self.STYLE_FILTERS["balanced"])(scores)
+    
+    def _generate_reason(self, scores: Dict[str, float], style: str) -> str:
         """스타일별 특화된 추천 이유 생성"""
-        tech_score = analysis.get('daily_analysis', {}).get('score', 50)
-        fund_score = analysis.get('fundamental', {}).get('score', 50)
-        vol_score = analysis.get('volume_price', {}).get('score', 50)
-        psych_score = analysis.get('psychology', {}).get('score', 50)
-        
         if style == "aggressive_growth":
-            return f"강한 모멘텀({tech_score}점)과 에너지 유입({vol_score}점) 포착"
+            return f"강한 모멘텀({scores['tech']}점)과 에너지 유입({scores['vol']}점) 포착"
         elif style == "dividend":
-            return f"안정적 펀더멘털({fund_score}점) 및 심리 저점 형성"
+            return f"안정적 펀더멘털({scores['fund']}점) 및 심리 저점 형성"
         elif style == "value":
-            return f"저평가 매력({fund_score}점) 및 안전 마진 확보"
+            return f"저평가 매력({scores['fund']}점) 및 안전 마진 확보"
         elif style == "momentum":
-            return f"추세 추종 적합. 기술적 완성도 {tech_score}점 달성"
+            return f"추세 추종 적합. 기술적 완성도 {scores['tech']}점 달성"
         else:
-            return f"종합 점수 {analysis.get('final_score', 0)}점으로 균형 잡힌 성장세"
+            return f"종합 점수 {scores['final']}점으로 균형 잡힌 성장세"
 
-    def get_market_tickers(self, market: str = "US", limit: int = 50) -> List[str]:
-        """시장별 주요 종목 리스트 반환"""
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def get_market_tickers(market: str = "US", limit: int = 50) -> Tuple[str, ...]:
+        """시장별 주요 종목 리스트 반환 (불변 튜플, (market, limit) 단위 캐시)"""
         if market == "US":
-            return [
-                "AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "TSLA", "BRK-B", "JPM", "V",
-                "JNJ", "WMT", "PG", "MA", "HD", "DIS", "PYPL", "NFLX", "ADBE", "CRM",
-                "INTC", "CSCO", "PFE", "KO", "PEP", "ABT", "MRK", "TMO", "ABBV", "COST",
-                "AVGO", "ACN", "NKE", "TXN", "LIN", "DHR", "UNP", "NEE", "ORCL", "PM",
-                "HON", "UPS", "RTX", "QCOM", "BMY", "LMT", "LOW", "AMD", "BA", "IBM"
-            ][:limit]
+            return _US_TICKERS[:limit]
         elif market == "KR":
-            return [
-                "005930.KS", "000660.KS", "035420.KS", "035720.KS", "051910.KS",
-                "006400.KS", "005380.KS", "068270.KS", "207940.KS", "005490.KS",
-                "000270.KS", "105560.KS", "055550.KS", "096770.KS", "012330.KS",
-                "028260.KS", "066570.KS", "003550.KS", "017670.KS", "034730.KS",
-                "009150.KS", "032830.KS", "018260.KS", "003670.KS", "015760.KS",
-                "086520.KQ", "247540.KQ", "373220.KS", "000100.KS", "011170.KS",
-                "000810.KS", "033780.KS", "010950.KS", "086790.KS", "005935.KS",
-                "036570.KS", "066970.KS", "034220.KS", "010130.KS", "001500.KS",
-                "004020.KS", "030200.KS", "267250.KS", "011070.KS", "090430.KS"
-            ][:limit]
+            return _KR_TICKERS[:limit]
         else:
-            return []
+            return ()
+    
+    def get_sp500_tickers(self) -> Tuple[str, ...]:
+        """S&P 500 전체 구성종목 반환 (실패 시 내장 미국 종목 풀로 대체)"""
+        try:
+            return _fetch_sp500_symbols()
+        except Exception as e:
+            logger.warning(f"S&P 500 종목 로드 실패, 기본 목록 사용: {e}")
+            return _US_TICKERS
     
-    def get_recommendations(self, style: str = "balanced", market: str = "US", limit: int = 10) -> Dict[str, Any]:
-        """AI 추천 종목 조회"""
+    def get_recommendations(self, style: str = "balanced", market: str = "US", limit: int = 10,
+                            use_processes: bool = True) -> Dict[str, Any]:
+        """AI 추천 종목 조회 (use_processes는 screen_stocks로 전달)"""
         tickers = self.get_market_tickers(market, limit=50)
-        recommendations = self.screen_stocks(tickers, investor_style=style, top_n=limit)
+        recommendations = self.screen_stocks(tickers, investor_style=style, top_n=limit,
+                                             use_processes=use_processes)
         
         return {
             "style": style,
             "market": market,
             "recommendations": recommendations,
-            "timestamp": pd.Timestamp.now().isoformat()
+            "timestamp": datetime.now().isoformat()
         }
     
     def get_top_movers(self, market: str = "US") -> Dict[str, Any]:
         """급등/급락 종목 조회"""
         tickers = self.get_market_tickers(market, limit=30)
         
-        gainers = []
-        losers = []
-        
-        # 병렬로 가격 변동 확인
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {executor.submit(self._get_stock_change, ticker): ticker for ticker in tickers}
-            for future in as_completed(futures):
-                res = future.result()
-                if res:
-                    if res['change'] > 0:
-                        gainers.append(res)
-                    else:
-                        losers.append(res)
+        # yf.download 1회 호출로 전 종목 변동률 조회 (v7 quote 엔드포인트는 cookie/crumb 없이 401)
+        changes = self._fetch_history_changes(tickers)
         
-        # 정렬
-        gainers.sort(key=lambda x: x['change'], reverse=True)
-        losers.sort(key=lambda x: x['change'])
+        gainers = [c for c in changes if c['change'] > 0]
+        losers = [c for c in changes if c['change'] <= 0]
         
         return {
             "market": market,
-            "gainers": gainers[:5],
-            "losers": losers[:5]
+            "gainers": heapq.nlargest(5, gainers, key=lambda x: x['change']),
+            "losers": heapq.nsmallest(5, losers, key=lambda x: x['change'])
         }
 
-    def _get_stock_change(self, ticker: str) -> Optional[Dict[str, Any]]:
-        """단일 종목의 당일 변동률 조회"""
+    def _fetch_history_changes(self, tickers: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """일괄 다운로드한 5일 종가 행렬로 변동률을 벡터 연산"""
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period="5d")
-            if len(hist) < 2: return None
-            
-            prev_close = hist['Close'].iloc[-2]
-            current_close = hist['Close'].iloc[-1]
-            change_pct = ((current_close - prev_close) / prev_close) * 100
-            
-            return {
-                "ticker": ticker,
-                "price": round(current_close, 2),
-                "change": round(change_pct, 2)
-            }
-        except:
-            return None
+            panel = yf.download(list(tickers), period="5d", group_by="ticker",
+                                threads=True, progress=False)
+        except Exception as e:
+            logger.warning(f"일괄 가격 다운로드 실패: {e}")
+            return []
+        
+        if panel is None or panel.empty:
+            return []
+        
+        # 종목별 마지막 두 개의 유효 종가로 (N, 2) 행렬 구성
+        available = set(panel.columns.get_level_values(0))
+        symbols, closes = [], []
+        for ticker in tickers:
+            if ticker not in available:
+                continue
+            last_two = panel[ticker]['Close'].dropna().values[-2:]
+            if len(last_two) == 2:
+                symbols.append(ticker)
+                closes.append(last_two)
+        
+        if not closes:
+            return []
+        
+        closes = np.vstack(closes).astype(float)
+        change_pct = (closes[:, 1] - closes[:, 0]) / closes[:, 0] * 100
+        prices = np.round(closes[:, 1], 2)
+        change_pct = np.round(change_pct, 2)
+        
+        return [
+            {"ticker": t, "price": float(p), "change": float(c)}
+            for t, p, c in zip(symbols, prices, change_pct)
+            if np.isfinite(c)
+        ]
 
 # 사용 예시
 if __name__ == "__main__":
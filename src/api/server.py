@@ -1,76 +1,149 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, ConfigDict
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
 from typing import Optional, Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_left
+from operator import itemgetter
+from types import MappingProxyType
+from urllib.parse import urlsplit, parse_qsl
+import asyncio
 import logging
 import pandas as pd
-import json
+import numpy as np
 import os
-from datetime import datetime
+import platform
+import re
+import secrets
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+import yfinance as yf
 
 # 프로젝트 모듈
-from src.data.collector import MarketDataCollector
+from src.data.collector import MarketDataCollector, to_datetime_index
 from src.data.storage import get_storage
 from src.data.parser import FinancialParser
-from src.agents.analyst import StockAnalyst
+from src.agents.analyst import StockAnalyst, TechnicalAnalyzer
+from src.agents.multi_timeframe import MultiTimeframeAnalyzer
 from src.agents.ai_analyzer import AIAnalyzer, get_stock_events
 from src.agents.chat_assistant import ChatAssistant
 from src.agents.event_calendar import EventCalendar
 from src.agents.portfolio_analyzer import PortfolioAnalyzer
-from src.agents.screener import StockScreener
-from src.utils.serializer import safe_serialize
+from src.agents.screener import StockScreener, shutdown_process_pools
+from src.utils.serializer import dumps as json_dumps
+from src.utils.cache import TTLCache
+from src.utils.advanced_indicators import AdvancedIndicators
+from src.utils.dictionary import INDICATOR_DESCRIPTIONS, get_explanation
 
 # 로깅
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 - pandas/numpy 값과 NaN을 재귀 전처리 없이 직렬화"""
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
 app = FastAPI(
     title="Trading Assistant API v2.0",
     description="AI-Powered Trading Analysis Server - Web, Mobile, Extension Ready",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=FastJSONResponse
 )
 
 # CORS (Production Security - No Wildcards)
-origins = [
-    "http://localhost:5173",  # Vite Dev Server
-    "http://127.0.0.1:5173",
-    "http://localhost:3000",
-    "chrome-extension://*",   # Extension Support (Restrict ID in prod)
-]
+# 로컬 개발 서버(Vite 5173, 3000 등) + 크롬 확장(32자 a-p ID)만 허용하는 정규식 (한 번만 컴파일됨)
+CORS_ORIGIN_REGEX = r"^(https?://(localhost|127\.0\.0\.1)(:\d+)?|chrome-extension://[a-p]{32})$"
+# 배포 시 CORS_ALLOWED_ORIGINS="chrome-extension://<확장ID>,https://..." 로 고정하면 정규식 매칭 없이 목록 비교만 수행
+CORS_ALLOWED_ORIGINS = [o.strip() for o in os.getenv("CORS_ALLOWED_ORIGINS", "").split(",") if o.strip()]
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,
+    allow_origins=CORS_ALLOWED_ORIGINS,
+    allow_origin_regex=None if CORS_ALLOWED_ORIGINS else CORS_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS"], # Limit Methods
     allow_headers=["Content-Type", "Authorization"], # Limit Headers
+    max_age=3600, # 브라우저가 preflight 결과를 1시간 캐시 → 매 호출마다 OPTIONS 왕복 생략
 )
 
 # === Rate Limiting (DoS Protection) ===
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from limits import parse as limits_parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter
 
-limiter = Limiter(key_func=get_remote_address, default_limits=["60/minute"])
+# REDIS_URL 설정 시 요청 카운터를 Redis에 저장 -> uvicorn --workers N 에서도 제한이 워커 간 공유됨
+REDIS_URL = os.getenv("REDIS_URL")
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=REDIS_URL or "memory://",
+    default_limits=["60/minute"]
+)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# /analyze, /history 요청 한도: 단건 엔드포인트와 /api/batch 하위 요청이 같은 카운터를 차감
+# (배치는 한 요청이 여러 하위 작업을 실행하므로 데코레이터 대신 limits API로 하위 요청 수만큼 직접 차감)
+ANALYZE_RATE_LIMIT = "20/minute"
+HISTORY_RATE_LIMIT = "60/minute"
+_RATE_LIMITS = {"analyze": limits_parse(ANALYZE_RATE_LIMIT), "history": limits_parse(HISTORY_RATE_LIMIT)}
+_rate_limit_storage = storage_from_string(REDIS_URL or "memory://")
+_rate_limit_strategy = FixedWindowRateLimiter(_rate_limit_storage)
+
+def _charge_rate_limits(request: Request, costs: Dict[str, int]):
+    """
+    {스코프: 차감 수}를 클라이언트 IP 기준으로 차감 (하나라도 초과하면 아무것도 차감하지 않고 429)
+    """
+    key = get_remote_address(request)
+    charges = [(scope, _RATE_LIMITS[scope], cost) for scope, cost in costs.items() if cost > 0]
+    for scope, item, cost in charges:
+        if not _rate_limit_strategy.test(item, scope, key, cost=cost):
+            raise HTTPException(status_code=429, detail=f"Rate limit exceeded: {item}")
+    for scope, item, cost in charges:
+        if not _rate_limit_strategy.hit(item, scope, key, cost=cost):
+            raise HTTPException(status_code=429, detail=f"Rate limit exceeded: {item}")
+
+def analyze_rate_limit(request: Request):
+    """/analyze 요청당 1회 차감 (Depends)"""
+    _charge_rate_limits(request, {"analyze": 1})
+
+def history_rate_limit(request: Request):
+    """/history 요청당 1회 차감 (Depends)"""
+    _charge_rate_limits(request, {"history": 1})
+
+# === Admin (캐시 무효화 등 상태 변경 엔드포인트) ===
+# ADMIN_TOKEN 미설정 시 관리용 엔드포인트는 항상 403 (비활성화)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """X-Admin-Token 헤더가 ADMIN_TOKEN과 일치해야 통과 (상수 시간 비교)"""
+    if not ADMIN_TOKEN or not x_admin_token or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
 # === Input Validation ===
-import re
+# Alphanumeric + . for KRX tickers + ^ for indices + = for currencies
+_TICKER_RE = re.compile(r"^[A-Za-z0-9.^=]+$")
+_HANGUL_RE = re.compile(r"[가-힣]")
+# 이미 규격에 맞는 티커 (AAPL, BRK.B, ^GSPC, GC=F 등) / 6자리 한국 종목코드
+_US_TICKER_RE = re.compile(r"^\^?[A-Z][A-Z0-9.\-=]{0,5}$")
+_KR_CODE_RE = re.compile(r"^\d{6}$")
+
 def validate_ticker(ticker: str):
     """Sanitize and validate ticker input"""
     if not ticker or len(ticker) > 20:
         raise HTTPException(status_code=400, detail="Invalid ticker length")
-    # Alphanumeric + . for KRX tickers + ^ for indices + = for currencies
-    if not re.match(r"^[A-Za-z0-9\.\^\=]+$", ticker):
+    if not _TICKER_RE.match(ticker):
         raise HTTPException(status_code=400, detail="Invalid ticker format")
     return ticker.upper()
 
 # === Global Exception Handler ===
-from fastapi import Request
-from fastapi.responses import JSONResponse
-
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     logger.error(f"Global Error: {exc} Path: {request.url.path}")
@@ -80,183 +153,318 @@ async def global_exception_handler(request: Request, exc: Exception):
         content={"detail": "Internal Server Error", "error_id": datetime.now().timestamp()},
     )
 
+# 이벤트 루프를 막지 않도록 블로킹 I/O를 위임할 스레드 수
+IO_THREAD_POOL_SIZE = 32
+
 # === 전역 인스턴스 (싱글톤) ===
 storage = get_storage()
 collector = MarketDataCollector(use_db=True)
 parser = FinancialParser(use_db=True)
 analyst = StockAnalyst()
+technical_analyzer: TechnicalAnalyzer = analyst.tech  # 상태 없는 분석기 - StockAnalyst 인스턴스 공유
 ai_analyzer = AIAnalyzer()
 
 # 신규 기능 인스턴스
 chat_assistant = ChatAssistant(gemini_api_key=os.getenv("GEMINI_API_KEY"))
 event_calendar = EventCalendar()
 portfolio_analyzer = PortfolioAnalyzer()
-screener = StockScreener()
+screener = StockScreener(analyst)
+
+# OHLCV 단기 캐시: /analyze 직후 /history, 멀티 타임프레임 등 같은 봉 데이터 재요청 시 재수집 생략
+OHLCV_CACHE_TTL = 60
+_ohlcv_cache = TTLCache(maxsize=512, ttl=OHLCV_CACHE_TTL)
+
+def get_ohlcv_cached(final_ticker: str, period: str, interval: str) -> Optional[pd.DataFrame]:
+    """
+    collector.get_ohlcv 결과를 (ticker, period, interval) 키로 캐시
+    얕은 복사본 반환: 인덱스/컬럼 교체는 안전하지만 값의 제자리 수정은 캐시를 오염시키므로 금지
+    """
+    key = (final_ticker, period, interval)
+    df = _ohlcv_cache.get(key)
+    if df is None:
+        df = collector.get_ohlcv(final_ticker, period=period, interval=interval)
+        if df is None or df.empty:
+            return df
+        _ohlcv_cache.set(key, df)
+    return df.copy(deep=False)
+
+# 다중 시간 프레임 분석도 OHLCV 캐시 경유 (종목 데이터는 /history와, 지수 데이터는 종목 간 공유)
+multi_analyzer = MultiTimeframeAnalyzer(analyst=analyst, collector=collector, fetch_ohlcv=get_ohlcv_cached)
 
 # 전역 데이터
+# KRX 종목 목록 디스크 캐시 (재배포/재시작 시 FDR 다운로드 생략)
+KRX_CACHE_PATH = Path(os.getenv("KRX_CACHE_PATH", "data/krx_listing.parquet"))
+KRX_CACHE_TTL = 24 * 3600
+
 class KRXLoader:
-    def __init__(self):
+    def __init__(self, cache_path: Path = KRX_CACHE_PATH):
         self.df = None
-        self.loading = False
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+        self._loaded = threading.Event()  # 한 번 set되면 이후 호출은 즉시 반환
+    
+    @property
+    def ready(self) -> bool:
+        """검색 인덱스 로드 완료 여부"""
+        return self._loaded.is_set()
     
     def load(self):
-        if self.loading or self.df is not None: return
-        self.loading = True
+        # 동시 호출은 락에서 대기하다가 먼저 들어간 로드 결과를 공유 (FDR 중복 요청 방지)
+        with self._lock:
+            if self._loaded.is_set(): return
+            try:
+                df = self._read_cache()
+                if df is None:
+                    import FinanceDataReader as fdr
+                    logger.info("Loading KRX data...")
+                    df = fdr.StockListing('KRX')
+                    self._write_cache(df)
+                self._build_index(df)
+                self.df = df  # 검색 인덱스 구성 후 공개 (부분 초기화 상태 노출 방지)
+                self._loaded.set()
+                logger.info(f"Loaded {len(self.df)} KRX symbols.")
+            except Exception as e:
+                logger.error(f"Failed to load KRX data: {e}")
+
+    def has_fresh_cache(self) -> bool:
+        """디스크 캐시가 존재하고 TTL 이내인지 여부"""
         try:
-            import FinanceDataReader as fdr
-            logger.info("Loading KRX data...")
-            self.df = fdr.StockListing('KRX')
-            logger.info(f"Loaded {len(self.df)} KRX symbols.")
+            return time.time() - self.cache_path.stat().st_mtime < KRX_CACHE_TTL
+        except OSError:
+            return False
+
+    def _read_cache(self) -> Optional[pd.DataFrame]:
+        if not self.has_fresh_cache():
+            return None
+        try:
+            df = pd.read_parquet(self.cache_path)
+            logger.info(f"KRX listing loaded from disk cache: {self.cache_path}")
+            return df
+        except Exception as e:  # pyarrow 미설치/파일 손상 시 FDR로 대체
+            logger.warning(f"KRX disk cache read error: {e}")
+            return None
+
+    def _write_cache(self, df: pd.DataFrame):
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            df.to_parquet(tmp_path, index=False)
+            tmp_path.replace(self.cache_path)  # 원자적 교체 (다중 워커 동시 기록 대비)
         except Exception as e:
-            logger.error(f"Failed to load KRX data: {e}")
-        finally:
-            self.loading = False
+            logger.warning(f"KRX disk cache write error: {e}")
+
+    def _build_index(self, df: pd.DataFrame):
+        """검색용 컬럼(소문자 이름/코드/최종 심볼)을 로드 시 한 번만 계산"""
+        codes = df['Code'].astype(str)
+        markets = df['Market'].astype(str)
+        
+        # 접미사 결정 + 6자리 숫자인 경우에만 접미사 추가, 아니면 그대로 (ETF 등 확인 필요)
+        # TIGER ETF 같은 경우도 6자리 숫자 코드를 가짐
+        suffix = np.where(markets.isin(['KOSPI', 'KOSPI200']), '.KS', '.KQ')
+        is_code6 = codes.str.fullmatch(r'\d{6}').to_numpy()
+        
+        self._name_lc = df['Name'].astype(str).str.lower().to_numpy(dtype=str)
+        self._code_str = codes.to_numpy(dtype=str)
+        self._names = df['Name'].to_numpy()
+        self._markets = markets.to_numpy()
+        self._symbols = np.where(is_code6, np.char.add(self._code_str, suffix), self._code_str)
 
     def search(self, query: str, limit: int = 10) -> List[Dict]:
-        if self.df is None: return []
+        if not self.ready: return []
         try:
-            q = query.strip()
-            # 이름 또는 코드로 검색
-            mask = self.df['Name'].astype(str).str.contains(q, case=False, na=False) | \
-                   self.df['Code'].astype(str).str.contains(q, case=False, na=False)
-            results = self.df[mask].head(limit)
+            q = query.strip().lower()
+            # 이름 또는 코드로 검색 (사전 계산된 배열에 대한 부분 문자열 매칭)
+            mask = (np.char.find(self._name_lc, q) >= 0) | (np.char.find(self._code_str, q) >= 0)
+            hits = np.flatnonzero(mask)[:limit]
             
-            candidates = []
-            for _, row in results.iterrows():
-                market = row['Market']
-                code = str(row['Code'])
-                
-                # 접미사 결정
-                suffix = ".KS" if market in ['KOSPI', 'KOSPI200'] else ".KQ"
-                
-                # 6자리 숫자인 경우에만 접미사 추가, 아니면 그대로 (ETF 등 확인 필요)
-                # TIGER ETF 같은 경우도 6자리 숫자 코드를 가짐
-                symbol = f"{code}{suffix}" if code.isdigit() and len(code) == 6 else code
-                
-                candidates.append({
-                    "symbol": symbol,
-                    "name": row['Name'],
-                    "exchange": market,
+            return [
+                {
+                    "symbol": str(self._symbols[i]),
+                    "name": self._names[i],
+                    "exchange": self._markets[i],
                     "is_korean": True
-                })
-            return candidates
+                }
+                for i in hits
+            ]
         except Exception as e:
             logger.error(f"KRX Search error: {e}")
             return []
 
 krx_loader = KRXLoader()
-screener = StockScreener()
 
 @app.on_event("startup")
 async def startup_event():
-    import asyncio
-    global screener
-    screener = StockScreener() # Ensure initialized
-    asyncio.create_task(load_krx_bg())
+    # 블로킹 네트워크 호출(yfinance/FDR) 전용 스레드 풀
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=IO_THREAD_POOL_SIZE, thread_name_prefix="io")
+    )
+    # 디스크 캐시가 신선하면 즉시 동기 로드 (수 ms), 아니면 백그라운드에서 FDR 다운로드
+    if krx_loader.has_fresh_cache():
+        krx_loader.load()
+    if not krx_loader.ready:
+        asyncio.create_task(load_krx_bg())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # 스크리너 프로세스 풀 워커 정리 (서버 종료 시 고아 프로세스 방지)
+    shutdown_process_pools()
 
 async def load_krx_bg():
-    if krx_loader:
-        krx_loader.load()
+    await asyncio.to_thread(krx_loader.load)
 
 # === 모델 정의 ===
 class AnalysisRequest(BaseModel):
     ticker: str
 
-class AnalysisResponse(BaseModel):
-    ticker: str
-    interval: str
-    signal: str
-    final_score: float
-    technical: Dict[str, Any]
-    fundamental: Dict[str, Any]
-    entry_points: Dict[str, Any]
-    full_report: Optional[str] = None
-    events: Dict[str, Any] = {}
-    
-    # Pydantic V2 설정 (임의의 타입 허용)
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
 # === API 엔드포인트 ===
 
 @app.get("/")
 async def root():
-    return {"status": "ok", "message": "Trading Assistant Server is running"}
+    return FastJSONResponse({"status": "ok", "message": "Trading Assistant Server is running"})
+
+# 한글 종목명 -> 티커 하드 매핑 (모듈 로드 시 1회 생성, 읽기 전용)
+# 키는 소문자 + 공백 제거 형태 ("SK 하이닉스" -> "sk하이닉스")
+KOREAN_TICKER_MAP = MappingProxyType({
+    "삼성전자": "005930.KS", "삼성전자우": "005935.KS",
+    "sk하이닉스": "000660.KS", "하이닉스": "000660.KS",
+    "에코프로": "086520.KQ", "에코프로비엠": "247540.KQ",
+    "카카오": "035720.KS", "네이버": "035420.KS",
+    "현대차": "005380.KS", "기아": "000270.KS",
+    "셀트리온": "068270.KS", "포스코홀딩스": "005490.KS",
+    "lg에너지솔루션": "373220.KS", "삼성sdi": "006400.KS"
+})
+
+# KOREAN_TICKER_MAP 접두어 검색용 정렬 인덱스 (KRX 목록 로드 전에도 자동완성 즉시 응답)
+_KOREAN_PREFIX_KEYS = sorted(KOREAN_TICKER_MAP)
+
+def korean_prefix_matches(query: str, limit: int = 10) -> List[Dict]:
+    """하드 매핑 이름 중 query로 시작하는 항목을 이진 탐색으로 조회"""
+    q = query.lower().replace(" ", "")
+    start = bisect_left(_KOREAN_PREFIX_KEYS, q)
+    results = []
+    for name in _KOREAN_PREFIX_KEYS[start:start + limit]:
+        if not name.startswith(q):
+            break
+        results.append({"symbol": KOREAN_TICKER_MAP[name], "name": name, "exchange": "KRX", "is_korean": True})
+    return results
+
+# yf.Search 결과(24시간) 및 종목 표시명(1시간) 캐시
+_ticker_search_cache = TTLCache(maxsize=4096, ttl=24 * 3600)
+_display_name_cache = TTLCache(maxsize=2048, ttl=3600)
+# 검색 결과 없음/조회 실패도 짧게 캐시해 같은 입력의 반복 네트워크 호출 방지
+NEGATIVE_CACHE_TTL = 300
+# /search 자동완성용 yf.Search 결과 캐시 (키 입력마다 Yahoo 재요청 방지)
+_search_quotes_cache = TTLCache(maxsize=2048, ttl=3600)
 
 def get_final_ticker(ticker: str) -> str:
     """종목명이나 숫자를 yfinance 티커(symbol)로 변환"""
-    import yfinance as yf
+    ticker = ticker.strip()
+    
+    # 소문자 접미사(.ks/.kq) 대문자로 정규화 (한 번의 슬라이스 비교)
+    suffix = ticker[-3:]
+    if suffix in ('.ks', '.kq'):
+        ticker = ticker[:-3] + suffix.upper()
     
     # 1. 이미 규격에 맞는 티커인 경우 바로 반환
-    if ticker.endswith(('.KS', '.KQ')) or (ticker.isupper() and len(ticker) <= 5):
+    if ticker.endswith(('.KS', '.KQ')) or _US_TICKER_RE.match(ticker):
         return ticker
 
     # 2. 숫자로만 된 6자리 코드라면 .KS 자동 부여
-    if ticker.isdigit() and len(ticker) == 6:
+    if _KR_CODE_RE.match(ticker):
         return f"{ticker}.KS"
 
-    # 3. 하드 매핑 체크
-    korean_map = {
-        "삼성전자": "005930.KS", "삼성전자우": "005935.KS",
-        "sk하이닉스": "000660.KS", "하이닉스": "000660.KS",
-        "에코프로": "086520.KQ", "에코프로비엠": "247540.KQ",
-        "카카오": "035720.KS", "네이버": "035420.KS",
-        "현대차": "005380.KS", "기아": "000270.KS",
-        "셀트리온": "068270.KS", "포스코홀딩스": "005490.KS",
-        "lg에너지솔루션": "373220.KS", "삼성sdi": "006400.KS"
-    }
-    if ticker in korean_map:
-        return korean_map[ticker]
+    # 3. 하드 매핑 체크 (키가 모두 한글이므로 ASCII 입력은 매핑/한글 판별 생략)
+    is_ascii = ticker.isascii()
+    if not is_ascii:
+        mapped = KOREAN_TICKER_MAP.get(ticker.lower().replace(" ", ""))
+        if mapped:
+            return mapped
 
-    # 4. 검색 API 시도
+    # 4. 검색 API 시도 (결과는 24시간 캐시)
+    cached = _ticker_search_cache.get(ticker)
+    if cached:
+        return cached
+    
     try:
-        is_korean = any(ord('가') <= ord(char) <= ord('힣') for char in ticker)
+        is_korean = not is_ascii and _HANGUL_RE.search(ticker) is not None
         search = yf.Search(ticker, max_results=5)
         quotes = search.quotes
         if quotes:
+            symbol = quotes[0].get('symbol', ticker)
             if is_korean:
                 for res in quotes:
                     sym = res.get('symbol', '')
                     if sym.endswith(('.KS', '.KQ')):
-                        return sym
-            return quotes[0].get('symbol', ticker)
+                        symbol = sym
+                        break
+            _ticker_search_cache.set(ticker, symbol)
+            return symbol
+        _ticker_search_cache.set(ticker, ticker, ttl=NEGATIVE_CACHE_TTL)
     except Exception as e:
         logger.error(f"Ticker mapping error for {ticker}: {e}")
     
     return ticker
 
-from src.agents.multi_timeframe import MultiTimeframeAnalyzer
-multi_analyzer = MultiTimeframeAnalyzer()
+def get_display_name(final_ticker: str) -> str:
+    """종목 표시명 '이름 (티커)' 반환 (yf.Ticker.info 결과 1시간 캐시)"""
+    cached = _display_name_cache.get(final_ticker)
+    if cached:
+        return cached
+    
+    try:
+        info = yf.Ticker(final_ticker).info
+        name = info.get('longName') or info.get('shortName') or final_ticker
+    except Exception as e:
+        logger.warning(f"Display name lookup failed for {final_ticker}: {e}")
+        _display_name_cache.set(final_ticker, final_ticker, ttl=NEGATIVE_CACHE_TTL)
+        return final_ticker
+    
+    display_name = f"{name} ({final_ticker})"
+    _display_name_cache.set(final_ticker, display_name)
+    return display_name
+
+def load_financials(final_ticker: str) -> list:
+    """저장된 재무 데이터 조회 (없으면 수집 후 재조회)"""
+    financials = storage.get_financials(final_ticker)
+    if not financials:
+        parser.fetch_and_save_financials(final_ticker)
+        financials = storage.get_financials(final_ticker)
+    return financials
+
+# 진행 중인 분석 작업: 같은 종목 동시 요청은 하나의 작업 결과를 공유 (yfinance 중복 호출 방지)
+# 모든 접근이 이벤트 루프 스레드에서 일어나므로 별도 락 불필요
+_analysis_inflight: Dict[tuple, asyncio.Task] = {}
 
 async def run_analysis(ticker: str, lang: str = "ko"):
     """실제 분석 로직 공통 엔진 (30+ 정밀 데이터 통합 버전)"""
     # 1. 티커 매핑
-    final_ticker = get_final_ticker(ticker)
+    final_ticker = await asyncio.to_thread(get_final_ticker, ticker)
     logger.info(f"Analyzing mapped ticker: {final_ticker} (Input: {ticker})")
     
-    # 종목 정보 가져오기
-    import yfinance as yf
-    display_name = final_ticker
-    try:
-        stock = yf.Ticker(final_ticker)
-        info = stock.info
-        name = info.get('longName') or info.get('shortName') or final_ticker
-        display_name = f"{name} ({final_ticker})"
-    except:
-        pass
+    key = (final_ticker, lang)
+    task = _analysis_inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_run_analysis(final_ticker, lang))
+        _analysis_inflight[key] = task
+        task.add_done_callback(lambda _: _analysis_inflight.pop(key, None))
+    else:
+        logger.info(f"Joining in-flight analysis: {final_ticker}")
+    # shield: 한 요청의 연결이 끊겨도 같은 작업을 기다리는 다른 요청에는 영향 없음
+    return await asyncio.shield(task)
 
-    # 2. 다중 시간 프레임 분석 (30+ 데이터 포인트 자동 생성)
+async def _run_analysis(final_ticker: str, lang: str) -> Dict[str, Any]:
+    """매핑된 티커 기준 분석 본체"""
+    # 2. 종목 정보 / 다중 시간 프레임 분석 / 재무 / 이벤트를 스레드 풀에서 동시 수집
     # 한국 주식은 KOSPI(^KS11), 미국 주식은 S&P 500(^GSPC) 기준
     index_symbol = "^KS11" if final_ticker.endswith(('.KS', '.KQ')) else "^GSPC"
-    multi_res = multi_analyzer.analyze_all_timeframes(final_ticker, index_ticker=index_symbol)
-    
-    # 3. 추가 데이터 (재무, 이벤트)
-    financials = storage.get_financials(final_ticker)
-    if not financials:
-        parser.fetch_and_save_financials(final_ticker)
-        financials = storage.get_financials(final_ticker)
-    events = get_stock_events(final_ticker)
+    display_name, multi_res, financials, events = await asyncio.gather(
+        asyncio.to_thread(get_display_name, final_ticker),
+        asyncio.to_thread(multi_analyzer.analyze_all_timeframes, final_ticker, index_ticker=index_symbol),
+        asyncio.to_thread(load_financials, final_ticker),
+        asyncio.to_thread(get_stock_events, final_ticker),
+    )
     
-    # 4. 종합 데이터 병합
+    # 3. 종합 데이터 병합
     full_data = {
         **multi_res,
         "display_name": display_name,
@@ -266,50 +474,210 @@ async def run_analysis(ticker: str, lang: str = "ko"):
         "signal": multi_res.get("consensus", {}).get("consensus", "중립")
     }
 
-    # 5. AI 수석 분석가 리포트 생성 (30+ 데이터 기반 판단)
-    full_data['full_report'] = ai_analyzer.generate_report(full_data, lang=lang)
+    # 4. AI 수석 분석가 리포트 생성 (30+ 데이터 기반 판단)
+    full_data['full_report'] = await asyncio.to_thread(ai_analyzer.generate_report, full_data, lang=lang)
     
-    return safe_serialize(full_data)
+    return full_data
 
-@app.post("/analyze")
+@app.post("/analyze", dependencies=[Depends(analyze_rate_limit)])
 async def analyze_post(req: AnalysisRequest):
     """POST 방식 분석 엔드포인트"""
     try:
         # Validate Input
         validate_ticker(req.ticker)
         result = await run_analysis(req.ticker)
-        return JSONResponse(content=result)
+        return FastJSONResponse(content=result)
     except HTTPException as he:
         raise he
     except Exception as e:
         logger.error(f"Analysis POST error: {e}")
         raise e  # Let global handler handle it
 
-@app.get("/analyze/{ticker}")
+@app.get("/analyze/{ticker}", dependencies=[Depends(analyze_rate_limit)])
 async def analyze_get(ticker: str):
     """GET 방식 분석 엔드포인트 (기존 호환성)"""
     try:
         # Validate Input
         validate_ticker(ticker)
         result = await run_analysis(ticker)
-        return JSONResponse(content=result)
+        return FastJSONResponse(content=result)
     except HTTPException as he:
         raise he
     except Exception as e:
         logger.error(f"Analysis GET error: {e}")
         raise e
 
-@app.get("/history/{ticker}")
-async def get_history(ticker: str, interval: str = "1d"):
+# === /history 응답 캐시 (직렬화된 JSON 바이트 저장) ===
+# 인터벌별 TTL (초): 분봉은 짧게, 일봉 이상은 길게
+HISTORY_CACHE_TTL = {
+    "1m": 30, "5m": 60, "15m": 180, "30m": 300, "60m": 600, "1h": 600, "4h": 600,
+    "1d": 900, "1wk": 3600, "1mo": 3600, "1y": 3600
+}
+HISTORY_CACHE_DEFAULT_TTL = 300
+
+_history_cache = TTLCache(maxsize=512, ttl=HISTORY_CACHE_DEFAULT_TTL)
+_history_cache_stats = {"hit": 0, "miss": 0}
+_redis = None
+
+if REDIS_URL:
+    try:
+        import redis.asyncio as aioredis
+        _redis = aioredis.from_url(REDIS_URL)
+        logger.info("History cache backend: Redis")
+    except ImportError:
+        logger.warning("REDIS_URL이 설정되었지만 redis 패키지가 없어 인메모리 캐시를 사용합니다.")
+
+# 마지막 봉이 그대로면 지표 재계산/직렬화 없이 재사용하는 2차 캐시: cache_key -> (last_bar_key, raw)
+# (TTL 만료 후에도 장 마감/주말처럼 데이터가 바뀌지 않은 경우 OHLCV 조회 1회로 응답)
+HISTORY_BAR_CACHE_TTL = 6 * 3600
+_history_bar_cache = TTLCache(maxsize=256, ttl=HISTORY_BAR_CACHE_TTL)
+
+HISTORY_FORMATS = ("json", "ndjson")
+HISTORY_CHUNK_ROWS = 256  # 스트리밍 시 한 번에 직렬화해 내보낼 봉 개수
+HISTORY_STREAM_MIN_ROWS = 2000  # format=json도 이 봉 개수 이상이면 청크 스트리밍 (작은 응답은 한 번에 반환)
+
+def _history_cache_key(final_ticker: str, interval: str, fmt: str = "json") -> str:
+    return f"hist:{final_ticker}:{interval}" if fmt == "json" else f"hist:{final_ticker}:{interval}:{fmt}"
+
+async def _history_cache_get(key: str) -> Optional[bytes]:
+    if _redis is not None:
+        try:
+            return await _redis.get(key)
+        except Exception as e:
+            logger.warning(f"Redis get error: {e}")
+            return None
+    return _history_cache.get(key)
+
+async def _history_cache_set(key: str, raw: bytes, ttl: int):
+    if _redis is not None:
+        try:
+            await _redis.set(key, raw, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Redis set error: {e}")
+        return
+    _history_cache.set(key, raw, ttl=ttl)
+
+def _last_bar_key(df: pd.DataFrame, interval: str) -> tuple:
+    """마지막 봉 식별 키 (봉 개수 + 마지막 시각/종가/거래량, 실시간 패치된 현재 봉 변화도 반영)"""
+    last = df.iloc[-1]
+    return (interval, len(df), str(last.get('Date', df.index[-1])), last.get('Close'), last.get('Volume'))
+
+async def _history_cache_store(cache_key: str, bar_key: tuple, raw: bytes, ttl: int):
+    """응답 캐시(TTL) + 마지막 봉 기준 캐시에 동시 저장"""
+    _history_bar_cache.set(cache_key, (bar_key, raw))
+    await _history_cache_set(cache_key, raw, ttl)
+
+async def _history_cache_delete(final_ticker: str) -> int:
+    """해당 종목의 모든 인터벌 캐시 삭제, 삭제된 항목 수 반환"""
+    keys = [_history_cache_key(final_ticker, i, f) for i in HISTORY_CACHE_TTL for f in HISTORY_FORMATS]
+    for k in keys:
+        _history_bar_cache.pop(k)
+    if _redis is not None:
+        try:
+            return await _redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Redis delete error: {e}")
+            return 0
+    return sum(_history_cache.pop(k) is not None for k in keys)
+
+# /history 응답 컬럼 -> 출력 키 매핑 (OHLCV + 30개 이상 지표, 순서 = 출력 순서)
+_HISTORY_INDICATORS = [
+    'sma_5', 'sma_10', 'sma_20', 'sma_50', 'sma_60', 'sma_100', 'sma_120', 'sma_200',
+    'ema_9', 'ema_12', 'ema_20', 'ema_26', 'ema_50', 'ema_200',
+    'bb_upper', 'bb_middle', 'bb_lower', 'bb_width',
+    'kc_upper', 'kc_middle', 'kc_lower',
+    'dc_upper', 'dc_middle', 'dc_lower',
+    'ichimoku_tenkan', 'ichimoku_kijun', 'ichimoku_senkou_a', 'ichimoku_senkou_b',
+    'rsi', 'rsi_9', 'rsi_25',
+    'MACD', 'Signal', 'Hist',
+    'stoch_k', 'stoch_d',
+    'cci', 'williams_r',
+    'adx', 'plus_di', 'minus_di',
+    'obv', 'mfi', 'vwap', 'cmf',
+    'roc', 'momentum',
+    'aroon_up', 'aroon_down', 'aroon_osc',
+    'tsi', 'uo', 'atr'
+]
+_HISTORY_COLUMN_ALIAS = {name: name.lower() for name in ['Open', 'High', 'Low', 'Close', 'Volume'] + _HISTORY_INDICATORS}
+_HISTORY_COLUMN_ALIAS.update({'MACD': 'macd', 'Signal': 'macd_signal', 'Hist': 'macd_hist'})
+# 가격/거래량은 float64 유지, 지표는 차트용으로 float32면 충분 (메모리 절반 + 짧은 숫자 표현)
+_HISTORY_COLUMN_DTYPE = {name: ('float64' if name in ('Open', 'High', 'Low', 'Close', 'Volume') else 'float32')
+                         for name in _HISTORY_COLUMN_ALIAS}
+
+def _history_records(out: pd.DataFrame) -> list:
+    """지표 프레임 -> 레코드 목록 (NaN -> null)"""
+    # 컬럼별 numpy 배열을 그대로 묶어 numpy 스칼라를 유지 -> orjson이 float32를 짧은 표현으로 직렬화
+    # (to_dict/Polars 경로는 Python float로 변환되어 float32 값이 150.1199951171875처럼 길어짐)
+    # NaN은 직렬화 단계(orjson)에서 null로 변환됨
+    cols = list(out.columns)
+    arrays = [out[c].to_numpy() for c in cols]
+    return [dict(zip(cols, row)) for row in zip(*arrays)]
+
+def _ndjson_chunk(out: pd.DataFrame) -> bytes:
+    """레코드 묶음 -> 줄 단위 JSON 바이트"""
+    return b"".join(json_dumps(r) + b"\n" for r in _history_records(out))
+
+def _json_array_chunk(out: pd.DataFrame) -> bytes:
+    """레코드 묶음 -> JSON 배열 본문 조각 (바깥 대괄호 제외)"""
+    return json_dumps(_history_records(out))[1:-1]
+
+async def _stream_history_ndjson(header: dict, out: pd.DataFrame, cache_key: str, bar_key: tuple, cache_ttl: int):
+    """
+    NDJSON 스트림 생성: 첫 줄은 {"ticker", "interval"} 헤더, 이후 한 줄에 봉 하나
+    전체 레코드 목록을 한 번에 만들지 않고 청크 단위로 직렬화해 내보냄 (완료 후 캐시 저장)
+    """
+    chunks = [json_dumps(header) + b"\n"]
+    yield chunks[0]
+    for start in range(0, len(out), HISTORY_CHUNK_ROWS):
+        # 청크 직렬화는 워커 스레드에서 수행 -> 전송 중에도 이벤트 루프가 다른 요청을 처리
+        chunk = await asyncio.to_thread(_ndjson_chunk, out.iloc[start:start + HISTORY_CHUNK_ROWS])
+        chunks.append(chunk)
+        yield chunk
+    await _history_cache_store(cache_key, bar_key, b"".join(chunks), cache_ttl)
+
+async def _stream_history_json(header: dict, out: pd.DataFrame, cache_key: str, bar_key: tuple, cache_ttl: int):
+    """
+    큰 JSON 응답 스트리밍: '{"ticker":..,"interval":..,"data":[' -> 청크별 레코드 -> ']}'
+    레코드 dict 전체 목록을 한 번에 만들지 않아 최대 메모리가 청크 크기로 제한됨 (완료 후 캐시 저장)
+    """
+    chunks = [json_dumps(header)[:-1] + b',"data":[']
+    yield chunks[0]
+    for start in range(0, len(out), HISTORY_CHUNK_ROWS):
+        chunk = await asyncio.to_thread(_json_array_chunk, out.iloc[start:start + HISTORY_CHUNK_ROWS])
+        if start:
+            chunk = b"," + chunk
+        chunks.append(chunk)
+        yield chunk
+    chunks.append(b"]}")
+    yield chunks[-1]
+    await _history_cache_store(cache_key, bar_key, b"".join(chunks), cache_ttl)
+
+@app.get("/history/{ticker}", dependencies=[Depends(history_rate_limit)])
+async def get_history(ticker: str, interval: str = "1d", format: str = "json"):
     """
     차트 시각화를 위한 OHLCV 데이터 반환
+    format=ndjson 지정 시 줄 단위 JSON(application/x-ndjson)으로 스트리밍
     """
     try:
         # Validate Input
         validate_ticker(ticker)
+        if format not in HISTORY_FORMATS:
+            raise HTTPException(status_code=400, detail=f"Invalid format (use one of {HISTORY_FORMATS})")
+        media_type = "application/json" if format == "json" else "application/x-ndjson"
         
         # 티커 매핑 수행 (한글명 -> 티커)
-        final_ticker = get_final_ticker(ticker)
+        final_ticker = await asyncio.to_thread(get_final_ticker, ticker)
+        
+        # 캐시 히트 시 직렬화 비용 없이 바로 반환
+        cache_key = _history_cache_key(final_ticker, interval, format)
+        cached = await _history_cache_get(cache_key)
+        if cached is not None:
+            _history_cache_stats["hit"] += 1
+            logger.info(f"History cache hit: {cache_key} (hit={_history_cache_stats['hit']}, miss={_history_cache_stats['miss']})")
+            return Response(content=cached, media_type=media_type)
+        _history_cache_stats["miss"] += 1
+        logger.info(f"History cache miss: {cache_key} (hit={_history_cache_stats['hit']}, miss={_history_cache_stats['miss']})")
+        cache_ttl = HISTORY_CACHE_TTL.get(interval, HISTORY_CACHE_DEFAULT_TTL)
         
         # 인터벌에 따른 적절한 데이터 기간(period) 설정
         period_map = {
@@ -330,130 +698,135 @@ async def get_history(ticker: str, interval: str = "1d"):
         # 4h 요청 시 yfinance 대응을 위해 1h로 변경 (데이터는 충분히 가져옴)
         actual_interval = "1h" if interval == "4h" else ("1mo" if interval == "1y" else interval)
         
-        # 소문자 접미사 대문자로 정규화
-        if final_ticker.endswith('.ks'): final_ticker = final_ticker[:-3] + '.KS'
-        if final_ticker.endswith('.kq'): final_ticker = final_ticker[:-3] + '.KQ'
-
-        df = collector.get_ohlcv(final_ticker, period=period, interval=actual_interval)
+        df = await asyncio.to_thread(get_ohlcv_cached, final_ticker, period, actual_interval)
         
         # 데이터가 없는 경우 상위 인터벌로 대체 시도
         if (df is None or df.empty) and interval in ["1m", "5m", "15m", "30m", "60m"]:
             logger.info(f"Interval {interval} failed for {ticker}, falling back to daily.")
-            df = collector.get_ohlcv(final_ticker, period="1y", interval="1d")
+            df = await asyncio.to_thread(get_ohlcv_cached, final_ticker, "1y", "1d")
             interval = "1d"
 
         if df is None or df.empty:
-            return {"ticker": final_ticker, "data": []}
+            # 반환 dict는 FastAPI jsonable_encoder 재귀 변환을 거치므로 직렬화된 응답을 직접 반환
+            if format == "ndjson":
+                return Response(content=json_dumps({"ticker": final_ticker, "interval": interval}) + b"\n", media_type=media_type)
+            return FastJSONResponse({"ticker": final_ticker, "data": []})
+        
+        # 마지막 봉이 이전 응답과 같으면 지표 재계산 없이 저장된 바이트 반환
+        bar_key = _last_bar_key(df, interval)
+        entry = _history_bar_cache.get(cache_key)
+        if entry is not None and entry[0] == bar_key:
+            logger.info(f"History bar cache hit: {cache_key}")
+            await _history_cache_set(cache_key, entry[1], cache_ttl)
+            return Response(content=entry[1], media_type=media_type)
             
         # === 전문가급 기술적 지표 계산 (30개 이상) ===
-        from src.utils.advanced_indicators import AdvancedIndicators
-        
-        # 지표 추가를 위한 데이터프레임 복사
-        calc_df = df.copy()
-        if 'Date' in calc_df.columns:
-            calc_df.set_index(pd.to_datetime(calc_df['Date']), inplace=True)
+        # get_ohlcv_cached는 호출마다 별도 DataFrame 객체(얕은 복사)를 반환하므로 인덱스만 제자리 설정
+        # (calculate_all이 내부에서 한 번 복사해 지표 컬럼을 추가함)
+        if 'Date' in df.columns:
+            df.set_index(to_datetime_index(df['Date']), inplace=True)
         
         # 모든 지표 한 번에 계산
-        calc_df = AdvancedIndicators.calculate_all(calc_df)
+        calc_df = await asyncio.to_thread(AdvancedIndicators.calculate_all, df)
 
         # 인덱스를 Datetime으로 확실히 변환
         if not isinstance(calc_df.index, pd.DatetimeIndex):
             calc_df.index = pd.to_datetime(calc_df.index)
         
-        calc_df = calc_df[calc_df.index.notnull()]
-        calc_df.sort_index(inplace=True)
+        # NaT 인덱스/비정렬 데이터는 드물므로 필요할 때만 필터·정렬 (매 요청 전체 프레임 복사 방지)
+        if calc_df.index.hasnans:
+            calc_df = calc_df[calc_df.index.notnull()]
+        if not calc_df.index.is_monotonic_increasing:
+            calc_df = calc_df.sort_index()
         
-        history = []
-        for idx, row in calc_df.iterrows():
-            try:
-                time_val = idx.strftime('%Y-%m-%d %H:%M:%S' if actual_interval != '1d' else '%Y-%m-%d')
-            except:
-                time_val = str(idx)
-
-            # 기본 OHLCV 데이터
-            data_point = {
-                "time": time_val,
-                "open": float(row["Open"]),
-                "high": float(row["High"]),
-                "low": float(row["Low"]),
-                "close": float(row["Close"]),
-                "volume": float(row["Volume"]),
-            }
-            
-            # === 모든 지표 추가 (NaN 안전 처리) ===
-            all_indicators = [
-                'sma_5', 'sma_10', 'sma_20', 'sma_50', 'sma_60', 'sma_100', 'sma_120', 'sma_200',
-                'ema_9', 'ema_12', 'ema_20', 'ema_26', 'ema_50', 'ema_200',
-                'bb_upper', 'bb_middle', 'bb_lower', 'bb_width',
-                'kc_upper', 'kc_middle', 'kc_lower',
-                'dc_upper', 'dc_middle', 'dc_lower',
-                'ichimoku_tenkan', 'ichimoku_kijun', 'ichimoku_senkou_a', 'ichimoku_senkou_b',
-                'rsi', 'rsi_9', 'rsi_25',
-                'MACD', 'Signal', 'Hist',
-                'stoch_k', 'stoch_d',
-                'cci', 'williams_r',
-                'adx', 'plus_di', 'minus_di',
-                'obv', 'mfi', 'vwap', 'cmf',
-                'roc', 'momentum',
-                'aroon_up', 'aroon_down', 'aroon_osc',
-                'tsi', 'uo', 'atr'
-            ]
-            
-            for indicator in all_indicators:
-                if indicator in row.index:
-                    val = row[indicator]
-                    # MACD 계열은 소문자로 변환
-                    key = indicator.lower() if indicator in ['MACD', 'Signal', 'Hist'] else indicator
-                    if indicator == 'Signal':
-                        key = 'macd_signal'
-                    elif indicator == 'Hist':
-                        key = 'macd_hist'
-                    elif indicator == 'MACD':
-                        key = 'macd'
-                    data_point[key] = float(val) if not pd.isna(val) else None
-            
-            history.append(data_point)
-            
-        return safe_serialize({"ticker": final_ticker, "interval": interval, "data": history})
+        # 응답에 포함할 컬럼만 한 번에 선택/형 변환(복사 1회) 후 이름은 제자리 변경 (행 단위 루프 제거)
+        present_cols = [c for c in _HISTORY_COLUMN_ALIAS if c in calc_df.columns]
+        out = calc_df[present_cols].astype({c: _HISTORY_COLUMN_DTYPE[c] for c in present_cols})
+        out.columns = [_HISTORY_COLUMN_ALIAS[c] for c in present_cols]
+        time_fmt = '%Y-%m-%d %H:%M:%S' if actual_interval != '1d' else '%Y-%m-%d'
+        out.insert(0, 'time', calc_df.index.strftime(time_fmt))
+        
+        header = {"ticker": final_ticker, "interval": interval}
+        if format == "ndjson":
+            return StreamingResponse(
+                _stream_history_ndjson(header, out, cache_key, bar_key, cache_ttl), media_type=media_type
+            )
+        if len(out) >= HISTORY_STREAM_MIN_ROWS:
+            return StreamingResponse(
+                _stream_history_json(header, out, cache_key, bar_key, cache_ttl), media_type=media_type
+            )
+        
+        history = _history_records(out)
+        raw = json_dumps({"ticker": final_ticker, "interval": interval, "data": history})
+        await _history_cache_store(cache_key, bar_key, raw, cache_ttl)
+        return Response(content=raw, media_type="application/json")
     except Exception as e:
         logger.error(f"History error: {e}")
         raise e
 
+@app.delete("/history/cache/{ticker}", dependencies=[Depends(require_admin)])
+@limiter.limit("10/minute")
+async def clear_history_cache(request: Request, ticker: str):
+    """
+    종목별 /history 캐시 무효화 (관리용)
+    """
+    validate_ticker(ticker)
+    final_ticker = await asyncio.to_thread(get_final_ticker, ticker)
+    removed = await _history_cache_delete(final_ticker)
+    return FastJSONResponse({"status": "ok", "ticker": final_ticker, "removed": removed})
+
+@app.delete("/ticker/cache", dependencies=[Depends(require_admin)])
+@limiter.limit("10/minute")
+async def clear_ticker_cache(request: Request):
+    """
+    티커 변환/표시명/검색 캐시 전체 초기화 (관리용)
+    """
+    removed = len(_ticker_search_cache) + len(_display_name_cache) + len(_search_quotes_cache)
+    for cache in (_ticker_search_cache, _display_name_cache, _search_quotes_cache):
+        cache.clear()
+    return FastJSONResponse({"status": "ok", "removed": removed})
+
 @app.get("/search")
 async def search_ticker(query: str):
     """
     티커 검색 (Autocomplete용) - KRX 우선 + Yfinance 보조
     """
     try:
-        import yfinance as yf
         if not query or len(query) < 1 or len(query) > 50: # Limit query length
-            return {"query": query, "candidates": []}
+            return FastJSONResponse({"query": query, "candidates": []})
             
         candidates = []
         
         # 1. 한국어 포함 시 KRX 로더 우선 사용
-        is_korean_query = any(ord('가') <= ord(char) <= ord('힣') for char in query)
-        is_krx_code = query.isdigit() and len(query) >= 3 # 숫자 코드 검색 시도
+        is_korean_query = _HANGUL_RE.search(query) is not None
         
-        if is_korean_query or is_krx_code or (krx_loader and krx_loader.df is not None):
-            # KRX 로더가 준비되었으면 일단 검색 시도 (영어일 수도 있음 예: TIGER)
-             if krx_loader and krx_loader.df is not None:
-                krx_results = krx_loader.search(query, limit=10)
-                candidates.extend(krx_results)
+        # KRX 로더가 준비되었으면 일단 검색 시도 (영어일 수도 있음 예: TIGER)
+        if krx_loader.ready:
+            krx_results = krx_loader.search(query, limit=10)
+            candidates.extend(krx_results)
+        elif is_korean_query:
+            # 로드 전에는 하드 매핑 접두어 검색으로 대체 (네트워크 호출 없음)
+            candidates.extend(korean_prefix_matches(query))
             
         # 2. yfinance 검색 (영어 쿼리일 때 혹은 KRX 결과가 적을 때)
         # 단, KRX 결과가 충분하면(>5) 스킵하여 속도 향상
         if len(candidates) < 3 and not is_korean_query:
             try:
-                search = yf.Search(query, max_results=8)
-                yf_results = search.quotes
+                cache_key = query.strip().lower()
+                yf_results = _search_quotes_cache.get(cache_key)
+                if yf_results is None:
+                    search = await asyncio.to_thread(yf.Search, query, max_results=8)
+                    yf_results = search.quotes
+                    _search_quotes_cache.set(cache_key, yf_results)
                 
+                seen = {c['symbol'] for c in candidates}
                 for res in yf_results:
                     sym = res.get("symbol", "")
                     
                     # 중복 제거 (이미 KRX에서 찾은 심볼이면 스킵)
-                    if any(c['symbol'] == sym for c in candidates):
+                    if sym in seen:
                         continue
+                    seen.add(sym)
                         
                     is_kr = sym.endswith((".KS", ".KQ"))
                     candidates.append({
@@ -466,38 +839,13 @@ async def search_ticker(query: str):
                 logger.warning(f"yfinance search error: {e}")
         
         # 한국 주식 우선 정렬
-        candidates.sort(key=lambda x: x['is_korean'], reverse=True)
+        candidates.sort(key=itemgetter('is_korean'), reverse=True)
             
-        return {"query": query, "candidates": candidates[:15]}
+        return FastJSONResponse({"query": query, "candidates": candidates[:15]})
         
     except Exception as e:
         logger.error(f"Search error: {e}")
-        return {"query": query, "candidates": []}
-
-import numpy as np
-
-def safe_serialize(data):
-    """JSON 직렬화 불가능한 객체(NaN, Timestamp, Numpy 등) 처리"""
-    if isinstance(data, dict):
-        return {k: safe_serialize(v) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [safe_serialize(v) for v in data]
-    elif isinstance(data, (pd.Timestamp, pd.Period)):
-        return str(data)
-    elif pd.isna(data):  # NaN, NaT -> None
-        return None
-    elif isinstance(data, (pd.Series, pd.DataFrame)):
-        return data.where(pd.notnull(data), None).to_dict() # NaN 처리 포함
-    elif isinstance(data, (np.integer, np.int64)):
-        return int(data)
-    elif isinstance(data, (np.floating, np.float64)):
-        return float(data) if not np.isnan(data) else None
-    elif isinstance(data, np.ndarray):
-        return data.tolist()
-    elif isinstance(data, (np.bool_, bool)):
-        return bool(data)
-    else:
-        return data
+        return FastJSONResponse({"query": query, "candidates": []})
 
 # ============================================
 # 신규 API 엔드포인트 (v2.0)
@@ -524,8 +872,8 @@ async def chat(req: ChatRequest, request: Request):
         if req.ticker:
             validate_ticker(req.ticker)
             
-        response = chat_assistant.chat(req.message, req.context)
-        return safe_serialize({
+        response = await asyncio.to_thread(chat_assistant.chat, req.message, req.context)
+        return FastJSONResponse({
             "message": req.message,
             "response": response,
             "timestamp": datetime.now().isoformat()
@@ -544,10 +892,10 @@ async def chat_suggestions(ticker: Optional[str] = None):
     try:
         context = {"ticker": ticker} if ticker else None
         suggestions = chat_assistant.suggest_questions(context)
-        return safe_serialize({"suggestions": suggestions})
+        return FastJSONResponse({"suggestions": suggestions})
     except Exception as e:
         logger.error(f"Suggestions error: {e}")
-        return {"suggestions": []}
+        return FastJSONResponse({"suggestions": []})
 
 @app.delete("/api/chat/history")
 async def clear_chat_history():
@@ -556,7 +904,7 @@ async def clear_chat_history():
     """
     try:
         chat_assistant.clear_history()
-        return {"status": "ok", "message": "Chat history cleared"}
+        return FastJSONResponse({"status": "ok", "message": "Chat history cleared"})
     except Exception as e:
         logger.error(f"Clear history error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -573,8 +921,6 @@ async def get_calendar(
     경제 이벤트 캘린더
     """
     try:
-        from datetime import datetime, timedelta
-        
         if not start_date:
             start_date = datetime.now().strftime("%Y-%m-%d")
         if not end_date:
@@ -584,14 +930,15 @@ async def get_calendar(
         if tickers:
             ticker_list = [validate_ticker(t.strip()) for t in tickers.split(",")]
         
-        calendar_data = event_calendar.get_calendar(
+        calendar_data = await asyncio.to_thread(
+            event_calendar.get_calendar,
             start_date=start_date,
             end_date=end_date,
             tickers=ticker_list,
             lang=lang
         )
         
-        return safe_serialize(calendar_data)
+        return FastJSONResponse(calendar_data)
     except HTTPException as he:
         raise he
     except Exception as e:
@@ -612,8 +959,8 @@ async def analyze_portfolio(req: PortfolioRequest, request: Request):
         for holding in req.holdings:
             validate_ticker(holding.get("ticker", "AA"))
             
-        result = portfolio_analyzer.analyze_portfolio(req.holdings)
-        return safe_serialize(result)
+        result = await asyncio.to_thread(portfolio_analyzer.analyze_portfolio, req.holdings)
+        return FastJSONResponse(result)
     except HTTPException as he:
         raise he
     except Exception as e:
@@ -621,6 +968,10 @@ async def analyze_portfolio(req: PortfolioRequest, request: Request):
         raise e
 
 # === AI 추천 종목 ===
+# 스크리닝은 종목 풀 전체 일괄 다운로드 + 다중 프로세스 분석이므로 결과를 짧게 캐시
+SCREENER_CACHE_TTL = 300
+_screener_cache = TTLCache(maxsize=64, ttl=SCREENER_CACHE_TTL)
+
 @app.get("/api/screener/recommendations")
 async def get_recommendations(
     style: Optional[str] = "balanced",
@@ -631,12 +982,15 @@ async def get_recommendations(
     AI 추천 종목 스크리닝
     """
     try:
-        recommendations = screener.get_recommendations(
-            style=style,
-            market=market,
-            limit=limit
-        )
-        return safe_serialize(recommendations)
+        key = ("recommendations", style, market, limit)
+        recommendations = _screener_cache.get(key)
+        if recommendations is None:
+            # 블로킹 스크리닝은 워커 스레드에서 실행 (이벤트 루프 점유 방지)
+            recommendations = await asyncio.to_thread(
+                screener.get_recommendations, style=style, market=market, limit=limit
+            )  # 지표 계산은 워커 프로세스당 하나인 공유 프로세스 풀에서 수행 (최초 요청 시 생성)
+            _screener_cache.set(key, recommendations)
+        return FastJSONResponse(recommendations)
     except Exception as e:
         logger.error(f"Screener error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -647,13 +1001,31 @@ async def get_top_movers(market: str = "US"):
     급등/급락 종목
     """
     try:
-        movers = screener.get_top_movers(market=market)
-        return safe_serialize(movers)
+        key = ("top_movers", market)
+        movers = _screener_cache.get(key)
+        if movers is None:
+            movers = await asyncio.to_thread(screener.get_top_movers, market=market)
+            _screener_cache.set(key, movers, ttl=60)  # 시세 변동률은 1분만 캐시
+        return FastJSONResponse(movers)
     except Exception as e:
         logger.error(f"Top movers error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 # === 다중 시간 프레임 분석 ===
+def _summarize_timeframes(timeframes: Dict[str, Optional[pd.DataFrame]]) -> Dict[str, Dict[str, Any]]:
+    """시간 프레임별 현재가/추세/RSI 요약"""
+    analyses = {}
+    for interval, df in timeframes.items():
+        if df is not None and not df.empty:
+            # 간단한 기술적 분석 (상태 없는 분석기 싱글톤 재사용)
+            analyses[interval] = {
+                "interval": interval,
+                "current_price": float(df['Close'].iloc[-1]),
+                "trend": "상승" if df['Close'].iloc[-1] > df['Close'].iloc[-20] else "하락",
+                "rsi": float(technical_analyzer.calculate_rsi(df).iloc[-1]) if len(df) > 14 else None,
+            }
+    return analyses
+
 @app.get("/api/multi-timeframe/{ticker}")
 async def multi_timeframe_analysis(ticker: str):
     """
@@ -663,33 +1035,20 @@ async def multi_timeframe_analysis(ticker: str):
         # Validate Ticker
         validate_ticker(ticker)
         
-        final_ticker = get_final_ticker(ticker)
+        final_ticker = await asyncio.to_thread(get_final_ticker, ticker)
         
-        # 여러 시간 프레임 데이터 수집
-        timeframes = {
-            "1h": collector.get_ohlcv(final_ticker, period="60d", interval="60m"),
-            "4h": collector.get_ohlcv(final_ticker, period="120d", interval="1h"),
-            "1d": collector.get_ohlcv(final_ticker, period="1y", interval="1d"),
-            "1wk": collector.get_ohlcv(final_ticker, period="5y", interval="1wk"),
-        }
+        # 여러 시간 프레임 데이터 동시 수집 (지연 시간 = 합계 -> 최댓값)
+        pairs = [("1h", "60d", "60m"), ("4h", "120d", "1h"), ("1d", "1y", "1d"), ("1wk", "5y", "1wk")]
+        dfs = await asyncio.gather(*[
+            asyncio.to_thread(get_ohlcv_cached, final_ticker, period, yf_interval)
+            for _, period, yf_interval in pairs
+        ])
+        timeframes = dict(zip((label for label, _, _ in pairs), dfs))
         
-        # 각 시간 프레임별 분석
-        analyses = {}
-        for interval, df in timeframes.items():
-            if df is not None and not df.empty:
-                # 간단한 기술적 분석
-                from src.agents.analyst import TechnicalAnalyzer
-                ta = TechnicalAnalyzer()
-                
-                analysis = {
-                    "interval": interval,
-                    "current_price": float(df['Close'].iloc[-1]),
-                    "trend": "상승" if df['Close'].iloc[-1] > df['Close'].iloc[-20] else "하락",
-                    "rsi": float(ta.calculate_rsi(df).iloc[-1]) if len(df) > 14 else None,
-                }
-                analyses[interval] = analysis
+        # 각 시간 프레임별 분석 (RSI 계산은 워커 스레드에서 -> 이벤트 루프 점유 방지)
+        analyses = await asyncio.to_thread(_summarize_timeframes, timeframes)
         
-        return safe_serialize({
+        return FastJSONResponse({
             "ticker": final_ticker,
             "timeframes": analyses,
             "timestamp": datetime.now().isoformat()
@@ -700,29 +1059,99 @@ async def multi_timeframe_analysis(ticker: str):
         logger.error(f"Multi-timeframe error: {e}")
         raise e
 
+# === 배치 요청 (여러 분석/차트 호출을 한 번의 왕복으로 처리) ===
+BATCH_MAX_REQUESTS = 20
+# 배치 하나에서 동시에 실행하는 하위 요청 수 (분석 스레드/외부 API 동시 호출 제한)
+BATCH_MAX_CONCURRENCY = 4
+
+class BatchItem(BaseModel):
+    path: str  # 예: "/analyze/AAPL", "/history/MSFT?interval=1d"
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem]
+
+async def _dispatch_batch_item(path: str) -> tuple:
+    """하위 요청 경로를 내부 코루틴으로 실행하고 (status, 본문 bytes) 반환"""
+    parsed = urlsplit(path)
+    parts = [p for p in parsed.path.split('/') if p]
+    query = dict(parse_qsl(parsed.query))
+    try:
+        if len(parts) == 2 and parts[0] == "analyze":
+            validate_ticker(parts[1])
+            result = await run_analysis(parts[1], lang=query.get("lang", "ko"))
+        elif len(parts) == 2 and parts[0] == "history":
+            result = await get_history(parts[1], interval=query.get("interval", "1d"))
+        else:
+            return 404, json_dumps({"detail": f"Unsupported batch path: {parsed.path}"})
+    except HTTPException as he:
+        return he.status_code, json_dumps({"detail": he.detail})
+    except Exception as e:
+        logger.error(f"Batch item error ({path}): {e}")
+        return 500, json_dumps({"detail": "Internal Server Error"})
+    
+    # get_history는 캐시된 JSON 바이트(Response)를 반환하므로 재파싱 없이 그대로 사용
+    if isinstance(result, StreamingResponse):
+        return result.status_code, b"".join([chunk async for chunk in result.body_iterator])
+    if isinstance(result, Response):
+        return result.status_code, bytes(result.body)
+    return 200, json_dumps(result)
+
+def _batch_path_kind(path: str) -> Optional[str]:
+    """하위 요청 경로 종류 ("analyze" / "history", 그 외 None)"""
+    parts = [p for p in urlsplit(path).path.split('/') if p]
+    return parts[0] if len(parts) == 2 and parts[0] in ("analyze", "history") else None
+
+@app.post("/api/batch")
+@limiter.limit("10/minute")
+async def batch(req: BatchRequest, request: Request):
+    """
+    여러 /analyze, /history 하위 요청을 동시에 실행해 한 번에 반환
+    하위 요청은 /analyze, /history와 같은 한도를 요청 수만큼 차감, 동시 실행은 BATCH_MAX_CONCURRENCY개로 제한
+    """
+    if len(req.requests) > BATCH_MAX_REQUESTS:
+        raise HTTPException(status_code=400, detail=f"Too many batch requests (max {BATCH_MAX_REQUESTS})")
+    
+    paths = [item.path for item in req.requests]
+    kinds = [_batch_path_kind(p) for p in paths]
+    _charge_rate_limits(request, {scope: kinds.count(scope) for scope in _RATE_LIMITS})
+    
+    semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+    async def run(path: str) -> tuple:
+        async with semaphore:
+            return await _dispatch_batch_item(path)
+    outcomes = await asyncio.gather(*(run(p) for p in paths))
+    
+    # 하위 응답 본문(이미 직렬화된 bytes)을 이어 붙여 최종 JSON 구성
+    items = [
+        b'{"path":' + json_dumps(p) + b',"status":' + str(status).encode() + b',"body":' + body + b'}'
+        for p, (status, body) in zip(paths, outcomes)
+    ]
+    return Response(content=b'{"results":[' + b','.join(items) + b']}', media_type="application/json")
+
 
 
-# === 헬스 체크 ===
 # === 트레이딩 사전 ===
+# 전체 사전은 정적 데이터이므로 모듈 로드 시 한 번만 직렬화
+_INDICATOR_DESCRIPTIONS_JSON = json_dumps(INDICATOR_DESCRIPTIONS)
+
 @app.get("/api/dictionary")
 async def get_trading_dictionary(indicator_id: Optional[str] = None, view: str = "beginner"):
     """
     트레이딩 용어 및 지표 설명 (초보자/전문가 관점 분리)
     """
-    from src.utils.dictionary import INDICATOR_DESCRIPTIONS, get_explanation
-    
     if indicator_id:
         explanation = get_explanation(indicator_id, view)
-        return {"id": indicator_id, "explanation": explanation}
+        return FastJSONResponse({"id": indicator_id, "explanation": explanation})
     
-    return INDICATOR_DESCRIPTIONS
+    return Response(content=_INDICATOR_DESCRIPTIONS_JSON, media_type="application/json")
 
+# === 헬스 체크 ===
 @app.get("/api/health")
 async def health_check():
     """
     API 서버 상태 확인
     """
-    return {
+    return FastJSONResponse({
         "status": "healthy",
         "version": "2.0.0",
         "features": {
@@ -734,6 +1163,53 @@ async def health_check():
             "dictionary": True
         },
         "timestamp": datetime.now().isoformat()
-    }
+    })
 
-# 실행용: uvicorn src.api.server:app --reload --host 0.0.0.0 --port 8000
+# === 이벤트 루프 선택 ===
+def _kernel_supports_io_uring() -> bool:
+    """리눅스 커널 5.11 이상 여부 (io_uring 소켓 연산 지원)"""
+    try:
+        major, minor = (int(p) for p in platform.release().split('.')[:2])
+    except ValueError:
+        return False
+    return (major, minor) >= (5, 11)
+
+def install_event_loop_policy() -> str:
+    """
+    사용 가능한 가장 빠른 이벤트 루프 정책 설치
+    리눅스(5.11+): uringcore(io_uring) -> uvloop -> 기본 asyncio 순으로 대체
+    """
+    if sys.platform == "linux" and _kernel_supports_io_uring():
+        try:
+            import uringcore
+            asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+            return "uringcore"
+        except ImportError:
+            pass
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return "uvloop"
+    except ImportError:
+        return "asyncio"
+
+def _http_protocol() -> str:
+    """httptools(C 파서)가 설치되어 있으면 사용, 없으면 h11"""
+    try:
+        import httptools  # noqa: F401
+        return "httptools"
+    except ImportError:
+        return "h11"
+
+# 실행용 (개발): uvicorn src.api.server:app --reload --host 0.0.0.0 --port 8000
+# 실행용 (운영, uvicorn[standard] 필요): uvicorn src.api.server:app --loop uvloop --http httptools --workers 4 --host 0.0.0.0 --port 8000
+# 실행용 (운영, 싱글톤 preload 후 fork): scripts/serve.sh (gunicorn + UvicornWorker, WEB_CONCURRENCY=워커 수)
+# 실행용 (io_uring/uvloop 루프 적용): python -m src.api.server
+if __name__ == "__main__":
+    import uvicorn
+    
+    loop_name = install_event_loop_policy()
+    http_name = _http_protocol()
+    logger.info(f"Event loop policy: {loop_name}, HTTP protocol: {http_name}")
+    # 정책이 이미 설치되었으므로 uvicorn은 기본 asyncio 팩토리로 루프를 생성 (정책 존중)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="asyncio", http=http_name)
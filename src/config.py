@@ -25,6 +25,9 @@ CHART_DIR.mkdir(parents=True, exist_ok=True)
 # ===========================================
 DB_PATH = os.getenv("DB_PATH", "trading_assistant.db")
 
+# OHLCV parquet 디스크 캐시 사용 여부 (OHLCV_FILE_CACHE=0 이면 매번 원본 수집, 디스크 기록 없음)
+OHLCV_FILE_CACHE = os.getenv("OHLCV_FILE_CACHE", "1") == "1"
+
 # ===========================================
 # API 키 (환경변수에서 로드)
 # ===========================================
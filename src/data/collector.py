@@ -1,27 +1,86 @@
 import yfinance as yf
+import numpy as np
 import pandas as pd
 import logging
 import time as time_module # 변수 이름 충돌 방지
-import requests
 import json
+import re
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from .storage import DataStorage
+from .ohlcv_cache import OHLCVFileCache
+from src.config import OHLCV_FILE_CACHE
+from src.utils.cache import TTLCache
+from src.utils.http_session import backoff_delay, get_session
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# get_smart_data_batch에서 yf.download 한 번에 묶는 종목 수
+SMART_BATCH_SIZE = 20
+# Ticker.history와 같은 컬럼 구성 (get_ohlcv와 file_cache 키를 공유하므로 형식을 맞춤)
+HISTORY_COLUMNS = ["Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits"]
+# get_ohlcv_batch_kr 동시 수집 종목 수 (Naver 차단 방지를 위해 보수적으로 제한)
+KR_BATCH_WORKERS = 8
+
+# 실시간 시세 프로세스 공용 캐시 (30초): 한 분석 흐름 내 중복 조회 및 get_ohlcv 패치 호출 재사용
+_realtime_cache = TTLCache(maxsize=512, ttl=30)
+# get_realtime_batch 동시 요청 수 (공유 세션 pool_maxsize 이내)
+REALTIME_BATCH_WORKERS = 16
+
+_KR_TICKER_RE = re.compile(r"([0-9]{6})(?:\.K[SQ])?")
+
+@lru_cache(maxsize=4096)
+def classify_ticker(ticker: str) -> Tuple[bool, str]:
+    """(한국 종목 여부, 접미사 제거 코드) - 6자리 숫자(+ .KS/.KQ)면 한국 종목"""
+    m = _KR_TICKER_RE.fullmatch(ticker)
+    return (True, m.group(1)) if m else (False, ticker)
+
+def to_datetime_index(dates: pd.Series) -> pd.DatetimeIndex:
+    """
+    get_ohlcv의 'Date' 컬럼 -> DatetimeIndex
+    이미 datetime이면 그대로 사용, ISO 문자열은 numpy 파서로 변환 (pd.to_datetime 형식 추론보다 수 배 빠름)
+    """
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return pd.DatetimeIndex(dates)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # 시간대 포함 문자열은 numpy가 UTC로 바꾸므로 pandas 파서로 대체
+            return pd.DatetimeIndex(dates.to_numpy().astype("datetime64[ns]"), name=dates.name)
+    except (ValueError, TypeError, UserWarning):
+        return pd.DatetimeIndex(pd.to_datetime(dates))
+
+def format_ohlcv_dates(dates: pd.Series, interval: str) -> pd.Series:
+    """
+    datetime 'Date' 컬럼 -> get_ohlcv 문자열 형식 ('%Y-%m-%d' / 분·시간봉 '%Y-%m-%d %H:%M')
+    dt.strftime(행 단위 포맷팅) 대신 numpy datetime_as_string으로 일괄 변환, NaT는 NaN 유지
+    """
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)  # 거래소 현지 시각 유지 (strftime과 동일)
+    values = dates.to_numpy(dtype="datetime64[ns]")
+    if interval in ["1d", "1wk", "1mo"]:
+        formatted = np.datetime_as_string(values, unit="D")
+    else:
+        formatted = np.char.replace(np.datetime_as_string(values, unit="m"), "T", " ")
+    return pd.Series(formatted, index=dates.index, name=dates.name).where(dates.notna())
+
 class MarketDataCollector:
     """
     Collects market data using yfinance.
     Adheres to the "Advisory Only" principle by providing data for analysis, not execution.
     """
     
-    def __init__(self, data_dir: str = "./data", use_db: bool = True):
+    def __init__(self, data_dir: str = "./data", use_db: bool = True, use_file_cache: bool = OHLCV_FILE_CACHE):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.db = DataStorage() if use_db else None
+        # OHLCV parquet 디스크 캐시 (재시작/다중 워커 간 공유, 인터벌별 TTL)
+        self.file_cache = OHLCVFileCache(self.data_dir / ".cache" / "ohlcv") if use_file_cache else None
+        self._session = get_session()  # Naver 폴링 등 직접 HTTP 호출용 공유 세션 (keep-alive)
         
     def get_smart_data(self, ticker: str) -> Dict[str, Optional[pd.DataFrame]]:
         """
@@ -33,14 +92,114 @@ class MarketDataCollector:
         }
         return results
 
+    def get_smart_data_batch(self, tickers: List[str]) -> Dict[str, Dict[str, Optional[pd.DataFrame]]]:
+        """
+        여러 종목의 get_smart_data를 한 번에 수집
+        Yahoo 종목은 yf.download로 SMART_BATCH_SIZE개씩 묶어 요청 (종목당 왕복 대신 묶음당 왕복)
+        한국 일봉(FDR)은 get_ohlcv_batch_kr로 병렬 수집, 묶음 요청에서 빠진 종목은 기존 단건 경로로 수집
+        """
+        frames = {"daily": ("1y", "1d"), "hourly": ("60d", "60m")}
+        results: Dict[str, Dict[str, Optional[pd.DataFrame]]] = {t: {} for t in dict.fromkeys(tickers)}
+
+        for key, (period, interval) in frames.items():
+            pending, kr_pending = [], []
+            for ticker in results:
+                cached = self.file_cache.get(ticker, period, interval) if self.file_cache else None
+                if cached is not None:
+                    results[ticker][key] = cached
+                elif classify_ticker(ticker)[0] and interval in ['1d', '1wk', '1mo']:
+                    kr_pending.append(ticker)
+                else:
+                    pending.append(ticker)
+
+            for ticker, df in self.get_ohlcv_batch_kr(kr_pending, period=period, interval=interval).items():
+                results[ticker][key] = df
+
+            for i in range(0, len(pending), SMART_BATCH_SIZE):
+                chunk = pending[i:i + SMART_BATCH_SIZE]
+                batch = self._download_batch(chunk, period, interval)
+                for ticker in chunk:
+                    df = batch.get(ticker)
+                    if df is None:
+                        # 묶음 응답에 없으면 단건 경로 (재시도/한국 분봉 -> 일봉 대체 포함)
+                        df = self.get_ohlcv(ticker, period=period, interval=interval)
+                    results[ticker][key] = df
+        return results
+
+    def get_ohlcv_batch_kr(self, tickers: List[str], period: str = "1y",
+                           interval: str = "1d") -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        한국 종목 OHLCV 병렬 수집
+        FDR은 다중 종목 요청을 지원하지 않으므로 종목별 get_ohlcv(캐시/재시도/실시간 패치 포함)를 동시에 실행
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if not tickers:
+            return {}
+        fetch = lambda ticker: self.get_ohlcv(ticker, period=period, interval=interval)
+        with ThreadPoolExecutor(max_workers=min(KR_BATCH_WORKERS, len(tickers))) as executor:
+            return dict(zip(tickers, executor.map(fetch, tickers)))
+
+    def _download_batch(self, tickers: List[str], period: str, interval: str) -> Dict[str, pd.DataFrame]:
+        """yf.download 한 번으로 여러 종목 OHLCV 수집 후 종목별로 분리 (get_ohlcv와 같은 형식)"""
+        try:
+            raw = yf.download(tickers, period=period, interval=interval, group_by="ticker",
+                              threads=True, progress=False, auto_adjust=True, actions=True)
+        except Exception as e:
+            logger.error(f"Batch download error ({len(tickers)} tickers, {interval}): {e}")
+            return {}
+        if raw is None or raw.empty:
+            return {}
+
+        out = {}
+        symbols = raw.columns.get_level_values(0) if isinstance(raw.columns, pd.MultiIndex) else None
+        for ticker in tickers:
+            if symbols is None or ticker not in symbols:
+                continue
+            # 종목별 거래일이 달라 합쳐진 인덱스에 생긴 빈 행 제거
+            # 배당/분할 컬럼이 없는 응답은 0으로 채워 get_ohlcv 결과와 형식 통일
+            df = raw[ticker].reindex(columns=HISTORY_COLUMNS).dropna(how="all", subset=HISTORY_COLUMNS[:5])
+            if df.empty:
+                continue
+            df = df.fillna({"Dividends": 0.0, "Stock Splits": 0.0})
+            df = df.rename_axis('Date').reset_index()
+            df['Date'] = format_ohlcv_dates(df['Date'], interval)
+            df.columns.name = None
+
+            if self.db:
+                self.db.save_price_history_async(ticker, df)
+            if self.file_cache:
+                self.file_cache.set(ticker, period, interval, df)
+            out[ticker] = df
+        return out
+
     def get_realtime_data(self, ticker: str) -> Dict[str, Any]:
         """
         실시간 시세 데이터 조회 (Naver/Yahoo)
         한국 주식: Naver Polling API
         미국 주식: yfinance
         """
-        clean_ticker = ticker.replace('.KS', '').replace('.KQ', '')
-        is_korean = clean_ticker.isdigit() and len(clean_ticker) == 6
+        cached = _realtime_cache.get(ticker)
+        if cached is not None:
+            return dict(cached)
+        realtime_data = self._fetch_realtime_data(ticker)
+        if realtime_data.get("current_price") is not None:
+            _realtime_cache.set(ticker, realtime_data)
+        return dict(realtime_data)
+
+    def get_realtime_batch(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목 실시간 시세를 병렬 조회 (종목 수만큼의 왕복 지연을 겹쳐서 처리)
+        공유 세션 연결 풀과 30초 캐시는 get_realtime_data와 동일하게 적용
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if not tickers:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(REALTIME_BATCH_WORKERS, len(tickers))) as executor:
+            return dict(zip(tickers, executor.map(self.get_realtime_data, tickers)))
+
+    def _fetch_realtime_data(self, ticker: str) -> Dict[str, Any]:
+        """실시간 시세 원본 조회 (캐시 미적용)"""
+        is_korean, clean_ticker = classify_ticker(ticker)
         
         realtime_data = {
             "current_price": None,
@@ -55,8 +214,7 @@ class MarketDataCollector:
             try:
                 # Naver Polling API
                 url = f"https://polling.finance.naver.com/api/realtime?query=SERVICE_ITEM:{clean_ticker}"
-                headers = {'User-Agent': 'Mozilla/5.0'}
-                res = requests.get(url, headers=headers, timeout=5)
+                res = self._session.get(url, timeout=5)
                 
                 if res.status_code == 200:
                     data = res.json()
@@ -108,12 +266,26 @@ class MarketDataCollector:
         """
         OHLCV 데이터를 수집하며, 실패 시 재시도 로직을 포함함.
         한국 주식은 FinanceDataReader(네이버), 미국 주식은 yfinance 사용.
+        TTL 이내의 디스크 캐시가 있으면 네트워크 호출 없이 반환.
+        반환되는 DataFrame은 호출마다 새로 생성되므로 호출자가 복사 없이 수정해도 됨.
         """
+        if self.file_cache:
+            cached = self.file_cache.get(ticker, period, interval)
+            if cached is not None:
+                logger.debug(f"OHLCV disk cache hit: {ticker} {period}/{interval}")
+                return cached
+        
+        df = self._fetch_ohlcv(ticker, period, interval, retries)
+        if self.file_cache and df is not None and not df.empty:
+            self.file_cache.set(ticker, period, interval, df)
+        return df
+
+    def _fetch_ohlcv(self, ticker: str, period: str, interval: str, retries: int) -> Optional[pd.DataFrame]:
+        """원본 소스(FDR/yfinance)에서 OHLCV 수집 (재시도 포함)"""
         import FinanceDataReader as fdr
         
-        # 한국 종목 판별 (6자리 숫자)
-        clean_ticker = ticker.replace('.KS', '').replace('.KQ', '')
-        is_korean = clean_ticker.isdigit() and len(clean_ticker) == 6
+        # 한국 종목 판별 (6자리 숫자, .KS/.KQ 접미사 허용)
+        is_korean, clean_ticker = classify_ticker(ticker)
         
         for attempt in range(retries):
             try:
@@ -142,21 +314,15 @@ class MarketDataCollector:
                         return self.get_ohlcv(ticker, period="1y", interval="1d", retries=1)
                         
                     if attempt < retries - 1:
-                        time_module.sleep(1)
+                        time_module.sleep(backoff_delay(attempt))
                         continue
                     logger.warning(f"No data found for {ticker}")
                     return None
                     
                 # Clean data & Standardize Columns
-                if is_korean and interval in ['1d', '1wk', '1mo']:
-                    # fdr은 인덱스가 Date이므로 reset
-                    df.reset_index(inplace=True)
-                    # 컬럼명 통일 (Change 등을 제외하고 필수 컬럼만)
-                    pass 
-                else:
-                    # yfinance
-                    df.index.name = 'Date'
-                    df.reset_index(inplace=True)
+                # fdr/yfinance 모두 날짜가 인덱스 -> 이름을 'Date'로 통일해 컬럼으로 한 번만 reset
+                df.index.name = 'Date'
+                df.reset_index(inplace=True)
                 
                 # 날짜 타입 변환 및 포맷팅
                 if 'Date' in df.columns:
@@ -164,61 +330,40 @@ class MarketDataCollector:
                         df['Date'] = pd.to_datetime(df['Date'])
                         
                         # [실시간 데이터 패치] - 오늘 날짜 데이터가 없으면 실시간 가격 추가
-                        if is_korean and interval == '1d':
-                            last_date = df['Date'].iloc[-1].date()
+                        # 오늘 봉이 이미 있으면 추가할 것이 없으므로 실시간 조회 자체를 생략 (첫 시도에만 패치)
+                        if is_korean and interval == '1d' and attempt == 0:
                             today = datetime.now().date()
-                            
-                            # 마지막 데이터가 오늘이 아니면 실시간 조회 시도... (단, 장중이거나 장마감 직후)
-                            if last_date < today or (datetime.now().hour >= 9 and datetime.now().hour < 16):
-                                # 첫 시도에만 패치
-                                if attempt == 0:
-                                    rt = self.get_realtime_data(ticker)
-                                    if rt and rt.get('current_price'):
-                                        # 이미 오늘 날짜가 있으면 업데이트, 없으면 추가
-                                        # 간단하게: 오늘 날짜가 있으면 drop하고 새로 추가?
-                                        # 아니면 그냥 마지막 row 확인.
-                                        
-                                        # 여기선 간단히: 오늘 날짜가 마지막 row 날짜와 같으면 pass (이미 있을 수 있음)
-                                        # 다르다면 append
-                                        if last_date != today:
-                                            new_row = pd.DataFrame([{
-                                                'Date': pd.Timestamp(today),
-                                                'Open': rt['current_price'], # 시가 정보 부족 시 현재가 대체
-                                                'High': rt['current_price'],
-                                                'Low': rt['current_price'],
-                                                'Close': rt['current_price'],
-                                                'Volume': rt['volume'],
-                                                'Change': rt['change_rate'] / 100 if rt.get('change_rate') else 0
-                                            }])
-                                            if not new_row.empty:
-                                                df = pd.concat([df, new_row], ignore_index=True)
-
-                        if interval in ["1d", "1wk", "1mo"]:
-                            df['Date'] = df['Date'].dt.strftime('%Y-%m-%d')
-                        else:
-                            df['Date'] = df['Date'].dt.strftime('%Y-%m-%d %H:%M')
+                            if df['Date'].iloc[-1].date() < today:
+                                rt = self.get_realtime_data(ticker)
+                                if rt and rt.get('current_price'):
+                                    price = rt['current_price']  # 시가 정보 부족 시 현재가 대체
+                                    new_row = {
+                                        'Date': pd.Timestamp(today),
+                                        'Open': price,
+                                        'High': price,
+                                        'Low': price,
+                                        'Close': price,
+                                        'Volume': rt['volume'],
+                                        'Change': rt['change_rate'] / 100 if rt.get('change_rate') else 0
+                                    }
+                                    # 1행 DataFrame 생성 + concat 대신 라벨 지정으로 바로 추가 (dtype 유지, 누락 컬럼은 NaN)
+                                    df.loc[len(df)] = new_row
+
+                        df['Date'] = format_ohlcv_dates(df['Date'], interval)
                     except Exception as e:
                         logger.warning(f"Date formatting/patching error: {e}")
                 
-                # DB 저장
+                # DB 저장 (백그라운드 스레드, 실패는 저장소에서 로깅)
                 if self.db:
-                    try:
-                        self.db.save_price_history(ticker, df)
-                    except Exception as e:
-                        logger.error(f"DB save error for {ticker}: {e}")
+                    self.db.save_price_history_async(ticker, df)
                 
                 # [패치] FastAPI JSON 직렬화 오류 방지 (numpy.int64 -> int/float)
+                # (Date는 위에서 이미 컬럼으로 reset되어 인덱스 재확인 불필요)
                 if not df.empty:
-                    # 인덱스가 Date인 경우 리셋 (FinanceDataReader 대응)
-                    if isinstance(df.index, pd.DatetimeIndex):
-                         df.reset_index(inplace=True)
-                         if 'Date' not in df.columns: # 인덱스 이름이 없을 경우
-                             df.rename(columns={'index': 'Date'}, inplace=True)
-
-                    df = df.astype(object) 
+                    # 이미 숫자형인 컬럼은 그대로 두고, 그 외 컬럼만 숫자로 변환 (실패 시 NaN)
+                    # (전체 astype(object) 복사 후 재변환하지 않음)
                     for col in df.columns:
-                        if col == 'Date': continue
-                        # 강제로 숫자로 변환 (실패 시 NaN)
+                        if col == 'Date' or pd.api.types.is_numeric_dtype(df[col]): continue
                         df[col] = pd.to_numeric(df[col], errors='coerce')
                             
                 return df
@@ -226,7 +371,7 @@ class MarketDataCollector:
             except Exception as e:
                 logger.error(f"Error on attempt {attempt+1}: {e}")
                 if attempt < retries - 1:
-                    time_module.sleep(1)
+                    time_module.sleep(backoff_delay(attempt))
                 else:
                     return None
         return None
@@ -2,15 +2,38 @@
 FRED API 연동 - 무료 거시 경제 지표
 Trading Economics 대체용
 """
-import requests
+import numpy as np
 import pandas as pd
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
+import io
 import os
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.json as pa_json
+except ImportError:  # pyarrow 미설치 시 orjson + pandas 파싱으로 대체
+    pa = None
+
+from src.utils.cache import TTLCache
+from src.utils.http_session import get_session
+from src.utils.serializer import loads as json_loads
+
 logger = logging.getLogger(__name__)
 
+# 스냅샷에서 최신 값 조회 시 요청하는 기간 (월간 지표의 발표 지연을 고려)
+LATEST_LOOKBACK_DAYS = 120
+
+# get_series 캐시 TTL (초): 일간 시리즈는 1시간, 월/분기 지표(CPI, UNRATE, GDP 등)는 하루 1회 이하 갱신이므로 24시간
+FRED_DAILY_SERIES = {"DFF", "DGS10", "DGS2", "VIXCLS"}
+FRED_DAILY_CACHE_TTL = 3600
+FRED_DEFAULT_CACHE_TTL = 24 * 3600
+
 class FREDDataProvider:
     """
     Federal Reserve Economic Data (FRED) API 클라이언트
@@ -40,15 +63,20 @@ class FREDDataProvider:
         "housing_starts": "HOUST"  # Housing Starts
     }
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache_dir: Optional[str] = "./data/.cache/fred"):
         """
         Args:
             api_key: FRED API 키 (https://fred.stlouisfed.org/docs/api/api_key.html)
+            cache_dir: get_series 결과 parquet 캐시 경로 (None이면 메모리 캐시만 사용)
         """
         self.api_key = api_key or os.getenv("FRED_API_KEY")
         
         if not self.api_key:
             logger.warning("FRED_API_KEY가 설정되지 않았습니다. 일부 기능이 제한될 수 있습니다.")
+        self._session = get_session()  # keep-alive 공유 세션 (병렬 요청 간 TLS 연결 재사용)
+        # (series_id, start, end) -> DataFrame: 메모리 -> 디스크 순으로 조회, 둘 다 없을 때만 HTTP 요청
+        self._cache = TTLCache(maxsize=256, ttl=FRED_DEFAULT_CACHE_TTL)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
     
     def get_series(self, 
                    series_id: str,
@@ -69,6 +97,22 @@ class FREDDataProvider:
             logger.error("API 키가 필요합니다.")
             return None
         
+        key = (series_id, start_date, end_date)
+        ttl = FRED_DAILY_CACHE_TTL if series_id in FRED_DAILY_SERIES else FRED_DEFAULT_CACHE_TTL
+        df = self._cache.get(key)
+        if df is None:
+            df = self._read_disk_cache(key, ttl)
+        if df is None:
+            df = self._fetch_series(series_id, start_date, end_date)
+            if df is None:
+                return None  # 실패는 캐시하지 않음
+            # 메모리 TTL은 조회 시점부터 계산되므로 디스크 적중 값은 메모리에 다시 올리지 않음
+            self._cache.set(key, df, ttl=ttl)
+            self._write_disk_cache(key, df, ttl)
+        return df.copy()
+
+    def _fetch_series(self, series_id: str, start_date: Optional[str], end_date: Optional[str]) -> Optional[pd.DataFrame]:
+        """FRED API에서 시계열 조회 (캐시 미적용)"""
         params = {
             "series_id": series_id,
             "api_key": self.api_key,
@@ -81,29 +125,103 @@ class FREDDataProvider:
             params["observation_end"] = end_date
         
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.BASE_URL}/series/observations",
                 params=params,
                 timeout=10
             )
             response.raise_for_status()
             
-            data = response.json()
-            observations = data.get("observations", [])
-            
-            if not observations:
-                return None
-            
-            df = pd.DataFrame(observations)
-            df['date'] = pd.to_datetime(df['date'])
-            df['value'] = pd.to_numeric(df['value'], errors='coerce')
-            df = df[['date', 'value']].dropna()
-            
-            return df
+            return self._parse_observations(response.content)
             
         except Exception as e:
             logger.error(f"FRED 데이터 조회 실패 ({series_id}): {e}")
             return None
+
+    @staticmethod
+    def _parse_observations(content: bytes) -> Optional[pd.DataFrame]:
+        """
+        FRED observations JSON -> DataFrame(date, value)
+        pyarrow 컬럼 단위 파서 우선 (날짜/숫자 변환을 C++에서 처리), 실패 시 orjson + pandas 경로
+        """
+        if pa is not None:
+            try:
+                table = pa_json.read_json(
+                    io.BytesIO(content), read_options=pa_json.ReadOptions(block_size=len(content) + 1)
+                )
+                observations = table.column("observations")[0].values
+                if observations is None or len(observations) == 0:
+                    return None
+                values = observations.field("value")
+                keep = pc.not_equal(values, ".")  # FRED 결측 표기(".") 제외
+                df = pd.DataFrame({
+                    'date': pc.cast(pc.filter(observations.field("date"), keep), pa.timestamp("ns")).to_pandas(),
+                    'value': pc.cast(pc.filter(values, keep), pa.float64()).to_numpy(),
+                })
+                return df if not df.empty else None
+            except (pa.ArrowException, KeyError, TypeError, ValueError):
+                pass  # 예상과 다른 스키마/값은 아래 경로에서 처리
+        
+        data = json_loads(content)
+        # 필요한 두 필드만 추출, FRED 결측 표기(".")는 여기서 제외
+        rows = [(o["date"], o["value"]) for o in data.get("observations", []) if o["value"] != "."]
+        
+        if not rows:
+            return None
+        
+        df = pd.DataFrame.from_records(rows, columns=['date', 'value'])
+        df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d')
+        df['value'] = pd.to_numeric(df['value'], errors='coerce').astype('float64')
+        
+        return df.dropna().reset_index(drop=True)
+
+    def _cache_path(self, key: tuple) -> Path:
+        series_id, start_date, end_date = key
+        return self.cache_dir / f"{series_id}_{start_date or 'all'}_{end_date or 'latest'}.parquet"
+
+    def _read_disk_cache(self, key: tuple, ttl: float) -> Optional[pd.DataFrame]:
+        """파일 수정 시각 기준 TTL 이내의 parquet 캐시 반환 (없거나 만료/손상 시 None)"""
+        if not self.cache_dir:
+            return None
+        path = self._cache_path(key)
+        try:
+            if time.time() - path.stat().st_mtime >= ttl:
+                return None
+            return pd.read_parquet(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"FRED disk cache read error ({path.name}): {e}")
+            return None
+
+    def _write_disk_cache(self, key: tuple, df: pd.DataFrame, ttl: float):
+        if not self.cache_dir:
+            return
+        path = self._cache_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            df.to_parquet(tmp_path, index=False)
+            tmp_path.replace(path)  # 원자적 교체 (다중 워커 동시 기록 대비)
+        except Exception as e:
+            logger.warning(f"FRED disk cache write error ({path.name}): {e}")
+            return
+        self._prune_disk_cache(key[0], ttl)
+
+    def _prune_disk_cache(self, series_id: str, ttl: float):
+        """
+        같은 시리즈의 만료된 parquet 파일 삭제
+        최근 구간 조회는 시작일이 오늘 기준으로 계산되어 날마다 새 파일이 생기므로 기록 시 함께 정리
+        """
+        now = time.time()
+        for old in self.cache_dir.glob(f"{series_id}_*.parquet"):
+            try:
+                if now - old.stat().st_mtime >= ttl:
+                    old.unlink()
+            except FileNotFoundError:
+                pass  # 다른 워커가 먼저 삭제
+            except OSError as e:
+                logger.warning(f"FRED disk cache prune error ({old.name}): {e}")
     
     def get_latest_value(self, series_id: str) -> Optional[float]:
         """최신 값 조회"""
@@ -112,6 +230,16 @@ class FREDDataProvider:
             return df['value'].iloc[-1]
         return None
     
+    def _get_series_parallel(self, requests_by_key: Dict[str, Optional[str]],
+                             end_date: Optional[str] = None) -> Dict[str, Optional[pd.DataFrame]]:
+        """{지표 키: 시작일} -> {지표 키: DataFrame}, 요청은 병렬 수행"""
+        with ThreadPoolExecutor(max_workers=len(requests_by_key)) as executor:
+            futures = {
+                key: executor.submit(self.get_series, self.SERIES_IDS[key], start_date=start, end_date=end_date)
+                for key, start in requests_by_key.items()
+            }
+        return {key: future.result() for key, future in futures.items()}
+    
     def get_macro_snapshot(self) -> Dict[str, Any]:
         """
         주요 거시 경제 지표 스냅샷
@@ -125,43 +253,58 @@ class FREDDataProvider:
                 ...
             }
         """
+        # 지표별 HTTP 요청을 병렬 수행 (총 지연 = 요청 수 x RTT -> 가장 느린 요청 1회)
+        # 최신 값만 필요한 지표는 최근 구간만 조회 (DFF 등 일간 시리즈 전체 이력 다운로드 방지)
+        recent_start = (datetime.now() - timedelta(days=LATEST_LOOKBACK_DAYS)).strftime("%Y-%m-%d")
+        cpi_start = (datetime.now() - timedelta(days=400)).strftime("%Y-%m-%d")
+        requests_by_key = {
+            "fed_funds_rate": recent_start,
+            "cpi": cpi_start,
+            "unemployment": recent_start,
+            "treasury_10y": recent_start,
+            "treasury_2y": recent_start,
+            "vix": recent_start,
+        }
+        series = self._get_series_parallel(requests_by_key)
+
+        def latest(key: str) -> Optional[float]:
+            df = series[key]
+            if df is not None and not df.empty:
+                return df['value'].iloc[-1]
+            return None
+
         snapshot = {}
         
         # 1. 연준 기준금리
-        fed_rate = self.get_latest_value(self.SERIES_IDS["fed_funds_rate"])
+        fed_rate = latest("fed_funds_rate")
         if fed_rate:
             snapshot["fed_funds_rate"] = round(fed_rate, 2)
         
         # 2. CPI (전년 대비 변화율)
-        cpi_df = self.get_series(
-            self.SERIES_IDS["cpi"],
-            start_date=(datetime.now() - timedelta(days=400)).strftime("%Y-%m-%d")
-        )
-        if cpi_df is not None and len(cpi_df) >= 12:
-            current_cpi = cpi_df['value'].iloc[-1]
-            year_ago_cpi = cpi_df['value'].iloc[-13]  # 12개월 전
-            cpi_yoy = ((current_cpi - year_ago_cpi) / year_ago_cpi * 100)
+        cpi_df = series["cpi"]
+        if cpi_df is not None and len(cpi_df) > 12:
+            cpi_yoy = cpi_df['value'].pct_change(12, fill_method=None).iloc[-1] * 100  # 12개월 전 대비
             snapshot["cpi_yoy"] = round(cpi_yoy, 2)
         
         # 3. 실업률
-        unemployment = self.get_latest_value(self.SERIES_IDS["unemployment"])
+        unemployment = latest("unemployment")
         if unemployment:
             snapshot["unemployment_rate"] = round(unemployment, 1)
         
         # 4. 10년물 국채 수익률
-        treasury_10y = self.get_latest_value(self.SERIES_IDS["treasury_10y"])
+        treasury_10y = latest("treasury_10y")
         if treasury_10y:
             snapshot["treasury_10y"] = round(treasury_10y, 2)
         
         # 5. 2년물 국채 수익률 (역전 여부 확인)
-        treasury_2y = self.get_latest_value(self.SERIES_IDS["treasury_2y"])
+        treasury_2y = latest("treasury_2y")
         if treasury_2y:
             snapshot["treasury_2y"] = round(treasury_2y, 2)
             if treasury_10y:
                 snapshot["yield_curve_inverted"] = treasury_2y > treasury_10y
         
         # 6. VIX (변동성 지수)
-        vix = self.get_latest_value(self.SERIES_IDS["vix"])
+        vix = latest("vix")
         if vix:
             snapshot["vix"] = round(vix, 2)
         
@@ -272,6 +415,57 @@ class FREDDataProvider:
             "recommendation": self._generate_macro_recommendation(score, grade)
         }
     
+    def analyze_macro_conditions_historical(self, start_date: str,
+                                            end_date: Optional[str] = None) -> pd.DataFrame:
+        """
+        월별 거시 경제 점수 이력 (analyze_macro_conditions와 같은 규칙을 월말 값에 벡터 연산으로 적용)
+        
+        Returns:
+            DataFrame (index: 월, columns: 지표 값 + score, grade)
+        """
+        # CPI 전년 대비 계산을 위해 1년 이상 앞서서 조회
+        fetch_start = (pd.Timestamp(start_date) - timedelta(days=400)).strftime("%Y-%m-%d")
+        keys = ["fed_funds_rate", "cpi", "unemployment", "treasury_10y", "treasury_2y", "vix"]
+        series = self._get_series_parallel(dict.fromkeys(keys, fetch_start), end_date=end_date)
+        
+        def monthly(key: str) -> pd.Series:
+            df = series[key]
+            if df is None or df.empty:
+                return pd.Series(dtype="float64", name=key)
+            values = df.set_index('date')['value']
+            return values.groupby(values.index.to_period("M")).last().rename(key)
+        
+        frame = pd.concat([monthly(key) for key in keys], axis=1)
+        frame.index = frame.index.to_timestamp()
+        frame["cpi"] = frame["cpi"].pct_change(12, fill_method=None) * 100
+        frame = frame.rename(columns={"cpi": "cpi_yoy", "unemployment": "unemployment_rate"})
+        frame = frame[frame.index >= pd.Timestamp(start_date).to_period("M").to_timestamp()]
+        # 스냅샷과 동일한 자릿수로 반올림 후 판정
+        frame = frame.round({"fed_funds_rate": 2, "cpi_yoy": 2, "unemployment_rate": 1,
+                             "treasury_10y": 2, "treasury_2y": 2, "vix": 2})
+        
+        rate, cpi = frame["fed_funds_rate"], frame["cpi_yoy"]
+        unemp, vix = frame["unemployment_rate"], frame["vix"]
+        inverted = frame["treasury_2y"] > frame["treasury_10y"]
+        spread = frame["treasury_10y"] - frame["treasury_2y"]
+        
+        # NaN 비교는 False -> 값이 없는 지표는 점수에 반영되지 않음 (스칼라 버전과 동일)
+        score = (
+            50
+            + np.where(rate < 2, 10, 0) + np.where(rate > 5, -10, 0)
+            + np.where(cpi < 2.5, 10, 0) + np.where(cpi > 4, -15, 0)
+            + np.where((unemp >= 3.5) & (unemp <= 4.5), 10, 0) + np.where(unemp > 5, -10, 0)
+            + np.where(inverted, -20, np.where(spread > 0.5, 5, 0))
+            + np.where(vix < 15, 5, 0) + np.where(vix > 25, -10, 0)
+        )
+        frame["score"] = np.clip(score, 0, 100)
+        frame["grade"] = np.select(
+            [frame["score"] >= 70, frame["score"] >= 50, frame["score"] >= 30],
+            ["우수", "양호", "주의"],
+            default="경계"
+        )
+        return frame
+    
     def _generate_macro_recommendation(self, score: int, grade: str) -> str:
         """거시 환경 기반 추천"""
         if score >= 70:
@@ -0,0 +1,61 @@
+"""
+OHLCV 디스크 캐시
+- (ticker, period, interval)별 parquet 파일, 파일 수정 시각 기준 TTL
+- 서버 재시작/다중 워커 간에도 같은 봉 데이터 재다운로드 방지
+"""
+import logging
+import time
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from src.utils.executors import LazyThreadPool
+
+logger = logging.getLogger(__name__)
+
+# 인터벌별 TTL (초): 분/시간봉은 짧게, 일봉은 장중 종가 갱신을 고려해 15분, 주/월봉은 1시간
+OHLCV_FILE_CACHE_TTL = {
+    "1m": 60, "5m": 60, "15m": 60, "30m": 60, "60m": 60, "1h": 60,
+    "1d": 900, "1wk": 3600, "1mo": 3600,
+}
+OHLCV_FILE_CACHE_DEFAULT_TTL = 60
+
+
+class OHLCVFileCache:
+    """collector.get_ohlcv 결과를 parquet로 저장/조회하는 TTL 캐시"""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        # 파일 기록은 단일 백그라운드 스레드에서 처리 (요청 스레드는 디스크 I/O 대기 없이 반환)
+        self._writer = LazyThreadPool(max_workers=1, thread_name_prefix="ohlcv-cache")
+
+    def _path(self, ticker: str, period: str, interval: str) -> Path:
+        return self.cache_dir / f"{ticker}_{interval}_{period}.parquet"
+
+    def get(self, ticker: str, period: str, interval: str) -> Optional[pd.DataFrame]:
+        """TTL 이내 캐시가 있으면 DataFrame 반환 (없거나 만료/손상 시 None)"""
+        path = self._path(ticker, period, interval)
+        ttl = OHLCV_FILE_CACHE_TTL.get(interval, OHLCV_FILE_CACHE_DEFAULT_TTL)
+        try:
+            if time.time() - path.stat().st_mtime >= ttl:
+                return None
+            return pd.read_parquet(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # pyarrow 미설치/파일 손상 시 원본 수집으로 대체
+            logger.warning(f"OHLCV disk cache read error ({path.name}): {e}")
+            return None
+
+    def set(self, ticker: str, period: str, interval: str, df: pd.DataFrame):
+        """백그라운드 기록 예약 (호출자가 반환된 df를 수정해도 되도록 복사본 기록)"""
+        self._writer.submit(self._write, self._path(ticker, period, interval), df.copy())
+
+    def _write(self, path: Path, df: pd.DataFrame):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            df.to_parquet(tmp_path, index=False)
+            tmp_path.replace(path)  # 원자적 교체 (다중 워커 동시 기록 대비)
+        except Exception as e:
+            logger.warning(f"OHLCV disk cache write error ({path.name}): {e}")
@@ -7,6 +7,18 @@ from .storage import DataStorage
 
 logger = logging.getLogger(__name__)
 
+# Mapping yfinance row names to our schema
+# "Total Liabilities Net Minority Interest" is common in yfinance for "Total Liabilities"
+INCOME_FIELDS = {
+    "Total Revenue": "revenue",
+    "Net Income": "net_income",
+    "Basic EPS": "eps",
+}
+BALANCE_FIELDS = {
+    "Total Assets": "total_assets",
+    "Total Liabilities Net Minority Interest": "total_liabilities",
+}
+
 class FinancialParser:
     """
     Fetches and parses financial statements (Income, Balance Sheet, Cash Flow).
@@ -35,50 +47,26 @@ class FinancialParser:
                 logger.warning(f"No financials found for {ticker}")
                 return False
                 
-            # We need to transpose/merge to get per-date records
-            # Common dates are usually columns
-            
-            # Extract common dates
+            # Transpose both statements to per-date rows and pick the mapped metrics in one reindex
+            # Note: yfinance row names can change, need robust matching in future
             dates = income_stmt.columns
+            metrics = pd.concat(
+                [self._pick_metrics(income_stmt, INCOME_FIELDS, dates),
+                 self._pick_metrics(balance_sheet, BALANCE_FIELDS, dates)],
+                axis=1
+            )
+            metrics = metrics.astype(object).where(metrics.notna(), None)
             
             parsed_data = []
-            
-            for d in dates:
+            for d, values in zip(dates, metrics.to_dict(orient='records')):
                 # Convert Timestamp to date
                 report_date = d.date() if isinstance(d, pd.Timestamp) else d
-                period_str = f"{report_date.year}-FY" # Assuming annual for now
-                
-                # Helper to safely get value from DF
-                def get_val(df, row_name, col_date):
-                    try:
-                        if row_name in df.index:
-                            val = df.loc[row_name, col_date]
-                            return float(val) if not pd.isna(val) else None
-                    except:
-                        return None
-                    return None
-
-                # Mapping yfinance row names to our schema
-                # Note: yfinance row names can change, need robust matching in future
-                revenue = get_val(income_stmt, "Total Revenue", d)
-                net_income = get_val(income_stmt, "Net Income", d)
-                eps = get_val(income_stmt, "Basic EPS", d) # Sometimes "Basic EPS"
-                
-                total_assets = get_val(balance_sheet, "Total Assets", d)
-                total_liab = get_val(balance_sheet, "Total Liabilities Net Minority Interest", d) 
-                # "Total Liabilities Net Minority Interest" is common in yfinance for "Total Liabilities"
-                
-                record = {
+                parsed_data.append({
                     'ticker': ticker,
-                    'period': period_str,
+                    'period': f"{report_date.year}-FY",  # Assuming annual for now
                     'report_date': report_date,
-                    'revenue': revenue,
-                    'net_income': net_income,
-                    'eps': eps,
-                    'total_assets': total_assets,
-                    'total_liabilities': total_liab
-                }
-                parsed_data.append(record)
+                    **values
+                })
                 
             if self.db:
                 self.db.save_financials(ticker, parsed_data)
@@ -89,6 +77,13 @@ class FinancialParser:
             logger.error(f"Error processing financials for {ticker}: {e}")
             return False
 
+    @staticmethod
+    def _pick_metrics(stmt: pd.DataFrame, fields: Dict[str, str], dates) -> pd.DataFrame:
+        """Statement (rows=metrics, cols=dates) -> per-date frame with schema column names (missing -> NaN)"""
+        stmt = stmt.loc[~stmt.index.duplicated(), ~stmt.columns.duplicated()]
+        picked = stmt.reindex(index=list(fields), columns=dates).T.rename(columns=fields)
+        return picked.apply(pd.to_numeric, errors='coerce')
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     parser = FinancialParser()
@@ -6,14 +6,18 @@
 """
 import os
 import logging
+from concurrent.futures import Future
 from contextlib import contextmanager
 from typing import Optional, List
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, Date, ForeignKey
+import pandas as pd
+from sqlalchemy import create_engine, event, insert, Column, Integer, String, Float, Date, ForeignKey
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship, Session
 from dotenv import load_dotenv
 
+from src.utils.executors import LazyThreadPool
+
 # Load environment variables
 load_dotenv()
 
@@ -69,6 +73,14 @@ class Financials(Base):
     stock = relationship("Stock", back_populates="financials")
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL 모드: 백그라운드 쓰기 중에도 읽기 차단 없음, synchronous=NORMAL로 커밋당 fsync 감소"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 # ===========================================
 # 싱글톤 DataStorage
 # ===========================================
@@ -95,8 +107,11 @@ class DataStorage:
         # 환경변수 또는 매개변수에서 DB 경로 가져오기
         self.db_path = db_path or os.getenv("DB_PATH", "trading_assistant.db")
         self.engine = create_engine(f'sqlite:///{self.db_path}', echo=False)
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
         Base.metadata.create_all(self.engine)
         self.Session = sessionmaker(bind=self.engine)
+        # 시세 저장은 단일 백그라운드 스레드에서 순서대로 처리 (요청 스레드는 DB 쓰기 대기 없이 반환)
+        self._writer = LazyThreadPool(max_workers=1, thread_name_prefix="db-writer")
         
         DataStorage._initialized = True
         logger.info(f"Database initialized at {self.db_path}")
@@ -143,49 +158,65 @@ class DataStorage:
         # 먼저 종목 확인
         self.save_stock(ticker)
         
+        # [강력 조치] 날짜를 컬럼 단위로 한 번에 Date 객체로 변환 (시간 부분 제거, 실패 시 NaT)
+        dates = pd.to_datetime(
+            df['Date'].astype(str).str.split(' ').str[0], format='%Y-%m-%d', errors='coerce'
+        )
+        invalid = int(dates.isna().sum())
+        if invalid:
+            logger.warning(f"Date conversion failed for {invalid} rows of {ticker}")
+        
+        records = pd.DataFrame({
+            'date': dates.dt.date,
+            'open': df['Open'],
+            'high': df['High'],
+            'low': df['Low'],
+            'close': df['Close'],
+            'volume': df['Volume'] if 'Volume' in df.columns else 0
+        })[dates.notna()]
+        if records.empty:
+            logger.info(f"No new records to save for {ticker}")
+            return 0
+        
         with self.get_session() as session:
-            # 기존 날짜 조회 (중복 방지)
+            # 기존 날짜 조회 (중복 방지) - 종목 전체 이력 대신 저장할 날짜 범위만 조회
             existing_dates = {
                 row[0] for row in session.query(PriceHistory.date)
-                .filter(PriceHistory.ticker == ticker)
+                .filter(
+                    PriceHistory.ticker == ticker,
+                    PriceHistory.date.between(records['date'].min(), records['date'].max())
+                )
                 .all()
             }
             
-            new_records = []
-            for _, row in df.iterrows():
-                date_val = row['Date']
-                
-                # [강력 조치] 문자열 날짜를 Date 객체로 강제 변환
-                if isinstance(date_val, str):
-                    try:
-                        from datetime import datetime
-                        date_val = datetime.strptime(date_val.split(' ')[0], '%Y-%m-%d').date()
-                    except Exception as e:
-                        logger.warning(f"Date conversion failed for {date_val}: {e}")
-                        continue
-                
-                if date_val in existing_dates:
-                    continue
-                
-                record = PriceHistory(
-                    ticker=ticker,
-                    date=date_val,
-                    open=row['Open'],
-                    high=row['High'],
-                    low=row['Low'],
-                    close=row['Close'],
-                    volume=row.get('Volume', 0)
-                )
-                new_records.append(record)
+            records = records[~records['date'].isin(existing_dates)]
+            records.insert(0, 'ticker', ticker)
+            new_records = records.to_dict(orient='records')
             
             if new_records:
-                session.bulk_save_objects(new_records)
+                # Core INSERT 한 번으로 일괄 저장 (ORM 객체/매핑 처리 없이 executemany)
+                session.execute(insert(PriceHistory.__table__), new_records)
                 logger.info(f"Saved {len(new_records)} new price records for {ticker}")
             else:
                 logger.info(f"No new records to save for {ticker}")
             
             return len(new_records)
     
+    def save_price_history_async(self, ticker: str, df) -> Future:
+        """save_price_history 백그라운드 예약 (호출자가 df를 수정해도 되도록 복사본 저장)"""
+        return self._writer.submit(self._save_price_history_logged, ticker, df.copy())
+    
+    def _save_price_history_logged(self, ticker: str, df) -> int:
+        try:
+            return self.save_price_history(ticker, df)
+        except Exception as e:
+            logger.error(f"DB save error for {ticker}: {e}")
+            return 0
+    
+    def flush(self):
+        """예약된 백그라운드 저장이 모두 끝날 때까지 대기"""
+        self._writer.submit(lambda: None).result()
+    
     def save_financials(self, ticker: str, financials_data: List[dict]) -> int:
         """
         재무 데이터 저장
@@ -15,6 +15,7 @@ from src.data.collector import MarketDataCollector
 from src.agents.ai_analyzer import AIAnalyzer
 from src.agents.portfolio_analyzer import PortfolioAnalyzer
 from src.agents.screener import StockScreener
+from src.utils.serializer import dumps as json_dumps
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -63,7 +64,7 @@ def get_stock_analysis(ticker: str) -> str:
             "support": result['technical_analysis']['support'],
             "resistance": result['technical_analysis']['resistance']
         }
-        return json.dumps(summary, indent=2)
+        return json_dumps(summary, indent=True).decode()
     except Exception as e:
         return f"Analysis failed: {str(e)}"
 
@@ -88,7 +89,7 @@ def get_financial_summary(ticker: str) -> str:
             "roe": financials.get('returnOnEquity'),
             "revenue_growth": financials.get('revenueGrowth')
         }
-        return json.dumps(summary, indent=2)
+        return json_dumps(summary, indent=True).decode()
     except Exception as e:
         return f"Financial lookup failed: {str(e)}"
 
@@ -102,7 +103,7 @@ def check_portfolio_risk(holdings: str) -> str:
     try:
         data = json.loads(holdings)
         result = portfolio.analyze_portfolio(data)
-        return json.dumps(result, indent=2)
+        return json_dumps(result, indent=True).decode()
     except Exception as e:
         return f"Portfolio analysis failed: {str(e)}"
 
@@ -115,7 +116,7 @@ def recommend_stocks(style: str = "balanced") -> str:
     """
     try:
         recs = screener.get_recommendations(style=style, limit=5)
-        return json.dumps(recs, indent=2)
+        return json_dumps(recs, indent=True).decode()
     except Exception as e:
         return f"Recommendation failed: {str(e)}"
 
@@ -8,6 +8,7 @@ import os
 import logging
 import re
 from datetime import datetime
+import yfinance as yf
 
 # 윈도우 콘솔 한글/이모지 인코딩 문제 해결
 if sys.platform == 'win32':
@@ -27,6 +28,10 @@ from src.data.storage import get_storage
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 클립보드 감시(1초 주기)마다 호출되므로 정규식은 모듈 로드 시 한 번만 컴파일
+_TICKER_RE = re.compile(r'^[A-Z0-9.]{2,10}$')
+_HANGUL_RE = re.compile(r'[가-힣]')
+
 class TradingOverlay:
     def __init__(self):
         self.root = tk.Tk()
@@ -178,15 +183,14 @@ class TradingOverlay:
     def is_valid_ticker(self, text):
         if not text or len(text) > 30: return False
         # Ticket pattern or Korean name
-        if re.match(r'^[A-Z0-9.]{2,10}$', text.upper()): return True
-        if any(ord('가') <= ord(char) <= ord('힣') for char in text): return True
+        if _TICKER_RE.match(text.upper()): return True
+        if _HANGUL_RE.search(text): return True
         return False
 
     def search_ticker(self, query):
         """Map name to ticker (KR priority)"""
         try:
-            import yfinance as yf
-            is_korean = any(ord('가') <= ord(char) <= ord('힣') for char in query)
+            is_korean = _HANGUL_RE.search(query) is not None
             search = yf.Search(query, max_results=5)
             results = search.quotes
             if not results: return query
@@ -0,0 +1,12 @@
+"""
+Numba JIT 호환 레이어
+numba가 설치되어 있으면 njit로 컴파일하고, 없으면 순수 Python 함수로 그대로 실행
+"""
+try:
+    from numba import njit
+except ImportError:  # numba 미설치 시 no-op 데코레이터
+    def njit(*args, **kwargs):
+        # @njit 형태(인자 없이 함수 직접 전달) 지원
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
@@ -4,138 +4,260 @@
 import pandas as pd
 import numpy as np
 
+from src.utils._njit import njit
+
+
+# ===========================================
+# 순차 계산 커널 (numba 설치 시 JIT 컴파일, cache=True로 디스크 캐시)
+# ===========================================
+
+@njit(cache=True)
+def _rolling_mad(values: np.ndarray, window: int) -> np.ndarray:
+    """이동 평균 절대 편차 (윈도우 내 NaN 존재 시 NaN)"""
+    n = len(values)
+    out = np.full(n, np.nan)
+    for i in range(window - 1, n):
+        total = 0.0
+        has_nan = False
+        for j in range(i - window + 1, i + 1):
+            if np.isnan(values[j]):
+                has_nan = True
+                break
+            total += values[j]
+        if has_nan:
+            continue
+        mean = total / window
+        dev = 0.0
+        for j in range(i - window + 1, i + 1):
+            dev += abs(values[j] - mean)
+        out[i] = dev / window
+    return out
+
+
+@njit(cache=True)
+def _rolling_argext(values: np.ndarray, window: int, find_max: bool) -> np.ndarray:
+    """윈도우 내 최대(최소)값의 위치 (첫 번째 발생 기준, NaN 포함 시 NaN)"""
+    n = len(values)
+    out = np.full(n, np.nan)
+    for i in range(window - 1, n):
+        start = i - window + 1
+        best = values[start]
+        best_pos = 0
+        has_nan = False
+        for j in range(start, i + 1):
+            v = values[j]
+            if np.isnan(v):
+                has_nan = True
+                break
+            if (find_max and v > best) or ((not find_max) and v < best):
+                best = v
+                best_pos = j - start
+        if not has_nan:
+            out[i] = best_pos
+    return out
+
+
+@njit(cache=True)
+def _parabolic_sar_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                        af_start: float, af_step: float, af_max: float) -> np.ndarray:
+    """Parabolic SAR 순차 계산 루프"""
+    n = len(close)
+    sar = close.copy()
+    if n < 2:
+        return sar
+    
+    curr_trend = 1 if close[0] > close[1] else -1
+    curr_sar = low[0] if curr_trend == 1 else high[0]
+    curr_ep = high[0] if curr_trend == 1 else low[0]
+    curr_af = af_start
+    sar[0] = curr_sar
+    
+    for i in range(1, n):
+        prev_sar = curr_sar
+        
+        # SAR 계산
+        curr_sar = prev_sar + curr_af * (curr_ep - prev_sar)
+        
+        # 추세 반전 체크
+        if curr_trend == 1:
+            # 상승 추세에서는 SAR가 Low보다 낮아야 함. 높으면 매도 신호(추세 반전)
+            if low[i] < curr_sar:
+                curr_trend = -1
+                curr_sar = curr_ep # 반전 시 SAR는 이전 EP
+                curr_ep = low[i] # 새로운 EP는 현재 저가
+                curr_af = af_start
+            elif high[i] > curr_ep:
+                # 상승 지속
+                curr_ep = high[i]
+                curr_af = min(af_max, curr_af + af_step)
+        else: # 하락 추세
+            # 하락 추세에서는 SAR가 High보다 높아야 함. 낮으면 매수 신호(추세 반전)
+            if high[i] > curr_sar:
+                curr_trend = 1
+                curr_sar = curr_ep
+                curr_ep = high[i]
+                curr_af = af_start
+            elif low[i] < curr_ep:
+                # 하락 지속
+                curr_ep = low[i]
+                curr_af = min(af_max, curr_af + af_step)
+        
+        sar[i] = curr_sar
+    
+    return sar
+
+
+def _rolling_means(values: np.ndarray, windows: list) -> dict:
+    """
+    여러 윈도우의 단순이동평균을 누적합 한 번으로 계산 (rolling().mean()을 윈도우마다 반복하지 않음)
+    윈도우 내 NaN이 있으면 NaN (rolling 기본 동작과 동일), 누적 오차를 줄이기 위해 평균을 빼고 합산
+    """
+    n = len(values)
+    nan = np.isnan(values)
+    center = values[~nan].mean() if not nan.all() else 0.0
+    csum = np.concatenate(([0.0], np.cumsum(np.where(nan, 0.0, values - center))))
+    ncnt = np.concatenate(([0], np.cumsum(nan)))
+    out = {}
+    for w in windows:
+        sma = np.full(n, np.nan)
+        if w <= n:
+            means = (csum[w:] - csum[:-w]) / w + center
+            means[(ncnt[w:] - ncnt[:-w]) > 0] = np.nan
+            sma[w - 1:] = means
+        out[w] = sma
+    return out
+
+
 class AdvancedIndicators:
     
     @staticmethod
     def calculate_all(df: pd.DataFrame) -> pd.DataFrame:
         """모든 지표 계산"""
-        calc = df.copy()
+        # 지표는 dict에 모은 뒤 마지막에 한 번만 병합 (컬럼별 삽입/재정렬 및 블록 단편화 방지)
+        close, high, low, volume = df['Close'], df['High'], df['Low'], df['Volume']
+        tp = (high + low + close) / 3
+        cols = {}
         
-        # === 이동평균선 (SMA) ===
-        for period in [5, 10, 20, 50, 60, 100, 120, 200]:
-            calc[f'sma_{period}'] = calc['Close'].rolling(window=period).mean()
+        # === 이동평균선 (SMA) === 8개 윈도우를 종가 누적합 한 번으로 계산
+        smas = _rolling_means(close.to_numpy(dtype=np.float64), [5, 10, 20, 50, 60, 100, 120, 200])
+        for period, values in smas.items():
+            cols[f'sma_{period}'] = pd.Series(values, index=df.index)
         
         # === 지수이동평균 (EMA) ===
         for period in [9, 12, 20, 26, 50, 200]:
-            calc[f'ema_{period}'] = calc['Close'].ewm(span=period, adjust=False).mean()
+            cols[f'ema_{period}'] = close.ewm(span=period, adjust=False).mean()
         
         # === 볼린저 밴드 ===
-        sma20 = calc['Close'].rolling(20).mean()
-        std20 = calc['Close'].rolling(20).std()
-        calc['bb_upper'] = sma20 + (std20 * 2)
-        calc['bb_middle'] = sma20
-        calc['bb_lower'] = sma20 - (std20 * 2)
-        calc['bb_width'] = (calc['bb_upper'] - calc['bb_lower']) / calc['bb_middle'] * 100
+        sma20 = cols['sma_20']
+        std20 = close.rolling(20).std()
+        cols['bb_upper'] = sma20 + (std20 * 2)
+        cols['bb_middle'] = sma20
+        cols['bb_lower'] = sma20 - (std20 * 2)
+        cols['bb_width'] = (cols['bb_upper'] - cols['bb_lower']) / cols['bb_middle'] * 100
         
         # === 켈트너 채널 ===
-        ema20 = calc['Close'].ewm(span=20, adjust=False).mean()
-        atr = AdvancedIndicators._atr(calc, 20)
-        calc['kc_upper'] = ema20 + (atr * 2)
-        calc['kc_middle'] = ema20
-        calc['kc_lower'] = ema20 - (atr * 2)
+        ema20 = cols['ema_20']
+        atr = AdvancedIndicators._atr(df, 20)
+        cols['kc_upper'] = ema20 + (atr * 2)
+        cols['kc_middle'] = ema20
+        cols['kc_lower'] = ema20 - (atr * 2)
         
         # === 동코안 채널 ===
-        calc['dc_upper'] = calc['High'].rolling(20).max()
-        calc['dc_lower'] = calc['Low'].rolling(20).min()
-        calc['dc_middle'] = (calc['dc_upper'] + calc['dc_lower']) / 2
+        cols['dc_upper'] = high.rolling(20).max()
+        cols['dc_lower'] = low.rolling(20).min()
+        cols['dc_middle'] = (cols['dc_upper'] + cols['dc_lower']) / 2
         
         # === 일목균형표 ===
-        calc['ichimoku_tenkan'] = (calc['High'].rolling(9).max() + calc['Low'].rolling(9).min()) / 2
-        calc['ichimoku_kijun'] = (calc['High'].rolling(26).max() + calc['Low'].rolling(26).min()) / 2
-        calc['ichimoku_senkou_a'] = ((calc['ichimoku_tenkan'] + calc['ichimoku_kijun']) / 2).shift(26)
-        calc['ichimoku_senkou_b'] = ((calc['High'].rolling(52).max() + calc['Low'].rolling(52).min()) / 2).shift(26)
+        cols['ichimoku_tenkan'] = (high.rolling(9).max() + low.rolling(9).min()) / 2
+        cols['ichimoku_kijun'] = (high.rolling(26).max() + low.rolling(26).min()) / 2
+        cols['ichimoku_senkou_a'] = ((cols['ichimoku_tenkan'] + cols['ichimoku_kijun']) / 2).shift(26)
+        cols['ichimoku_senkou_b'] = ((high.rolling(52).max() + low.rolling(52).min()) / 2).shift(26)
         
         # === RSI ===
-        calc['rsi'] = AdvancedIndicators._rsi(calc, 14)
-        calc['rsi_9'] = AdvancedIndicators._rsi(calc, 9)
-        calc['rsi_25'] = AdvancedIndicators._rsi(calc, 25)
+        cols['rsi'] = AdvancedIndicators._rsi(df, 14)
+        cols['rsi_9'] = AdvancedIndicators._rsi(df, 9)
+        cols['rsi_25'] = AdvancedIndicators._rsi(df, 25)
         
-        # === MACD ===
-        exp12 = calc['Close'].ewm(span=12, adjust=False).mean()
-        exp26 = calc['Close'].ewm(span=26, adjust=False).mean()
-        calc['MACD'] = exp12 - exp26
-        calc['Signal'] = calc['MACD'].ewm(span=9, adjust=False).mean()
-        calc['Hist'] = calc['MACD'] - calc['Signal']
+        # === MACD === (EMA 12/26은 위에서 계산한 값 재사용)
+        cols['MACD'] = cols['ema_12'] - cols['ema_26']
+        cols['Signal'] = cols['MACD'].ewm(span=9, adjust=False).mean()
+        cols['Hist'] = cols['MACD'] - cols['Signal']
         
         # === 스토캐스틱 ===
-        low14 = calc['Low'].rolling(14).min()
-        high14 = calc['High'].rolling(14).max()
-        calc['stoch_k'] = 100 * ((calc['Close'] - low14) / (high14 - low14))
-        calc['stoch_d'] = calc['stoch_k'].rolling(3).mean()
+        low14 = low.rolling(14).min()
+        high14 = high.rolling(14).max()
+        cols['stoch_k'] = 100 * ((close - low14) / (high14 - low14))
+        cols['stoch_d'] = cols['stoch_k'].rolling(3).mean()
         
         # === CCI ===
-        tp = (calc['High'] + calc['Low'] + calc['Close']) / 3
         sma_tp = tp.rolling(20).mean()
-        mad = tp.rolling(20).apply(lambda x: np.abs(x - x.mean()).mean())
-        calc['cci'] = (tp - sma_tp) / (0.015 * mad)
+        mad = pd.Series(_rolling_mad(tp.to_numpy(dtype=np.float64), 20), index=df.index)
+        cols['cci'] = (tp - sma_tp) / (0.015 * mad)
         
         # === Williams %R ===
-        high14 = calc['High'].rolling(14).max()
-        low14 = calc['Low'].rolling(14).min()
-        calc['williams_r'] = -100 * ((high14 - calc['Close']) / (high14 - low14))
+        cols['williams_r'] = -100 * ((high14 - close) / (high14 - low14))
         
         # === ADX ===
-        calc['atr'] = AdvancedIndicators._atr(calc, 14)
-        high_diff = calc['High'].diff()
-        low_diff = -calc['Low'].diff()
+        cols['atr'] = AdvancedIndicators._atr(df, 14)
+        high_diff = high.diff()
+        low_diff = -low.diff()
         plus_dm = high_diff.where((high_diff > low_diff) & (high_diff > 0), 0)
         minus_dm = low_diff.where((low_diff > high_diff) & (low_diff > 0), 0)
-        plus_di = 100 * (plus_dm.rolling(14).mean() / calc['atr'])
-        minus_di = 100 * (minus_dm.rolling(14).mean() / calc['atr'])
+        plus_di = 100 * (plus_dm.rolling(14).mean() / cols['atr'])
+        minus_di = 100 * (minus_dm.rolling(14).mean() / cols['atr'])
         dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
-        calc['adx'] = dx.rolling(14).mean()
-        calc['plus_di'] = plus_di
-        calc['minus_di'] = minus_di
+        cols['adx'] = dx.rolling(14).mean()
+        cols['plus_di'] = plus_di
+        cols['minus_di'] = minus_di
         
         # === OBV ===
-        calc['obv'] = (np.sign(calc['Close'].diff()) * calc['Volume']).fillna(0).cumsum()
+        cols['obv'] = (np.sign(close.diff()) * volume).fillna(0).cumsum()
         
         # === MFI ===
-        tp = (calc['High'] + calc['Low'] + calc['Close']) / 3
-        mf = tp * calc['Volume']
-        pos_mf = mf.where(tp > tp.shift(), 0).rolling(14).sum()
-        neg_mf = mf.where(tp < tp.shift(), 0).rolling(14).sum()
-        calc['mfi'] = 100 - (100 / (1 + pos_mf / neg_mf))
+        mf = tp * volume
+        prev_tp = tp.shift()
+        pos_mf = mf.where(tp > prev_tp, 0).rolling(14).sum()
+        neg_mf = mf.where(tp < prev_tp, 0).rolling(14).sum()
+        cols['mfi'] = 100 - (100 / (1 + pos_mf / neg_mf))
         
         # === Pivot Points & Parabolic SAR ===
-        pivots = AdvancedIndicators._pivot_points(calc)
-        # Pivot DataFrame의 컬럼들을 원본 calc에 병합
-        calc = pd.concat([calc, pivots], axis=1)
-        
-        calc['parabolic_sar'] = AdvancedIndicators._parabolic_sar(calc)
+        cols.update(AdvancedIndicators._pivot_points(df))
+        cols['parabolic_sar'] = AdvancedIndicators._parabolic_sar(df)
 
         # === VWAP ===
-        tp = (calc['High'] + calc['Low'] + calc['Close']) / 3
-        calc['vwap'] = (tp * calc['Volume']).cumsum() / calc['Volume'].cumsum()
+        cols['vwap'] = (tp * volume).cumsum() / volume.cumsum()
         
         # === CMF ===
-        mfm = ((calc['Close'] - calc['Low']) - (calc['High'] - calc['Close'])) / (calc['High'] - calc['Low'])
-        mfv = mfm * calc['Volume']
-        calc['cmf'] = mfv.rolling(20).sum() / calc['Volume'].rolling(20).sum()
+        mfm = ((close - low) - (high - close)) / (high - low)
+        mfv = mfm * volume
+        cols['cmf'] = mfv.rolling(20).sum() / volume.rolling(20).sum()
         
         # === ROC ===
-        calc['roc'] = ((calc['Close'] - calc['Close'].shift(12)) / calc['Close'].shift(12)) * 100
+        close_12 = close.shift(12)
+        cols['roc'] = ((close - close_12) / close_12) * 100
         
         # === Momentum ===
-        calc['momentum'] = calc['Close'] - calc['Close'].shift(10)
+        cols['momentum'] = close - close.shift(10)
         
         # === Aroon ===
-        calc['aroon_up'] = calc['High'].rolling(25).apply(lambda x: x.argmax()) / 25 * 100
-        calc['aroon_down'] = calc['Low'].rolling(25).apply(lambda x: x.argmin()) / 25 * 100
-        calc['aroon_osc'] = calc['aroon_up'] - calc['aroon_down']
+        cols['aroon_up'] = _rolling_argext(high.to_numpy(dtype=np.float64), 25, True) / 25 * 100
+        cols['aroon_down'] = _rolling_argext(low.to_numpy(dtype=np.float64), 25, False) / 25 * 100
+        cols['aroon_osc'] = cols['aroon_up'] - cols['aroon_down']
         
         # === TSI (True Strength Index) ===
-        momentum = calc['Close'].diff()
+        momentum = close.diff()
         ema25_momentum = momentum.ewm(span=25, adjust=False).mean()
         ema13_ema25 = ema25_momentum.ewm(span=13, adjust=False).mean()
         ema25_abs = momentum.abs().ewm(span=25, adjust=False).mean()
         ema13_ema25_abs = ema25_abs.ewm(span=13, adjust=False).mean()
-        calc['tsi'] = 100 * (ema13_ema25 / ema13_ema25_abs)
+        cols['tsi'] = 100 * (ema13_ema25 / ema13_ema25_abs)
         
         # === Ultimate Oscillator ===
-        calc['uo'] = AdvancedIndicators._ultimate_oscillator(calc)
+        cols['uo'] = AdvancedIndicators._ultimate_oscillator(df)
         
-        return calc
+        # 원본 컬럼 + 지표 컬럼을 한 번에 결합 (기존 컬럼과 이름이 겹치면 지표 값으로 대체)
+        indicators = pd.DataFrame(cols, index=df.index)
+        return pd.concat([df.drop(columns=indicators.columns, errors='ignore'), indicators], axis=1)
     
     @staticmethod
     def _pivot_points(df: pd.DataFrame) -> pd.DataFrame:
@@ -167,74 +289,13 @@ class AdvancedIndicators:
 
     @staticmethod
     def _parabolic_sar(df: pd.DataFrame, af_start=0.02, af_step=0.02, af_max=0.20) -> pd.Series:
-        """Parabolic SAR (Stop and Reverse)"""
-        high = df['High']
-        low = df['Low']
-        close = df['Close']
-        
-        sar = close.copy()
-        trend = pd.Series(0, index=df.index) # 1: Bull, -1: Bear
-        ep = pd.Series(0.0, index=df.index) # Extreme Point
-        af = pd.Series(af_start, index=df.index) # Acceleration Factor
-        
-        # 초기값 설정 (첫 5개 봉으로 추세 결정)
-        trend.iloc[0] = 1 if close.iloc[0] > close.iloc[1] else -1
-        sar.iloc[0] = low.iloc[0] if trend.iloc[0] == 1 else high.iloc[0]
-        ep.iloc[0] = high.iloc[0] if trend.iloc[0] == 1 else low.iloc[0]
-        
-        # 벡터화가 어렵고 순차적 계산이 필요함 (Numba 없이 Python 루프 사용 - 속도 주의)
-        # 성능을 위해 최근 500개만 계산하거나, 전체 계산시 주의
-        # 여기서는 Pandas 순회를 최소화하기 위해 numpy 배열 사용
-        
-        n = len(df)
-        sar_val = sar.values
-        trend_val = trend.values
-        ep_val = ep.values
-        af_val = af.values
-        high_val = high.values
-        low_val = low.values
-        
-        curr_trend = trend_val[0]
-        curr_sar = sar_val[0]
-        curr_ep = ep_val[0]
-        curr_af = af_start
-        
-        for i in range(1, n):
-            prev_sar = curr_sar
-            
-            # SAR 계산
-            curr_sar = prev_sar + curr_af * (curr_ep - prev_sar)
-            
-            # 추세 반전 체크
-            if curr_trend == 1:
-                # 상승 추세에서는 SAR가 Low보다 낮아야 함. 높으면 매도 신호(추세 반전)
-                if low_val[i] < curr_sar:
-                    curr_trend = -1
-                    curr_sar = curr_ep # 반전 시 SAR는 이전 EP
-                    curr_ep = low_val[i] # 새로운 EP는 현재 저가
-                    curr_af = af_start
-                else:
-                    # 상승 지속
-                    if high_val[i] > curr_ep:
-                        curr_ep = high_val[i]
-                        curr_af = min(af_max, curr_af + af_step)
-                    
-            else: # 하락 추세
-                # 하락 추세에서는 SAR가 High보다 높아야 함. 낮으면 매수 신호(추세 반전)
-                if high_val[i] > curr_sar:
-                    curr_trend = 1
-                    curr_sar = curr_ep
-                    curr_ep = high_val[i]
-                    curr_af = af_start
-                else:
-                    # 하락 지속
-                    if low_val[i] < curr_ep:
-                        curr_ep = low_val[i]
-                        curr_af = min(af_max, curr_af + af_step)
-            
-            sar_val[i] = curr_sar
-            trend_val[i] = curr_trend
-            
+        """Parabolic SAR (Stop and Reverse) - 순차 계산은 JIT 커널에서 수행"""
+        sar_val = _parabolic_sar_loop(
+            df['High'].to_numpy(dtype=np.float64),
+            df['Low'].to_numpy(dtype=np.float64),
+            df['Close'].to_numpy(dtype=np.float64),
+            af_start, af_step, af_max
+        )
         return pd.Series(sar_val, index=df.index, name='parabolic_sar')
 
     @staticmethod
@@ -0,0 +1,68 @@
+"""
+인메모리 TTL 캐시 유틸리티
+- 외부 의존성 없이 만료 시간 + 최대 크기 제한을 지원
+- 여러 스레드(FastAPI 워커 스레드 등)에서 동시에 사용 가능
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    만료 시간(ttl, 초)과 최대 항목 수(maxsize)를 갖는 LRU 캐시
+    사용법:
+        cache = TTLCache(maxsize=1024, ttl=60)
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.set(key, value)
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """만료되지 않은 값 반환 (없으면 default)"""
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """값 저장 (ttl 미지정 시 기본 ttl 사용)"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """항목 제거 후 값 반환"""
+        with self._lock:
+            item = self._data.pop(key, _MISSING)
+        return default if item is _MISSING else item[1]
+
+    def clear(self):
+        """전체 항목 제거"""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
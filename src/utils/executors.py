@@ -0,0 +1,60 @@
+"""
+fork 안전한 지연 생성 스레드 풀
+- 최초 submit 시점에 ThreadPoolExecutor 생성 (gunicorn preload_app 시 마스터 프로세스에서 풀을 만들지 않음)
+- fork된 자식 프로세스에서는 부모 풀(스레드 없이 복제된 상태)을 버리고 다음 submit에서 새로 생성
+"""
+import os
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+_pools: "weakref.WeakSet[LazyThreadPool]" = weakref.WeakSet()
+
+
+class LazyThreadPool:
+    """
+    ThreadPoolExecutor를 필요할 때 만드는 래퍼 (submit/shutdown만 제공)
+    사용법:
+        pool = LazyThreadPool(max_workers=1, thread_name_prefix="db-writer")
+        future = pool.submit(fn, *args)
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = ""):
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        _pools.add(self)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix=self.thread_name_prefix)
+            return self._executor
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """작업 예약 (풀이 없으면 이 시점에 생성)"""
+        return self._get_executor().submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True):
+        """풀 종료 (이후 submit 시 새로 생성)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _reset_after_fork(self):
+        # 부모에서 복제된 락/풀은 자식에서 쓸 수 없으므로 새 락과 빈 상태로 교체
+        self._lock = threading.Lock()
+        self._executor = None
+
+
+def _reset_pools_after_fork():
+    for pool in list(_pools):
+        pool._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):  # Windows는 fork 미지원
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
@@ -0,0 +1,45 @@
+"""
+공유 HTTP 세션 유틸리티
+- 프로세스당 하나의 requests.Session을 재사용해 TCP/TLS 연결을 keep-alive로 풀링
+- 일시적 오류(429/5xx)는 짧은 백오프로 자동 재시도
+- 직접 구현한 재시도 루프용 지수 백오프 + jitter 계산
+"""
+import random
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """연결 풀이 설정된 공유 세션 반환 (최초 호출 시 생성)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                session.headers.update(DEFAULT_HEADERS)
+                adapter = HTTPAdapter(
+                    pool_connections=32,
+                    pool_maxsize=64,
+                    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 4.0) -> float:
+    """
+    attempt(0부터)번째 재시도 전 대기 시간(초): 지수 증가 상한 내에서 무작위 (full jitter)
+    첫 재시도는 빠르게, 연속 실패 시 간격을 늘리고 동시 요청들의 재시도 시점을 분산
+    """
+    return random.uniform(0.1, max(0.1, min(cap, base * 2 ** attempt)))
@@ -3,14 +3,24 @@ JSON 직렬화 유틸리티
 NaN, Inf 등 JSON 비호환 값을 안전하게 처리
 """
 import json
+from datetime import date, datetime, time
+from enum import Enum
 import numpy as np
 import pandas as pd
 from typing import Any, Dict, List
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json + safe_serialize로 대체
+    orjson = None
+
 def safe_serialize(data: Any) -> Any:
     """
     JSON 직렬화 시 NaN, Inf 등을 안전하게 처리
     """
+    # 가장 흔한 말단 값(문자열/정수/불리언/None)은 pd.isna 검사 없이 즉시 반환
+    if data is None or type(data) in (str, int, bool):
+        return data
     if isinstance(data, dict):
         return {k: safe_serialize(v) for k, v in data.items()}
     elif isinstance(data, (list, tuple)):
@@ -27,3 +37,50 @@ def safe_serialize(data: Any) -> Any:
         return None
     else:
         return data
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    orjson이 기본 지원하지 않는 타입(pandas/numpy 등) 변환 훅
+    처리할 수 없는 타입은 TypeError (orjson/json default 규약, 임의 객체를 문자열로 숨기지 않음)
+    """
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+    if isinstance(obj, (pd.Timestamp, pd.Period)):
+        return str(obj)
+    if isinstance(obj, (pd.Series, pd.DataFrame)):
+        return obj.where(pd.notnull(obj), None).to_dict()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, set):
+        return list(obj)
+    # 표준 json 대체 경로용 (orjson은 기본 지원): orjson과 같은 ISO 8601 / Enum 값으로 변환
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    JSON 바이트로 직렬화 (indent=True 시 2칸 들여쓰기)
+    orjson 사용 시 NaN/Inf -> null, numpy 스칼라/배열을 C 레벨에서 처리 (재귀 전처리 불필요)
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_json_default, option=option)
+    return json.dumps(
+        safe_serialize(data), ensure_ascii=False, default=_json_default, indent=2 if indent else None
+    ).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """JSON 바이트/문자열 파싱 (orjson 사용 시 표준 json 대비 2~3배 빠름)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,12 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 저장소 루트를 import 경로에 추가 (src 패키지 직접 import)
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# 테스트 중 생성되는 SQLite DB는 저장소 밖 임시 경로 사용 (src.config import 전에 설정)
+os.environ.setdefault("DB_PATH", str(Path(tempfile.mkdtemp()) / "trading_assistant_test.db"))
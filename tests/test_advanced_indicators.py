@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from src.utils._njit import njit
+from src.utils.advanced_indicators import _rolling_argext, _rolling_mad, _rolling_means
+
+
+def _values():
+    rng = np.random.default_rng(0)
+    values = 100 + rng.standard_normal(300).cumsum()
+    values[[10, 150]] = np.nan
+    return values
+
+
+def test_rolling_means_matches_pandas():
+    values = _values()
+    windows = [5, 20, 200, 500]
+    result = _rolling_means(values, windows)
+    for w in windows:
+        expected = pd.Series(values).rolling(w).mean().to_numpy()
+        np.testing.assert_allclose(result[w], expected, rtol=1e-10, equal_nan=True)
+
+
+def test_rolling_means_all_nan():
+    result = _rolling_means(np.full(5, np.nan), [2])
+    assert np.isnan(result[2]).all()
+
+
+def test_rolling_mad_matches_pandas():
+    values = _values()
+    expected = pd.Series(values).rolling(20).apply(lambda x: np.abs(x - x.mean()).mean(), raw=True).to_numpy()
+    np.testing.assert_allclose(_rolling_mad(values, 20), expected, rtol=1e-10, equal_nan=True)
+
+
+def test_rolling_argext_matches_pandas():
+    values = _values()
+    s = pd.Series(values).rolling(14)
+    np.testing.assert_array_equal(_rolling_argext(values, 14, True), s.apply(np.argmax, raw=True).to_numpy())
+    np.testing.assert_array_equal(_rolling_argext(values, 14, False), s.apply(np.argmin, raw=True).to_numpy())
+
+
+def test_njit_decorator_forms():
+    @njit
+    def plain(x):
+        return x + 1
+
+    @njit(cache=True)
+    def with_args(x):
+        return x * 2
+
+    assert plain(1) == 2
+    assert with_args(2) == 4
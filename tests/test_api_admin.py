@@ -0,0 +1,44 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api.server as server
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(server, "ADMIN_TOKEN", "secret")
+    monkeypatch.setattr(server, "get_final_ticker", lambda ticker: ticker)
+    server.limiter.reset()
+    return TestClient(server.app)
+
+
+def test_clear_history_cache_requires_admin(client):
+    assert client.delete("/history/cache/AAPL").status_code == 403
+    assert client.delete("/history/cache/AAPL", headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+    res = client.delete("/history/cache/AAPL", headers={"X-Admin-Token": "secret"})
+    assert res.status_code == 200
+    assert res.json()["ticker"] == "AAPL"
+
+
+def test_admin_disabled_without_token(client, monkeypatch):
+    monkeypatch.setattr(server, "ADMIN_TOKEN", None)
+    assert client.delete("/history/cache/AAPL", headers={"X-Admin-Token": ""}).status_code == 403
+
+
+def test_clear_history_cache_is_rate_limited(client):
+    headers = {"X-Admin-Token": "secret"}
+    codes = [client.delete("/history/cache/AAPL", headers=headers).status_code for _ in range(11)]
+    assert codes[:10] == [200] * 10
+    assert codes[10] == 429
+
+
+def test_clear_ticker_cache_requires_admin(client):
+    server._display_name_cache.set("AAPL", "Apple")
+    assert client.delete("/ticker/cache").status_code == 403
+    assert server._display_name_cache.get("AAPL") == "Apple"
+
+    res = client.delete("/ticker/cache", headers={"X-Admin-Token": "secret"})
+    assert res.status_code == 200
+    assert res.json()["removed"] >= 1
+    assert server._display_name_cache.get("AAPL") is None
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api.server as server
+
+
+@pytest.fixture
+def client(monkeypatch):
+    state = {"running": 0, "peak": 0}
+
+    async def fake_run_analysis(ticker, lang="ko"):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        return {"ticker": ticker}
+
+    monkeypatch.setattr(server, "run_analysis", fake_run_analysis)
+    server.limiter.reset()
+    server._rate_limit_storage.reset()
+    c = TestClient(server.app)
+    c.state = state
+    return c
+
+
+def _batch(client, tickers):
+    return client.post("/api/batch", json={"requests": [{"path": f"/analyze/{t}"} for t in tickers]})
+
+
+def test_batch_caps_concurrency(client):
+    res = _batch(client, [f"T{i}" for i in range(10)])
+    assert res.status_code == 200
+    results = res.json()["results"]
+    assert [r["body"]["ticker"] for r in results] == [f"T{i}" for i in range(10)]
+    assert client.state["peak"] <= server.BATCH_MAX_CONCURRENCY
+
+
+def test_batch_charges_analyze_limit_per_sub_request(client):
+    # 20/minute 공유 제한: 배치 analyze 15건 + GET /analyze 5건으로 소진
+    assert _batch(client, [f"T{i}" for i in range(15)]).status_code == 200
+    for i in range(5):
+        assert client.get(f"/analyze/A{i}").status_code == 200
+    assert client.get("/analyze/AAPL").status_code == 429
+    assert _batch(client, ["AAPL"]).status_code == 429
+
+
+def test_batch_charges_history_limit_per_sub_request(client, monkeypatch):
+    async def fake_history(ticker, interval="1d", format="json"):
+        return {"ticker": ticker}
+
+    monkeypatch.setattr(server, "get_history", fake_history)
+    # history 하위 요청은 analyze 한도와 별개로 /history 한도(60/minute)를 차감
+    body = {"requests": [{"path": f"/history/T{i}"} for i in range(20)]}
+    for _ in range(3):
+        assert client.post("/api/batch", json=body).status_code == 200
+    assert _batch(client, [f"T{i}" for i in range(20)]).status_code == 200
+    assert client.post("/api/batch", json={"requests": [{"path": "/history/AAPL"}]}).status_code == 429
+    assert client.get("/history/AAPL").status_code == 429
+
+
+def test_batch_over_limit_charges_nothing(client):
+    assert _batch(client, [f"T{i}" for i in range(15)]).status_code == 200
+    assert _batch(client, [f"T{i}" for i in range(6)]).status_code == 429
+    # 거절된 배치는 차감하지 않으므로 남은 5건은 사용 가능
+    assert _batch(client, [f"T{i}" for i in range(5)]).status_code == 200
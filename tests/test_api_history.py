@@ -0,0 +1,97 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api.server as server
+from src.utils.serializer import dumps
+
+
+def _fake_ohlcv(ticker, period="1y", interval="1d", retries=3):
+    n = 300
+    rng = np.random.default_rng(0)
+    close = 100 + rng.standard_normal(n).cumsum()
+    return pd.DataFrame({
+        "Date": pd.date_range("2024-01-01", periods=n, freq="D").strftime("%Y-%m-%d"),
+        "Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+        "Volume": rng.integers(1000, 5000, n).astype(float),
+    })
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(server.collector, "get_ohlcv", _fake_ohlcv)
+    monkeypatch.setattr(server, "get_final_ticker", lambda ticker: ticker)
+    server._history_cache.clear()
+    server._history_bar_cache.clear()
+    server._rate_limit_storage.reset()
+    yield TestClient(server.app)
+    server._history_cache.clear()
+    server._history_bar_cache.clear()
+
+
+def test_history_records(client):
+    body = client.get("/history/AAPL").json()
+    data = body["data"]
+    expected = _fake_ohlcv("AAPL")
+
+    assert body["ticker"] == "AAPL" and body["interval"] == "1d"
+    assert len(data) == len(expected)
+    assert data[0]["time"] == "2024-01-01"
+    assert [row["close"] for row in data] == pytest.approx(expected["Close"].tolist(), rel=1e-6)
+    # MACD 계열 컬럼명 변환, 계산 구간 이전 값은 null
+    assert {"macd", "macd_signal", "macd_hist", "sma_200"} <= set(data[-1])
+    assert data[0]["sma_200"] is None and data[-1]["sma_200"] is not None
+
+
+def test_history_ndjson_matches_json(client, monkeypatch):
+    monkeypatch.setattr(server, "HISTORY_CHUNK_ROWS", 64)
+    body = client.get("/history/AAPL").json()
+
+    res = client.get("/history/AAPL", params={"format": "ndjson"})
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in res.text.splitlines()]
+    assert lines[0] == {"ticker": "AAPL", "interval": "1d"}
+    assert lines[1:] == body["data"]
+
+    # 두 번째 요청은 캐시된 바이트를 그대로 반환
+    assert client.get("/history/AAPL", params={"format": "ndjson"}).text == res.text
+
+
+def test_history_rejects_unknown_format(client):
+    assert client.get("/history/AAPL", params={"format": "xml"}).status_code == 400
+
+
+def test_history_reuses_bytes_while_last_bar_unchanged(client, monkeypatch):
+    first = client.get("/history/AAPL").content
+    server._history_cache.clear()  # TTL 캐시 만료 상황
+
+    calls = []
+    calculate_all = server.AdvancedIndicators.calculate_all
+    monkeypatch.setattr(server.AdvancedIndicators, "calculate_all",
+                        lambda df: calls.append(1) or calculate_all(df))
+    assert client.get("/history/AAPL").content == first
+    assert calls == []  # 마지막 봉이 같으면 지표 재계산 없음
+
+
+def test_history_json_streaming_matches_single_response(client, monkeypatch):
+    whole = client.get("/history/AAPL").json()
+    server._history_cache.clear()
+    server._history_bar_cache.clear()
+
+    monkeypatch.setattr(server, "HISTORY_STREAM_MIN_ROWS", 100)
+    monkeypatch.setattr(server, "HISTORY_CHUNK_ROWS", 64)
+    res = client.get("/history/AAPL")
+    assert res.json() == whole
+    assert client.get("/history/AAPL").content == res.content  # 스트리밍 완료 후 캐시 저장
+
+
+def test_history_records_keep_float32_and_nan():
+    out = pd.DataFrame({
+        "time": ["2024-01-02", "2024-01-03"],
+        "close": np.array([150.12, np.nan], dtype=np.float32),
+    })
+    records = json.loads(dumps(server._history_records(out)))
+    assert records == [{"time": "2024-01-02", "close": 150.12}, {"time": "2024-01-03", "close": None}]
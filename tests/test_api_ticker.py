@@ -0,0 +1,46 @@
+import pytest
+import yfinance
+
+import src.api.server as server
+
+
+class FakeSearch:
+    calls = []
+    results = {}
+
+    def __init__(self, query, max_results=5):
+        FakeSearch.calls.append(query)
+        self.quotes = FakeSearch.results.get(query, [])
+
+
+@pytest.fixture
+def fake_search(monkeypatch):
+    FakeSearch.calls = []
+    FakeSearch.results = {}
+    monkeypatch.setattr(yfinance, "Search", FakeSearch)
+    server._ticker_search_cache.clear()
+    yield FakeSearch
+    server._ticker_search_cache.clear()
+
+
+def test_get_final_ticker_without_search(fake_search):
+    assert server.get_final_ticker(" AAPL ") == "AAPL"
+    assert server.get_final_ticker("005930") == "005930.KS"
+    assert server.get_final_ticker("005930.ks") == "005930.KS"
+    assert server.get_final_ticker("035720.kq") == "035720.KQ"
+    assert server.get_final_ticker("카카오") == "035720.KS"
+    assert fake_search.calls == []
+
+
+def test_get_final_ticker_caches_search_results(fake_search):
+    fake_search.results["가상종목"] = [{"symbol": "VIRT"}, {"symbol": "123456.KQ"}]
+    assert server.get_final_ticker("가상종목") == "123456.KQ"  # 한글 입력은 한국 종목 우선
+    assert server.get_final_ticker("가상종목") == "123456.KQ"
+    assert fake_search.calls == ["가상종목"]
+
+
+def test_get_final_ticker_negative_cache(fake_search):
+    assert server.get_final_ticker("nothing here") == "nothing here"
+    assert server.get_final_ticker("nothing here") == "nothing here"
+    # 결과 없음도 짧게 캐시되어 같은 입력은 한 번만 검색
+    assert fake_search.calls == ["nothing here"]
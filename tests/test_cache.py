@@ -0,0 +1,51 @@
+import time
+
+from src.utils.cache import TTLCache
+
+
+def test_get_set_and_default():
+    cache = TTLCache(maxsize=4, ttl=60)
+    assert cache.get("a") is None
+    assert cache.get("a", 0) == 0
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert "a" in cache
+    assert len(cache) == 1
+
+
+def test_expiry_and_per_item_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("default", 1)
+    cache.set("short", 2, ttl=1)
+
+    now[0] += 5
+    assert cache.get("short") is None
+    assert cache.get("default") == 1
+    assert "short" not in cache
+
+    now[0] += 5
+    assert cache.get("default") is None
+
+
+def test_lru_eviction():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # a를 최근 사용으로 갱신 -> b가 제거 대상
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_pop_and_clear():
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.set("b", None)
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "missing") == "missing"
+    assert "b" in cache  # None 값도 저장된 항목으로 취급
+    cache.clear()
+    assert len(cache) == 0
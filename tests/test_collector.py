@@ -0,0 +1,136 @@
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data import collector as collector_module
+from src.data.collector import MarketDataCollector, classify_ticker, format_ohlcv_dates, to_datetime_index
+
+
+@pytest.fixture
+def collector(tmp_path):
+    collector_module._realtime_cache.clear()
+    yield MarketDataCollector(data_dir=str(tmp_path), use_db=False, use_file_cache=False)
+    collector_module._realtime_cache.clear()
+
+
+@pytest.mark.parametrize("ticker, expected", [
+    ("005930", (True, "005930")),
+    ("005930.KS", (True, "005930")),
+    ("035720.KQ", (True, "035720")),
+    ("005930.KX", (False, "005930.KX")),
+    ("005930\n", (False, "005930\n")),
+    ("12345", (False, "12345")),
+    ("AAPL", (False, "AAPL")),
+])
+def test_classify_ticker(ticker, expected):
+    assert classify_ticker(ticker) == expected
+
+
+def test_format_ohlcv_dates():
+    dates = pd.Series(pd.to_datetime(["2024-01-02 09:30", None]).tz_localize("Asia/Seoul"))
+    daily = format_ohlcv_dates(dates, "1d")
+    assert daily.iloc[0] == "2024-01-02" and pd.isna(daily.iloc[1])
+    assert format_ohlcv_dates(dates, "60m").iloc[0] == "2024-01-02 09:30"
+
+
+def test_to_datetime_index():
+    idx = to_datetime_index(pd.Series(["2024-01-02", "2024-01-03 15:30"], name="Date"))
+    assert list(idx) == [pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-03 15:30")]
+    assert idx.name == "Date"
+    tz_idx = to_datetime_index(pd.Series(["2024-01-02T00:00:00+09:00"]))
+    assert tz_idx[0] == pd.Timestamp("2024-01-02", tz="UTC+09:00")
+    dt = pd.Series(pd.to_datetime(["2024-01-02"]))
+    assert to_datetime_index(dt)[0] == pd.Timestamp("2024-01-02")
+
+
+def test_download_batch_splits_per_ticker(collector):
+    idx = pd.to_datetime(["2024-01-02", "2024-01-03"])
+    aapl = pd.DataFrame({"Open": [1.0, 2.0], "High": [1.0, 2.0], "Low": [1.0, 2.0],
+                         "Close": [1.0, 2.0], "Volume": [10, 20]}, index=idx)
+    msft = aapl.assign(Dividends=[np.nan, 0.5])
+    msft.iloc[0] = np.nan  # 해당 종목 거래일이 아닌 행
+    raw = pd.concat({"AAPL": aapl, "MSFT": msft}, axis=1)
+
+    with patch("src.data.collector.yf.download", return_value=raw) as download:
+        out = collector._download_batch(["AAPL", "MSFT", "GONE"], "1y", "1d")
+
+    assert download.call_count == 1
+    assert download.call_args.kwargs["actions"] is True
+    assert list(out) == ["AAPL", "MSFT"]
+    assert out["AAPL"]["Date"].tolist() == ["2024-01-02", "2024-01-03"]
+    assert out["MSFT"]["Date"].tolist() == ["2024-01-03"]
+    # Ticker.history(get_ohlcv)와 같은 컬럼 구성, 없는 배당/분할은 0
+    assert list(out["AAPL"].columns) == ["Date", "Open", "High", "Low", "Close", "Volume",
+                                         "Dividends", "Stock Splits"]
+    assert out["AAPL"]["Stock Splits"].tolist() == [0.0, 0.0]
+    assert out["MSFT"]["Dividends"].tolist() == [0.5]
+
+
+def test_get_smart_data_batch_routes_sources(collector, monkeypatch):
+    frame = pd.DataFrame({"Date": ["2024-01-02"], "Close": [1.0]})
+    downloads, kr_batches, singles = [], [], []
+
+    def fake_download(tickers, period, interval):
+        downloads.append((list(tickers), interval))
+        return {t: frame for t in tickers if t != "GONE"}
+
+    def fake_kr_batch(tickers, period="1y", interval="1d"):
+        kr_batches.append((list(tickers), interval))
+        return {t: frame for t in tickers}
+
+    def fake_get_ohlcv(ticker, period="1y", interval="1d", retries=3):
+        singles.append((ticker, interval))
+        return None
+
+    monkeypatch.setattr(collector, "_download_batch", fake_download)
+    monkeypatch.setattr(collector, "get_ohlcv_batch_kr", fake_kr_batch)
+    monkeypatch.setattr(collector, "get_ohlcv", fake_get_ohlcv)
+
+    result = collector.get_smart_data_batch(["AAPL", "005930.KS", "GONE"])
+
+    # 한국 일봉은 FDR 병렬 경로, 한국 분봉과 해외 종목은 yf.download 묶음 경로
+    assert kr_batches == [(["005930.KS"], "1d"), ([], "60m")]
+    assert downloads == [(["AAPL", "GONE"], "1d"), (["AAPL", "005930.KS", "GONE"], "60m")]
+    # 묶음 응답에 없는 종목만 단건 경로로 재수집
+    assert singles == [("GONE", "1d"), ("GONE", "60m")]
+    assert result["AAPL"]["daily"] is frame and result["005930.KS"]["hourly"] is frame
+    assert result["GONE"] == {"daily": None, "hourly": None}
+
+
+def test_get_ohlcv_batch_kr_runs_in_parallel(collector, monkeypatch):
+    barrier = threading.Barrier(3, timeout=5)
+    calls = []
+
+    def fake_get_ohlcv(ticker, period="1y", interval="1d", retries=3):
+        calls.append((ticker, period, interval))
+        barrier.wait()  # 3건이 동시에 실행되지 않으면 타임아웃
+        return pd.DataFrame({"Date": ["2024-01-02"], "Close": [float(len(calls))]})
+
+    monkeypatch.setattr(collector, "get_ohlcv", fake_get_ohlcv)
+    result = collector.get_ohlcv_batch_kr(["005930", "000660", "005930", "035720"], period="60d")
+
+    assert list(result) == ["005930", "000660", "035720"]
+    assert sorted(calls) == [("000660", "60d", "1d"), ("005930", "60d", "1d"), ("035720", "60d", "1d")]
+    assert collector.get_ohlcv_batch_kr([]) == {}
+
+
+def test_get_realtime_batch_uses_cache(collector, monkeypatch):
+    calls = []
+
+    def fake_fetch(ticker):
+        calls.append(ticker)
+        return {"current_price": None if ticker == "MISS" else 10.0, "volume": 1}
+
+    monkeypatch.setattr(collector, "_fetch_realtime_data", fake_fetch)
+    first = collector.get_realtime_batch(["AAPL", "MSFT", "AAPL", "MISS"])
+    assert list(first) == ["AAPL", "MSFT", "MISS"]
+    assert first["AAPL"]["current_price"] == 10.0
+
+    first["AAPL"]["current_price"] = 0.0  # 반환값 수정이 캐시에 반영되지 않음
+    second = collector.get_realtime_batch(["AAPL", "MISS"])
+    assert second["AAPL"]["current_price"] == 10.0
+    # 가격이 없는 응답은 캐시하지 않음
+    assert sorted(calls) == ["AAPL", "MISS", "MISS", "MSFT"]
@@ -0,0 +1,35 @@
+import os
+import threading
+
+import pytest
+
+from src.utils.executors import LazyThreadPool
+
+
+def test_pool_is_created_on_first_submit():
+    pool = LazyThreadPool(max_workers=1, thread_name_prefix="lazy-test")
+    assert pool._executor is None
+    assert pool.submit(lambda x: x + 1, 1).result() == 2
+    assert pool.submit(lambda: threading.current_thread().name).result().startswith("lazy-test")
+    pool.shutdown()
+    assert pool._executor is None
+    assert pool.submit(lambda: "again").result() == "again"  # 종료 후 재생성
+    pool.shutdown()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork 미지원 플랫폼")
+def test_pool_is_rebuilt_in_forked_child():
+    pool = LazyThreadPool(max_workers=1)
+    assert pool.submit(lambda: 1).result() == 1  # 부모에서 풀/스레드 생성
+
+    pid = os.fork()
+    if pid == 0:
+        # 자식: 복제된 풀(스레드 없음)을 쓰면 영원히 대기하므로 새 풀로 실행되어야 함
+        code = 1
+        try:
+            code = 0 if pool._executor is None and pool.submit(lambda: 2).result(timeout=5) == 2 else 1
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    pool.shutdown()
@@ -0,0 +1,72 @@
+import os
+import time
+import warnings
+
+import pandas as pd
+
+from src.data.fred_provider import FRED_DAILY_CACHE_TTL, FREDDataProvider
+
+
+def _provider(tmp_path, monkeypatch, values):
+    provider = FREDDataProvider(api_key="test", cache_dir=str(tmp_path))
+    calls = []
+
+    def fake_fetch(series_id, start_date, end_date):
+        calls.append((series_id, start_date, end_date))
+        return pd.DataFrame({"date": pd.to_datetime(["2024-01-01", "2024-01-02"]), "value": values})
+
+    monkeypatch.setattr(provider, "_fetch_series", fake_fetch)
+    return provider, calls
+
+
+def test_get_series_uses_disk_cache(tmp_path, monkeypatch):
+    provider, calls = _provider(tmp_path, monkeypatch, [1.0, 2.0])
+    first = provider.get_series("DFF", start_date="2024-01-01")
+    assert len(calls) == 1
+
+    # 새 인스턴스(메모리 캐시 없음)도 디스크 캐시에서 읽음
+    other, other_calls = _provider(tmp_path, monkeypatch, [9.0, 9.0])
+    pd.testing.assert_frame_equal(other.get_series("DFF", start_date="2024-01-01"), first)
+    assert other_calls == []
+
+
+def test_write_prunes_expired_files_of_same_series(tmp_path, monkeypatch):
+    provider, _ = _provider(tmp_path, monkeypatch, [1.0, 2.0])
+    provider.get_series("DFF", start_date="2024-01-01")
+    provider.get_series("DGS10", start_date="2024-01-01")
+    stale = tmp_path / "DFF_2024-01-01_latest.parquet"
+    expired = time.time() - FRED_DAILY_CACHE_TTL - 1
+    os.utime(stale, (expired, expired))
+
+    provider.get_series("DFF", start_date="2024-01-02")
+
+    names = sorted(p.name for p in tmp_path.glob("*.parquet"))
+    assert names == ["DFF_2024-01-02_latest.parquet", "DGS10_2024-01-01_latest.parquet"]
+
+
+def test_parse_observations_skips_missing_values():
+    content = b'{"observations": [{"date": "2024-01-01", "value": "1.5"}, {"date": "2024-01-02", "value": "."}]}'
+    df = FREDDataProvider._parse_observations(content)
+    assert df["value"].tolist() == [1.5]
+    assert df["value"].dtype == "float64"
+    assert df["date"].iloc[0] == pd.Timestamp("2024-01-01")
+
+
+def test_macro_snapshot_cpi_yoy_with_missing_month(monkeypatch):
+    provider = FREDDataProvider(api_key="test", cache_dir=None)
+    cpi = pd.DataFrame({
+        "date": pd.date_range("2023-01-01", periods=14, freq="MS"),
+        "value": [100.0] * 13 + [103.0],
+    })
+    cpi.loc[5, "value"] = float("nan")  # 결측 월은 앞 값으로 채우지 않음
+    flat = pd.DataFrame({"date": pd.to_datetime(["2024-01-01"]), "value": [4.0]})
+
+    def fake_get_series(series_id, start_date=None, end_date=None):
+        return cpi if series_id == FREDDataProvider.SERIES_IDS["cpi"] else flat
+
+    monkeypatch.setattr(provider, "get_series", fake_get_series)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", FutureWarning)
+        snapshot = provider.get_macro_snapshot()
+    assert snapshot["cpi_yoy"] == 3.0
+    assert snapshot["fed_funds_rate"] == 4.0
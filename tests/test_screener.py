@@ -0,0 +1,151 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+from src.agents import screener as screener_module
+from src.agents.analyst import StockAnalyst
+from src.agents.screener import StockScreener
+
+
+@pytest.fixture(autouse=True)
+def clear_skip_cache():
+    screener_module._skip_cache.clear()
+    yield
+    screener_module._skip_cache.clear()
+
+
+def test_get_market_tickers_from_instance():
+    screener = StockScreener()
+    tickers = screener.get_market_tickers("US", limit=5)
+    assert tickers == ("AAPL", "MSFT", "GOOGL", "AMZN", "NVDA")
+    assert StockScreener().get_market_tickers("KR", limit=2) == ("005930.KS", "000660.KS")
+    assert screener.get_market_tickers("JP") == ()
+
+
+def test_get_market_tickers_is_cached():
+    StockScreener.get_market_tickers.cache_clear()
+    first = StockScreener().get_market_tickers("US", limit=10)
+    second = StockScreener().get_market_tickers("US", limit=10)
+
+    info = StockScreener.get_market_tickers.cache_info()
+    assert first is second
+    assert info.hits == 1 and info.misses == 1
+
+
+def test_get_top_movers():
+    idx = pd.date_range("2024-01-01", periods=3, freq="B")
+    closes = {"AAPL": [90.0, 100.0, 102.5], "MSFT": [190.0, 200.0, 198.0], "NVDA": [280.0, 300.0, 312.0]}
+    panel = pd.concat({t: pd.DataFrame({"Close": c}, index=idx) for t, c in closes.items()}, axis=1)
+    screener = StockScreener()
+    with patch("src.agents.screener.yf.download", return_value=panel) as download:
+        movers = screener.get_top_movers(market="US")
+
+    assert download.call_count == 1
+    assert download.call_args[0][0] == list(screener.get_market_tickers("US", limit=30))
+    assert [m["ticker"] for m in movers["gainers"]] == ["NVDA", "AAPL"]
+    assert [m["ticker"] for m in movers["losers"]] == ["MSFT"]
+    assert movers["gainers"][0] == {"ticker": "NVDA", "price": 312.0, "change": 4.0}
+
+
+def _daily_frame(n=260, drift=0.2):
+    idx = pd.date_range("2024-01-01", periods=n, freq="B")
+    rng = np.random.default_rng(0)
+    close = 100 + np.arange(n) * drift + rng.standard_normal(n)
+    return pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+                         "Volume": rng.integers(1_000_000, 2_000_000, n).astype(float)}, index=idx)
+
+
+def _batched_panel(symbols, frames):
+    return pd.concat({s: frames[s] for s in symbols}, axis=1)
+
+
+def test_prefetch_daily_splits_one_batched_download():
+    frames = {"AAPL": _daily_frame(), "^GSPC": _daily_frame(drift=0.1)}
+    with patch("src.agents.screener.yf.download", return_value=_batched_panel(list(frames), frames)) as download:
+        daily, index_df = StockScreener()._prefetch_daily(["AAPL", "MSFT"], "^GSPC")
+
+    assert download.call_count == 1
+    assert download.call_args[0][0] == ["AAPL", "MSFT", "^GSPC"]
+    assert list(daily) == ["AAPL", "^GSPC"]  # 응답에 없는 종목(MSFT)은 제외
+    pd.testing.assert_frame_equal(index_df, frames["^GSPC"], check_names=False)
+
+
+class FixedScoreAnalyst(StockAnalyst):
+    def analyze_ticker(self, *args, **kwargs):
+        analysis = super().analyze_ticker(*args, **kwargs)
+        analysis["final_score"] = 42.0
+        return analysis
+
+
+class BrokenPool:
+    def submit(self, *args, **kwargs):
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+
+def _screen(analyst=None, **kwargs):
+    frame = _daily_frame()
+    prefetched = ({"AAA": frame, "BBB": frame.iloc[:10]}, None)
+    screener = StockScreener(analyst)
+    with patch.object(StockScreener, "_prefetch_daily", return_value=prefetched) as prefetch, \
+            patch("src.agents.screener.yf.download", side_effect=AssertionError("refetch")):
+        results = screener.screen_stocks(["AAA", "BBB", "CCC"], top_n=5, **kwargs)
+    assert prefetch.call_count == 1
+    return results
+
+
+def test_screen_stocks_uses_prefetched_frames():
+    results = _screen(use_processes=False)
+    # 데이터가 부족하거나 없는 종목은 결과에서 제외
+    assert [r["ticker"] for r in results] == ["AAA"]
+    assert 0 <= results[0]["score"] <= 100
+
+
+def test_screen_stocks_process_pool_is_shared():
+    try:
+        first = _screen(use_processes=True)
+        pool = screener_module._process_pools[StockAnalyst]
+        second = _screen(use_processes=True)
+        assert screener_module._process_pools[StockAnalyst] is pool
+        assert [r["ticker"] for r in first] == [r["ticker"] for r in second] == ["AAA"]
+        assert first[0]["score"] == _screen(use_processes=False)[0]["score"]
+    finally:
+        screener_module._reset_process_pool()
+
+
+def test_screen_stocks_workers_use_injected_analyst_class():
+    try:
+        results = _screen(analyst=FixedScoreAnalyst(), use_processes=True)
+        assert set(screener_module._process_pools) == {FixedScoreAnalyst}
+        assert [(r["ticker"], r["score"]) for r in results] == [("AAA", 42.0)]
+    finally:
+        screener_module._reset_process_pool()
+
+
+def test_screen_stocks_falls_back_to_threads_on_broken_pool():
+    with patch.object(screener_module, "_get_process_pool", return_value=BrokenPool()), \
+            patch.object(screener_module, "_reset_process_pool") as reset:
+        results = _screen(use_processes=True)
+
+    reset.assert_called_once_with(StockAnalyst)
+    assert [r["ticker"] for r in results] == ["AAA"]
+    assert results[0]["score"] == _screen(use_processes=False)[0]["score"]
+
+
+def test_screen_stocks_skips_short_history_on_next_call():
+    frame = _daily_frame()
+    prefetched = ({"AAA": frame, "BBB": frame.iloc[:10]}, None)
+    screener = StockScreener()
+    with patch.object(StockScreener, "_prefetch_daily", return_value=prefetched) as prefetch:
+        screener.screen_stocks(["AAA", "BBB", "CCC"], use_processes=False)
+        screener.screen_stocks(["AAA", "BBB", "CCC"], use_processes=False)
+
+    assert prefetch.call_args_list[0][0][0] == ["AAA", "BBB", "CCC"]
+    # 응답이 짧았던 BBB만 제외, 응답에 없던 CCC는 재시도
+    assert prefetch.call_args_list[1][0][0] == ["AAA", "CCC"]
@@ -0,0 +1,46 @@
+import json
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils import serializer
+from src.utils.serializer import dumps, loads, safe_serialize
+
+
+def test_dumps_handles_numpy_pandas_and_nan():
+    data = {
+        "price": np.float64(1.5),
+        "volume": np.int64(10),
+        "nan": float("nan"),
+        "series": pd.Series([1.0, None]),
+        "when": pd.Timestamp("2024-01-02"),
+        "missing": pd.NaT,
+        "tags": {"a"},
+    }
+    out = loads(dumps(data))
+    assert out["price"] == 1.5
+    assert out["volume"] == 10
+    assert out["nan"] is None
+    assert out["series"] == {"0": 1.0, "1": None}
+    assert out["when"] == "2024-01-02 00:00:00"
+    assert out["missing"] is None
+    assert out["tags"] == ["a"]
+
+
+def test_dumps_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        dumps({"obj": object()})
+
+
+def test_stdlib_fallback_matches(monkeypatch):
+    monkeypatch.setattr(serializer, "orjson", None)
+    out = json.loads(dumps({"d": date(2024, 1, 2), "t": datetime(2024, 1, 2, 3, 4), "x": np.float32(0.5)}))
+    assert out == {"d": "2024-01-02", "t": "2024-01-02T03:04:00", "x": 0.5}
+    with pytest.raises(TypeError):
+        dumps({"obj": object()})
+
+
+def test_safe_serialize_replaces_non_finite():
+    assert safe_serialize({"a": [np.inf, np.int32(3), "x"]}) == {"a": [None, 3, "x"]}
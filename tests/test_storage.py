@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from src.data.storage import DataStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    saved = DataStorage._instance, DataStorage._initialized
+    DataStorage.reset_instance()
+    instance = DataStorage(str(tmp_path / "test.db"))
+    yield instance
+    instance.flush()
+    DataStorage._instance, DataStorage._initialized = saved
+
+
+def _ohlcv(dates, close=100.0):
+    n = len(dates)
+    return pd.DataFrame({
+        "Date": dates,
+        "Open": [close] * n, "High": [close + 1] * n, "Low": [close - 1] * n,
+        "Close": [close] * n, "Volume": [1000] * n,
+    })
+
+
+def test_save_price_history_inserts_only_new_dates(storage):
+    assert storage.save_price_history("AAPL", _ohlcv(["2024-01-02", "2024-01-03 15:30", "bad"])) == 2
+    # 기존 날짜는 건너뛰고 새 날짜만 추가 (값은 덮어쓰지 않음)
+    assert storage.save_price_history("AAPL", _ohlcv(["2024-01-03", "2024-01-04"], close=200.0)) == 1
+    assert storage.save_price_history("AAPL", _ohlcv(["bad"])) == 0
+
+    rows = storage.get_price_history("AAPL")
+    assert [str(r.date) for r in rows] == ["2024-01-04", "2024-01-03", "2024-01-02"]
+    assert [r.close for r in rows] == [200.0, 100.0, 100.0]
+
+
+def test_save_price_history_async_and_flush(storage):
+    df = _ohlcv(["2024-01-02", "2024-01-03"])
+    future = storage.save_price_history_async("MSFT", df)
+    df.drop(index=df.index, inplace=True)  # 예약 후 원본 수정은 저장 내용에 영향 없음
+    storage.save_price_history_async("MSFT", _ohlcv(["2024-01-04"]))
+
+    storage.flush()
+    assert future.done() and future.result() == 2
+    assert len(storage.get_price_history("MSFT")) == 3
+
+
+def test_save_price_history_async_logs_errors(storage):
+    future = storage.save_price_history_async("BAD", pd.DataFrame({"Date": ["2024-01-02"]}))
+    storage.flush()
+    assert future.result() == 0